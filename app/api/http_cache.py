@@ -0,0 +1,103 @@
+"""HTTP 조건부 요청(ETag/Last-Modified)과 Range 요청 처리 헬퍼.
+
+/download 엔드포인트에서 사용한다. 요청 헤더 해석만 담당하며 Storage 에는 의존하지 않는다.
+"""
+
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional, Tuple
+
+
+class RangeNotSatisfiable(Exception):
+    """Range 헤더가 파일 크기를 벗어난 경우 (HTTP 416)."""
+
+
+def quote_etag(value: str) -> str:
+    return f'"{value}"'
+
+
+def http_date(epoch: int) -> str:
+    return formatdate(epoch, usegmt=True)
+
+
+def _etag_list(header: str) -> list[str]:
+    # W/ 접두어는 약한 비교(weak comparison)로 무시한다.
+    return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+
+
+def is_not_modified(
+    *,
+    etag: Optional[str],
+    modified_at: int,
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> bool:
+    """304 Not Modified 응답 대상인지 판단한다.
+
+    RFC 9110에 따라 If-None-Match 가 있으면 If-Modified-Since 는 무시한다.
+    """
+
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        tags = _etag_list(if_none_match)
+        return "*" in tags or quote_etag(etag) in tags
+
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return modified_at <= int(since.timestamp())
+
+    return False
+
+
+def if_range_matches(if_range: Optional[str], *, etag: Optional[str], modified_at: int) -> bool:
+    """If-Range 조건이 현재 표현과 일치하는지 확인한다 (없으면 True)."""
+
+    if if_range is None:
+        return True
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        # If-Range 는 강한 비교만 허용한다.
+        return etag is not None and if_range == quote_etag(etag)
+    try:
+        return int(parsedate_to_datetime(if_range).timestamp()) == modified_at
+    except (TypeError, ValueError):
+        return False
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """단일 `bytes=` Range 헤더를 (start, end) 로 변환한다 (end 포함).
+
+    - 헤더가 없거나 해석할 수 없거나 다중 구간이면 None (전체 응답).
+    - 만족할 수 없는 구간이면 RangeNotSatisfiable.
+    """
+
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start_s, sep, end_s = spec.strip().partition("-")
+    if not sep:
+        return None
+
+    try:
+        if start_s == "":
+            # suffix range: 마지막 N 바이트
+            length = int(end_s)
+            if length <= 0:
+                raise RangeNotSatisfiable(header)
+            return max(size - length, 0), size - 1
+        start = int(start_s)
+        end = int(end_s) if end_s else size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    if start > end:
+        return None
+    return start, min(end, size - 1)
@@ -2,6 +2,71 @@ import time
 from typing import Dict, List, Optional
 
 import psycopg2
+from psycopg2.extras import execute_values
+
+from app.infra.telemetry import traced_query
+
+
+_JOB_COLUMNS = """
+    id,
+    status,
+    created_at,
+    updated_at,
+    file_name,
+    page_count,
+    error_code,
+    owner_id,
+    expires_at,
+    prompt_tokens,
+    completion_tokens,
+    llm_calls,
+    cost_usd,
+    source_language,
+    target_language,
+    prompt_profile
+"""
+
+
+def _row_to_job(row) -> Dict:
+    """_JOB_COLUMNS 순서로 조회한 한 행을 API/Dashboard 용 dict 로 변환한다."""
+
+    (
+        job_id,
+        status,
+        created_at,
+        updated_at,
+        file_name,
+        page_count,
+        error_code,
+        owner_id,
+        expires_at,
+        prompt_tokens,
+        completion_tokens,
+        llm_calls,
+        cost_usd,
+        source_language,
+        target_language,
+        prompt_profile,
+    ) = row
+
+    return {
+        "jobId": job_id,
+        "lastStatus": status,
+        "createdAt": created_at * 1000 if created_at is not None else None,
+        "lastUpdatedAt": updated_at * 1000 if updated_at is not None else None,
+        "fileName": file_name,
+        "pageCount": page_count,
+        "errorCode": error_code,
+        "ownerId": owner_id,
+        "expiresAt": expires_at,
+        "promptTokens": prompt_tokens,
+        "completionTokens": completion_tokens,
+        "llmCalls": llm_calls,
+        "costUsd": cost_usd,
+        "sourceLanguage": source_language,
+        "targetLanguage": target_language,
+        "promptProfile": prompt_profile,
+    }
 
 
 class JobRepository:
@@ -16,17 +81,24 @@ class JobRepository:
     - error_code: 오류 코드 (선택)
     - owner_id: 소유자/클라이언트 식별자 (선택)
     - expires_at: 만료 시각(epoch 초, 선택)
+    - prompt_tokens / completion_tokens / llm_calls / cost_usd: LLM 사용량 (Job 종료 시 기록)
+    - source_language / target_language / prompt_profile: 번역 설정 (선택, 없으면 en → ko, academic)
+
+    생성자는 DB에 접속하지 않는다. 스키마 생성/변경(DDL)은 배포 시
+    `python -m app.infra.migrate` 로 한 번만 수행한다.
     """
 
     def __init__(self, db_url: str):
         self._db_url = db_url
-        self._ensure_schema()
 
     def _get_conn(self):
         return psycopg2.connect(self._db_url)
 
-    def _ensure_schema(self) -> None:
-        """jobs 테이블이 없으면 생성하고, 필요한 컬럼을 보강합니다."""
+    def migrate(self) -> None:
+        """jobs 테이블이 없으면 생성하고, 필요한 컬럼을 보강합니다.
+
+        멱등(idempotent)하므로 여러 번 실행해도 안전하다.
+        """
 
         with self._get_conn() as conn:
             with conn.cursor() as cur:
@@ -53,9 +125,27 @@ class JobRepository:
                 cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS error_code TEXT")
                 cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS owner_id TEXT")
                 cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS expires_at BIGINT")
+                cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS prompt_tokens BIGINT")
+                cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS completion_tokens BIGINT")
+                cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS llm_calls INTEGER")
+                cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS cost_usd DOUBLE PRECISION")
+                cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS source_language TEXT")
+                cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS target_language TEXT")
+                cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS prompt_profile TEXT")
+
+                # 소유자/일자별 사용량 집계용
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS jobs_created_at_owner_idx ON jobs (created_at, owner_id)"
+                )
+                # 업로드 승인 제어(backlog_stats)용: 대기/실행 중 Job 만 담는 부분 인덱스
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS jobs_active_created_at_idx ON jobs (created_at) "
+                    "WHERE status IN ('PENDING', 'RUNNING')"
+                )
 
                 conn.commit()
 
+    @traced_query("create_job")
     def create_job(
         self,
         job_id: str,
@@ -64,11 +154,59 @@ class JobRepository:
         owner_id: Optional[str] = None,
         page_count: Optional[int] = None,
         expires_at: Optional[int] = None,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+        prompt_profile: Optional[str] = None,
     ) -> None:
+        self._insert_jobs(
+            [
+                {
+                    "job_id": job_id,
+                    "file_name": file_name,
+                    "owner_id": owner_id,
+                    "page_count": page_count,
+                    "expires_at": expires_at,
+                    "source_language": source_language,
+                    "target_language": target_language,
+                    "prompt_profile": prompt_profile,
+                }
+            ]
+        )
+
+    @traced_query("create_jobs")
+    def create_jobs(self, jobs: List[Dict]) -> None:
+        """여러 Job을 하나의 multi-row INSERT 로 생성한다.
+
+        각 항목은 job_id 와 선택적으로 file_name/owner_id/page_count/expires_at,
+        source_language/target_language/prompt_profile 키를 가진다.
+        """
+
+        if jobs:
+            self._insert_jobs(jobs)
+
+    def _insert_jobs(self, jobs: List[Dict]) -> None:
         now = int(time.time())
+        rows = [
+            (
+                job["job_id"],
+                "PENDING",
+                now,
+                now,
+                job.get("file_name"),
+                job.get("page_count"),
+                None,
+                job.get("owner_id"),
+                job.get("expires_at"),
+                job.get("source_language"),
+                job.get("target_language"),
+                job.get("prompt_profile"),
+            )
+            for job in jobs
+        ]
         with self._get_conn() as conn:
             with conn.cursor() as cur:
-                cur.execute(
+                execute_values(
+                    cur,
                     """
                     INSERT INTO jobs (
                         id,
@@ -79,31 +217,29 @@ class JobRepository:
                         page_count,
                         error_code,
                         owner_id,
-                        expires_at
+                        expires_at,
+                        source_language,
+                        target_language,
+                        prompt_profile
                     )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    VALUES %s
                     ON CONFLICT (id) DO UPDATE
                     SET status = EXCLUDED.status,
                         updated_at = EXCLUDED.updated_at,
                         file_name = COALESCE(EXCLUDED.file_name, jobs.file_name),
                         page_count = COALESCE(EXCLUDED.page_count, jobs.page_count),
                         owner_id = COALESCE(EXCLUDED.owner_id, jobs.owner_id),
-                        expires_at = COALESCE(EXCLUDED.expires_at, jobs.expires_at)
+                        expires_at = COALESCE(EXCLUDED.expires_at, jobs.expires_at),
+                        source_language = COALESCE(EXCLUDED.source_language, jobs.source_language),
+                        target_language = COALESCE(EXCLUDED.target_language, jobs.target_language),
+                        prompt_profile = COALESCE(EXCLUDED.prompt_profile, jobs.prompt_profile)
                     """,
-                    (
-                        job_id,
-                        "PENDING",
-                        now,
-                        now,
-                        file_name,
-                        page_count,
-                        None,
-                        owner_id,
-                        expires_at,
-                    ),
+                    rows,
+                    page_size=max(len(rows), 1),
                 )
                 conn.commit()
 
+    @traced_query("set_status")
     def set_status(self, job_id: str, status: str) -> None:
         now = int(time.time())
         with self._get_conn() as conn:
@@ -119,6 +255,7 @@ class JobRepository:
                 )
                 conn.commit()
 
+    @traced_query("set_page_count")
     def set_page_count(self, job_id: str, page_count: int) -> None:
         """Job의 page_count를 업데이트한다."""
 
@@ -136,6 +273,7 @@ class JobRepository:
                 )
                 conn.commit()
 
+    @traced_query("get_status")
     def get_status(self, job_id: str) -> Optional[str]:
         with self._get_conn() as conn:
             with conn.cursor() as cur:
@@ -145,6 +283,7 @@ class JobRepository:
             return None
         return row[0]
 
+    @traced_query("get_job")
     def get_job(self, job_id: str) -> Optional[Dict]:
         """단일 Job의 전체 정보를 조회한다.
 
@@ -154,17 +293,8 @@ class JobRepository:
         with self._get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT
-                        id,
-                        status,
-                        created_at,
-                        updated_at,
-                        file_name,
-                        page_count,
-                        error_code,
-                        owner_id,
-                        expires_at
+                    f"""
+                    SELECT {_JOB_COLUMNS}
                     FROM jobs
                     WHERE id = %s
                     """,
@@ -175,30 +305,31 @@ class JobRepository:
         if not row:
             return None
 
-        (
-            job_id,
-            status,
-            created_at,
-            updated_at,
-            file_name,
-            page_count,
-            error_code,
-            owner_id,
-            expires_at,
-        ) = row
-
-        return {
-            "jobId": job_id,
-            "lastStatus": status,
-            "createdAt": created_at * 1000 if created_at is not None else None,
-            "lastUpdatedAt": updated_at * 1000 if updated_at is not None else None,
-            "fileName": file_name,
-            "pageCount": page_count,
-            "errorCode": error_code,
-            "ownerId": owner_id,
-            "expiresAt": expires_at,
-        }
+        return _row_to_job(row)
+
+    @traced_query("get_jobs")
+    def get_jobs(self, job_ids: List[str]) -> Dict[str, Dict]:
+        """여러 Job을 한 번의 쿼리로 조회해 job_id → Job 정보를 반환한다 (없는 id 는 제외)."""
+
+        if not job_ids:
+            return {}
+
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT {_JOB_COLUMNS}
+                    FROM jobs
+                    WHERE id = ANY(%s)
+                    """,
+                    (list(job_ids),),
+                )
+                rows = cur.fetchall()
+
+        jobs = [_row_to_job(row) for row in rows]
+        return {job["jobId"]: job for job in jobs}
 
+    @traced_query("list_jobs")
     def list_jobs(
         self,
         *,
@@ -211,6 +342,7 @@ class JobRepository:
 
         반환 형식은 프런트엔드 Dashboard가 기대하는 형태에 맞습니다.
         - jobId, fileName, lastStatus, createdAt(ms), lastUpdatedAt(ms), pageCount, errorCode, ownerId, expiresAt
+        - promptTokens, completionTokens, llmCalls, costUsd (LLM 사용량, 미기록 시 None)
         """
 
         params: List = []
@@ -247,16 +379,7 @@ class JobRepository:
             with conn.cursor() as cur:
                 cur.execute(
                     f"""
-                    SELECT
-                        id,
-                        status,
-                        created_at,
-                        updated_at,
-                        file_name,
-                        page_count,
-                        error_code,
-                        owner_id,
-                        expires_at
+                    SELECT {_JOB_COLUMNS}
                     FROM jobs
                     {where_clause}
                     ORDER BY created_at DESC
@@ -266,35 +389,9 @@ class JobRepository:
                 )
                 rows = cur.fetchall()
 
-        items: List[Dict] = []
-        for (
-            job_id,
-            status,
-            created_at,
-            updated_at,
-            file_name,
-            page_count,
-            error_code,
-            owner_id,
-            expires_at,
-        ) in rows:
-            created_ms = created_at * 1000 if created_at is not None else None
-            updated_ms = updated_at * 1000 if updated_at is not None else None
-            items.append(
-                {
-                    "jobId": job_id,
-                    "lastStatus": status,
-                    "createdAt": created_ms,
-                    "lastUpdatedAt": updated_ms,
-                    "fileName": file_name,
-                    "pageCount": page_count,
-                    "errorCode": error_code,
-                    "ownerId": owner_id,
-                    "expiresAt": expires_at,
-                }
-            )
-        return items
+        return [_row_to_job(row) for row in rows]
 
+    @traced_query("get_expired_jobs")
     def get_expired_jobs(self, *, now: Optional[int] = None, limit: int = 100) -> List[Dict]:
         """만료 시각(expires_at)이 현재 시각 이전인 Job 목록을 조회한다.
 
@@ -306,17 +403,8 @@ class JobRepository:
         with self._get_conn() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT
-                        id,
-                        status,
-                        created_at,
-                        updated_at,
-                        file_name,
-                        page_count,
-                        error_code,
-                        owner_id,
-                        expires_at
+                    f"""
+                    SELECT {_JOB_COLUMNS}
                     FROM jobs
                     WHERE expires_at IS NOT NULL
                       AND expires_at <= %s
@@ -327,35 +415,113 @@ class JobRepository:
                 )
                 rows = cur.fetchall()
 
-        items: List[Dict] = []
-        for (
-            job_id,
-            status,
-            created_at,
-            updated_at,
-            file_name,
-            page_count,
-            error_code,
-            owner_id,
-            expires_at,
-        ) in rows:
-            created_ms = created_at * 1000 if created_at is not None else None
-            updated_ms = updated_at * 1000 if updated_at is not None else None
-            items.append(
-                {
-                    "jobId": job_id,
-                    "lastStatus": status,
-                    "createdAt": created_ms,
-                    "lastUpdatedAt": updated_ms,
-                    "fileName": file_name,
-                    "pageCount": page_count,
-                    "errorCode": error_code,
-                    "ownerId": owner_id,
-                    "expiresAt": expires_at,
-                }
-            )
-        return items
+        return [_row_to_job(row) for row in rows]
+
+    @traced_query("record_usage")
+    def record_usage(
+        self,
+        job_id: str,
+        *,
+        prompt_tokens: int,
+        completion_tokens: int,
+        llm_calls: int,
+        cost_usd: Optional[float],
+    ) -> None:
+        """Job의 LLM 사용량을 한 번에 기록한다 (Job 종료 시 1회 호출)."""
+
+        now = int(time.time())
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE jobs
+                    SET prompt_tokens = %s,
+                        completion_tokens = %s,
+                        llm_calls = %s,
+                        cost_usd = %s,
+                        updated_at = %s
+                    WHERE id = %s
+                    """,
+                    (prompt_tokens, completion_tokens, llm_calls, cost_usd, now, job_id),
+                )
+                conn.commit()
+
+    @traced_query("usage_summary")
+    def usage_summary(
+        self,
+        *,
+        since: int,
+        until: int,
+        owner_id: Optional[str] = None,
+    ) -> List[Dict]:
+        """[since, until) 기간에 생성된 Job의 LLM 사용량을 소유자/일자(UTC)별로 집계한다."""
+
+        params: List = [since, until]
+        owner_clause = ""
+        if owner_id is not None:
+            owner_clause = "AND owner_id = %s"
+            params.append(owner_id)
+
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT
+                        owner_id,
+                        to_char(to_timestamp(created_at) AT TIME ZONE 'UTC', 'YYYY-MM-DD') AS day,
+                        COUNT(*),
+                        COALESCE(SUM(prompt_tokens), 0),
+                        COALESCE(SUM(completion_tokens), 0),
+                        COALESCE(SUM(llm_calls), 0),
+                        COALESCE(SUM(cost_usd), 0)
+                    FROM jobs
+                    WHERE created_at >= %s
+                      AND created_at < %s
+                      {owner_clause}
+                    GROUP BY owner_id, day
+                    ORDER BY day DESC, owner_id
+                    """,
+                    params,
+                )
+                rows = cur.fetchall()
+
+        return [
+            {
+                "ownerId": owner,
+                "day": day,
+                "jobs": jobs,
+                "promptTokens": int(prompt_tokens),
+                "completionTokens": int(completion_tokens),
+                "llmCalls": int(llm_calls),
+                "costUsd": float(cost_usd),
+            }
+            for owner, day, jobs, prompt_tokens, completion_tokens, llm_calls, cost_usd in rows
+        ]
+
+    @traced_query("backlog_stats")
+    def backlog_stats(self, *, since: int, default_page_count: int = 10) -> Dict:
+        """since 이후 생성되어 아직 PENDING/RUNNING 인 Job 수와 페이지 합계를 반환한다.
+
+        페이지 수를 모르는 Job 은 default_page_count 로 계산한다.
+        오래된 RUNNING Job(워커 비정상 종료 등)이 영원히 집계되지 않도록 since 로 제한한다.
+        """
+
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(COALESCE(page_count, %s)), 0)
+                    FROM jobs
+                    WHERE status IN ('PENDING', 'RUNNING')
+                      AND created_at >= %s
+                    """,
+                    (default_page_count, since),
+                )
+                jobs, pages = cur.fetchone()
+
+        return {"jobs": int(jobs), "pages": int(pages)}
 
+    @traced_query("set_error")
     def set_error(self, job_id: str, error_code: str, status: str = "FAILED") -> None:
         """Job에 오류 코드를 기록하고 상태를 갱신한다.
 
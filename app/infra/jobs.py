@@ -1,67 +1,243 @@
 from pathlib import Path
+import logging
+import tempfile
 import time
-from typing import Optional
+from typing import List, Optional
 
 from celery import Celery
+from celery.signals import worker_init, worker_process_init
 
 from app.config import settings
+from app.infra import telemetry
 from app.infra.job_repository import JobRepository
+from app.infra.lazy import ProcessLocal
+from app.infra.llm_usage import JobUsage
+from app.infra.memory import MemoryBudget, MemoryBudgetExceeded, release_memory
+from app.infra.paragraph_stream import PARAGRAPHS_ARTIFACT, encode_paragraphs
+from app.infra.prompts import TranslationProfile
 from app.infra.storage import get_storage
-from app.services.translation_service import TranslationService
+from app.infra.translation_memory import PostgresTranslationMemory
 
 
+logger = logging.getLogger(__name__)
+
 celery_app = Celery(
     "paper_translator",
     broker=settings.rabbitmq_url,
     backend="rpc://",
 )
+if settings.worker_max_memory_per_child_mb:
+    # 고정 Task 수가 아니라 측정한 RSS 기준으로 prefork 자식 프로세스를 교체한다 (단위: KiB).
+    # 검사는 Task 가 끝난 뒤에 하므로, 진행 중인 Job 은 job_memory_budget_mb 로 따로 막는다.
+    celery_app.conf.worker_max_memory_per_child = settings.worker_max_memory_per_child_mb * 1024
+
+
+def _create_translation_service():
+    # openai/PyMuPDF/ReportLab 임포트 비용을 API 프로세스가 부담하지 않도록
+    # 실제 번역을 수행하는 워커에서 처음 사용할 때 임포트한다.
+    from app.infra.llm_client import LLMClient
+    from app.infra.llm_router import ModelRouter
+    from app.infra.ocr import PageOCR
+    from app.infra.pdf_generator import PDFGenerator
+    from app.infra.pdf_parser import PDFParser
+    from app.services.translation_service import TranslationService
+
+    llm = LLMClient()
+    router = None
+    if settings.llm_strong_model or settings.llm_fallback_model:
+        router = ModelRouter(llm)
+    memory = _create_translation_memory()
+    glossaries = None
+    if settings.glossary_enabled:
+        # 용어집은 워커 프로세스 기동 시 한 번 읽는다 (변경 사항은 워커 재시작 시 반영).
+        glossaries = PostgresTranslationMemory(settings.db_url).load_glossaries()
+    parser = PDFParser(
+        ocr=PageOCR.from_settings() if settings.ocr_enabled else None,
+        page_window=settings.pdf_page_window,
+    )
+    generator = PDFGenerator(page_window=settings.pdf_page_window)
+    return TranslationService(
+        parser=parser,
+        llm=llm,
+        generator=generator,
+        memory=memory,
+        glossaries=glossaries,
+        router=router,
+    )
+
 
-job_store = JobRepository(settings.db_url)
-translation_service = TranslationService()
-storage = get_storage()
+def _create_translation_memory() -> Optional[PostgresTranslationMemory]:
+    if not settings.tm_enabled:
+        return None
+    return PostgresTranslationMemory(
+        settings.db_url,
+        ttl_days=settings.tm_ttl_days,
+        fuzzy_threshold=settings.tm_fuzzy_threshold,
+        min_chars=settings.tm_min_chars,
+    )
+
+
+# 프로세스별 지연 초기화: 임포트 시점에는 DB 접속/클라이언트 생성을 하지 않는다.
+job_store = ProcessLocal(lambda: JobRepository(settings.db_url))
+translation_service = ProcessLocal(_create_translation_service)
+storage = ProcessLocal(get_storage)
+
+
+def broker_queue_depth(queue: str = "celery") -> Optional[int]:
+    """브로커의 번역 큐에 쌓인 메시지 수. 조회할 수 없으면 None."""
+
+    try:
+        with celery_app.connection_for_write(
+            connect_timeout=settings.admission_broker_timeout_seconds
+        ) as conn:
+            return conn.default_channel.queue_declare(queue=queue, passive=True).message_count
+    except Exception:
+        return None
+
+
+@worker_init.connect
+def _start_worker_metrics_server(**_kwargs) -> None:
+    # 메인 워커 프로세스에서 한 번만 /metrics 서버를 띄운다.
+    # prefork 풀에서는 PROMETHEUS_MULTIPROC_DIR 을 설정해야 자식 프로세스 값이 합산된다
+    # (이미지 기본값으로 설정되어 있으며, 자식 프로세스를 띄우기 전에 이전 값을 비운다).
+    if settings.metrics_enabled:
+        telemetry.prepare_multiprocess_dir(clear=True)
+        telemetry.configure()
+        telemetry.start_metrics_server(settings.worker_metrics_port)
+
+
+@worker_process_init.connect
+def _configure_worker_telemetry(**_kwargs) -> None:
+    # 메트릭은 worker_init 에서 부모가 등록한 것을 fork 로 물려받는다.
+    # 자식에서 다시 등록하면 기본 REGISTRY 에 중복 등록되므로 트레이싱만 초기화한다.
+    telemetry.configure_tracing()
 
 
 @celery_app.task(name="translate_paper")
-def translate_paper(job_id: str) -> dict:
+def translate_paper(job_id: str, enqueued_at: Optional[float] = None) -> dict:
     """실제 번역 Job.
 
-    /data/original/{job_id}.pdf 를 읽어 LLM 번역 후
-    /data/translated/{job_id}.pdf 로 저장한다.
+    Storage 에서 원본 PDF를 로컬 작업 디렉터리로 가져와 LLM 번역 후
+    번역 PDF를 다시 Storage 에 저장한다.
+    enqueued_at(epoch 초)이 주어지면 큐 대기 시간을 메트릭으로 기록한다.
     """
 
+    if enqueued_at is not None:
+        telemetry.observe_queue_wait(time.time() - enqueued_at)
+
+    with telemetry.job_context(job_id), telemetry.timed("job.translate_paper"):
+        try:
+            result = _translate_paper(job_id)
+        except Exception:
+            telemetry.count_job("FAILED")
+            raise
+        finally:
+            # 이전 Job 의 문서 캐시/문자열이 남은 상태로 다음 Job 을 시작하지 않게 한다.
+            release_memory()
+    telemetry.count_job("COMPLETED")
+    return result
+
+
+def enqueue_translations(job_ids: List[str]) -> None:
+    """여러 번역 Job을 하나의 브로커 연결(producer)로 발행한다."""
+
+    enqueued_at = time.time()
+    with celery_app.producer_or_acquire() as producer:
+        for job_id in job_ids:
+            translate_paper.apply_async(
+                (job_id,),
+                {"enqueued_at": enqueued_at},
+                producer=producer,
+            )
+
+
+def _translate_paper(job_id: str) -> dict:
+    from app.infra.pdf_parser import NoTextExtracted  # PyMuPDF 는 워커에서만 임포트한다.
+
     job_store.set_status(job_id, "RUNNING")
+    # 업로드 시 검증한 값이므로 여기서는 그대로 사용한다 (설정이 없는 이전 Job 은 기본값).
+    profile = TranslationProfile.from_job(job_store.get_job(job_id))
 
-    original_path = Path(storage.get_original_path(job_id))
-    translated_path = Path(storage.get_translated_path(job_id))
+    with tempfile.TemporaryDirectory(prefix=f"job-{job_id}-") as tmp:
+        workdir = Path(tmp)
+        original_path = storage.fetch_original(job_id, workdir)
+        translated_path = workdir / "translated.pdf"
 
-    if not original_path.exists():
-        job_store.set_error(job_id, "ORIGINAL_PDF_NOT_FOUND")
-        raise FileNotFoundError(f"Original PDF not found for job_id={job_id}")
+        if original_path is None:
+            job_store.set_error(job_id, "ORIGINAL_PDF_NOT_FOUND")
+            raise FileNotFoundError(f"Original PDF not found for job_id={job_id}")
 
-    try:
-        # 페이지 수 계산 (메타데이터 저장용)
+        usage = JobUsage()
         try:
-            page_count = translation_service.get_page_count(original_path)
-        except Exception:
-            page_count = None
+            # 페이지 수 계산 (메타데이터 저장용)
+            try:
+                page_count = translation_service.get_page_count(original_path)
+            except Exception:
+                page_count = None
 
-        translation_service.translate_pdf(original_path, translated_path)
-    except Exception:
-        job_store.set_error(job_id, "TRANSLATION_FAILED")
-        raise
+            pairs = translation_service.translate_pdf(
+                original_path,
+                translated_path,
+                usage=usage,
+                memory_budget=MemoryBudget.from_settings(),
+                profile=profile,
+            )
+            storage.save_translated_file(job_id, translated_path)
+        except NoTextExtracted:
+            # 스캔 문서인데 OCR 을 사용할 수 없거나 OCR 결과도 비어 있는 경우
+            job_store.set_error(job_id, "NO_TEXT_EXTRACTED")
+            raise
+        except MemoryBudgetExceeded:
+            # 워커가 OOM 으로 강제 종료되기 전에 Job 을 실패로 기록한다.
+            job_store.set_error(job_id, "MEMORY_BUDGET_EXCEEDED")
+            raise
+        except TimeoutError:
+            # Job 단위 LLM 시간 예산(llm_job_deadline_seconds) 초과 포함
+            job_store.set_error(job_id, "TRANSLATION_TIMEOUT")
+            raise
+        except Exception:
+            job_store.set_error(job_id, "TRANSLATION_FAILED")
+            raise
+        finally:
+            # 실패한 Job 도 이미 소비한 토큰은 비용에 포함되므로 항상 기록한다.
+            if usage.calls:
+                _record_usage(job_id, usage)
 
     if page_count is not None:
         job_store.set_page_count(job_id, page_count)
 
+    # 문단 스트림을 남겨 두면 다른 출력 형식을 재번역 없이 만들 수 있다 (실패해도 Job 결과에는 영향 없음).
+    if pairs:
+        try:
+            storage.save_artifact(job_id, PARAGRAPHS_ARTIFACT, encode_paragraphs(pairs, profile))
+        except Exception:
+            logger.warning("failed to save paragraph stream for job_id=%s", job_id, exc_info=True)
+
+    # 원본은 TTL 동안 거의 읽히지 않으므로 보관용으로 전환한다 (실패해도 Job 결과에는 영향 없음).
+    try:
+        storage.archive_original(job_id)
+    except Exception:
+        logger.warning("failed to archive original for job_id=%s", job_id, exc_info=True)
+
     job_store.set_status(job_id, "COMPLETED")
     return {"job_id": job_id, "status": "COMPLETED"}
 
 
+def _record_usage(job_id: str, usage: JobUsage) -> None:
+    job_store.record_usage(
+        job_id,
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        llm_calls=usage.calls,
+        cost_usd=usage.cost_usd(settings.llm_prices),
+    )
+
+
 def cleanup_expired_jobs_impl(*, now: Optional[int] = None, limit: int = 100) -> int:
-    """만료된 Job의 원본/번역 파일을 정리한다.
+    """만료된 Job의 원본/번역 파일과 아티팩트를 정리한다.
 
     - JobRepository 에서 expires_at <= now 인 Job 목록을 조회하고,
-    - Storage 를 통해 original/translated 파일을 삭제한다.
+    - Storage 를 통해 original/translated 파일과 아티팩트(문단 스트림, 렌더링 캐시)를 삭제한다.
 
     반환값은 정리한 Job 개수이다.
     """
@@ -73,6 +249,7 @@ def cleanup_expired_jobs_impl(*, now: Optional[int] = None, limit: int = 100) ->
         job_id = item["jobId"]
         storage.delete_original(job_id)
         storage.delete_translated(job_id)
+        storage.delete_artifacts(job_id)
 
     return len(expired_jobs)
 
@@ -84,4 +261,9 @@ def cleanup_expired_jobs(limit: int = 100) -> int:
     주기적인 실행은 Celery Beat 또는 외부 스케줄러에서 호출하는 것을 전제로 한다.
     """
 
-    return cleanup_expired_jobs_impl(limit=limit)
+    cleaned = cleanup_expired_jobs_impl(limit=limit)
+
+    memory = _create_translation_memory()
+    if memory is not None:
+        memory.delete_expired()
+    return cleaned
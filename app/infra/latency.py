@@ -0,0 +1,67 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence
+
+
+# 초 단위 버킷 경계 (LLM 요청 지연 분포에 맞춘 값)
+DEFAULT_BUCKETS: Sequence[float] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0,
+)
+
+
+class LatencyHistogram:
+    """스레드 안전한 고정 버킷 지연 히스토그램.
+
+    요청별 지연(초)을 누적하고, 버킷 경계 기반 근사 백분위수를 제공한다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._bounds: List[float] = sorted(buckets)
+        self._counts: List[int] = [0] * (len(self._bounds) + 1)  # 마지막은 +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        idx = bisect.bisect_left(self._bounds, seconds)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += seconds
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q(0~1) 백분위수가 속한 버킷의 상한을 반환한다 (관측값이 없으면 None)."""
+
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+        if total == 0:
+            return None
+
+        rank = q * total
+        seen = 0
+        for idx, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return self._bounds[idx] if idx < len(self._bounds) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+        labels = [f"le_{b:g}" for b in self._bounds] + ["le_inf"]
+        return {
+            "count": total,
+            "sum": total_sum,
+            "mean": total_sum / total if total else None,
+            "buckets": dict(zip(labels, counts)),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
@@ -0,0 +1,64 @@
+import os
+import threading
+import weakref
+from typing import Callable, Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+_instances: "weakref.WeakSet[ProcessLocal]" = weakref.WeakSet()
+
+
+def _reset_locks_after_fork() -> None:
+    # fork 시점에 다른 스레드가 잡고 있던 락은 자식에서 영원히 풀리지 않으므로 새로 만든다.
+    for proxy in list(_instances):
+        proxy._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+class ProcessLocal(Generic[T]):
+    """프로세스별 지연 초기화 싱글톤 프록시.
+
+    - 첫 속성 접근 시점에 factory 를 호출해 인스턴스를 만든다 (임포트 시점에는 아무 것도 하지 않음).
+    - fork 로 생성된 자식 프로세스(Celery prefork, uvicorn/gunicorn workers)에서는
+      부모의 인스턴스(DB 커넥션, HTTP 커넥션 풀 등)를 공유하지 않고 새로 만든다.
+
+    모듈 전역 변수로 두고 원래 객체처럼 사용한다.
+
+        job_store = ProcessLocal(lambda: JobRepository(settings.db_url))
+        job_store.get_job(job_id)
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        _instances.add(self)
+
+    def get(self) -> T:
+        """현재 프로세스의 인스턴스를 반환한다 (없으면 생성)."""
+
+        pid = os.getpid()
+        if self._instance is None or self._pid != pid:
+            with self._lock:
+                if self._instance is None or self._pid != pid:
+                    self._instance = self._factory()
+                    self._pid = pid
+        return self._instance  # type: ignore[return-value]
+
+    def reset(self) -> None:
+        """캐시된 인스턴스를 버린다. 다음 접근 시 다시 생성된다."""
+
+        self._instance = None
+        self._pid = None
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None and self._pid == os.getpid()
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
@@ -1,33 +1,472 @@
-from openai import OpenAI
+"""OpenAI 호환 LLM 번역 클라이언트 (동기/비동기).
+
+재시도는 SDK 가 아니라 여기서 직접 한다. Job 시간 예산(Deadline)이 있으면 매 시도 전에 남은
+예산을 확인하고, 각 시도의 응답 수신도 남은 예산(또는 timeout 상한) 안에서 끝나도록
+응답 본문을 읽는 동안 벽시계 시각을 확인한다. 그래서 재시도나 느리게 흘러오는 응답 때문에
+청크 하나가 Job 예산을 넘겨 쓰지 않는다.
+"""
+
+import asyncio
+import contextvars
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+from openai import APIConnectionError, APIStatusError, APITimeoutError, AsyncOpenAI, OpenAI
 
 from app.config import settings
+from app.infra import telemetry
+from app.infra.latency import LatencyHistogram
+from app.infra.llm_usage import JobUsage
+from app.infra.prompts import DEFAULT_PROFILE
 
 
-class LLMClient:
-    """LLM 번역 클라이언트.
+# 기본 번역 설정(영어 → 한국어, academic 프롬프트)의 시스템 프롬프트
+SYSTEM_PROMPT = DEFAULT_PROFILE.system_prompt
 
-    환경 변수 OPENAI_API_KEY 를 사용해 인증한다.
+# 재시도 대기 (SDK 기본값과 같은 지수 백오프)
+_RETRY_INITIAL_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+_RETRY_STATUS = (408, 409, 429)
+
+# 현재 시도의 응답을 다 받아야 하는 시각 (time.monotonic 기준, 없으면 제한 없음)
+_response_expires_at: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "llm_response_expires_at", default=None
+)
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """Job 단위 시간 예산을 모두 소진해 더 이상 LLM 요청을 보낼 수 없는 경우."""
+
+
+class Deadline:
+    """Job 단위 시간 예산.
+
+    한 Job 안의 모든 LLM 요청이 공유하며, 각 요청의 타임아웃은 남은 예산을 넘지 않는다.
     """
 
-    def __init__(self) -> None:
-        self._client = OpenAI()
+    def __init__(self, budget_seconds: float) -> None:
+        self._expires_at = time.monotonic() + budget_seconds
 
-    def translate_chunk(self, text: str) -> str:
-        system_prompt = (
-            "You are a professional academic translator. "
-            "Translate English into Korean. "
-            "Do not summarize, do not add explanations, keep structure. "
-            "Translate as literally as possible while keeping grammar natural."
+    @classmethod
+    def from_settings(cls) -> Optional["Deadline"]:
+        budget = settings.llm_job_deadline_seconds
+        return cls(budget) if budget else None
+
+    def remaining(self) -> float:
+        return self._expires_at - time.monotonic()
+
+
+@dataclass(frozen=True)
+class LLMTransportConfig:
+    """LLM HTTP 전송 계층 설정 (커넥션 풀, keep-alive, 타임아웃)."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 120.0
+    http2: bool = False
+    max_retries: int = 2
+    base_url: Optional[str] = None
+
+    @classmethod
+    def from_settings(cls) -> "LLMTransportConfig":
+        return cls(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+            connect_timeout=settings.llm_connect_timeout,
+            read_timeout=settings.llm_read_timeout,
+            http2=settings.llm_http2,
+            max_retries=settings.llm_max_retries,
+            base_url=settings.llm_base_url,
         )
 
-        resp = self._client.chat.completions.create(
-            model=settings.llm_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": text},
-            ],
-            temperature=0.1,
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self, read: Optional[float] = None) -> httpx.Timeout:
+        read_timeout = self.read_timeout if read is None else read
+        return httpx.Timeout(read_timeout, connect=min(self.connect_timeout, read_timeout))
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    try:
+        seconds = float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+    return seconds if 0 < seconds <= 60 else None
+
+
+def _check_expired(request: httpx.Request, expires_at: float) -> None:
+    if time.monotonic() > expires_at:
+        raise httpx.ReadTimeout("LLM response not completed within the time budget", request=request)
+
+
+class _DeadlineStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, request: httpx.Request, expires_at: float) -> None:
+        self._stream = stream
+        self._request = request
+        self._expires_at = expires_at
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            _check_expired(self._request, self._expires_at)
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncDeadlineStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, request: httpx.Request, expires_at: float) -> None:
+        self._stream = stream
+        self._request = request
+        self._expires_at = expires_at
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            _check_expired(self._request, self._expires_at)
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class _DeadlineTransport(httpx.BaseTransport):
+    """응답 본문을 읽는 동안 _response_expires_at 을 넘기면 ReadTimeout 을 낸다.
+
+    httpx 의 읽기 타임아웃은 소켓 read 한 번에 대한 것이라, 조금씩 흘러오는 응답은
+    타임아웃 없이 얼마든지 길어질 수 있다.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        expires_at = _response_expires_at.get()
+        if expires_at is not None:
+            _check_expired(request, expires_at)
+        response = self._transport.handle_request(request)
+        if expires_at is not None:
+            response.stream = _DeadlineStream(response.stream, request, expires_at)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncDeadlineTransport(httpx.AsyncBaseTransport):
+    """_DeadlineTransport 의 비동기 버전."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        expires_at = _response_expires_at.get()
+        if expires_at is not None:
+            _check_expired(request, expires_at)
+        response = await self._transport.handle_async_request(request)
+        if expires_at is not None:
+            response.stream = _AsyncDeadlineStream(response.stream, request, expires_at)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@dataclass(frozen=True)
+class _Attempt:
+    timeout: httpx.Timeout
+    expires_at: Optional[float]  # 응답을 다 받아야 하는 시각 (Deadline/timeout 상한이 없으면 None)
+
+
+@dataclass(frozen=True)
+class _ChatRequest:
+    """translate_chunk 한 번의 요청 (동기/비동기 클라이언트가 공유하는 준비 단계의 결과)."""
+
+    model: str
+    kwargs: Dict[str, Any]  # chat.completions.create 인자 (timeout 제외)
+    timeout_cap: Optional[float]
+    max_retries: int
+
+
+class _LLMClientBase:
+    """LLMClient / AsyncLLMClient 공통 구현.
+
+    두 클라이언트는 요청 전송(동기/비동기)만 다르고, 요청 구성·옵션 처리·기록은 여기서 한다.
+    """
+
+    _client: Any
+
+    def __init__(self, config: Optional[LLMTransportConfig] = None) -> None:
+        self._config = config or LLMTransportConfig.from_settings()
+        self.latency = LatencyHistogram()
+
+    def _attempt(self, request: _ChatRequest, deadline: Optional[Deadline]) -> _Attempt:
+        """시도 한 번의 타임아웃. 남은 Job 예산과 timeout 상한을 넘지 않는다."""
+
+        cap = request.timeout_cap
+        read = self._config.read_timeout if cap is None else min(self._config.read_timeout, cap)
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                raise LLMDeadlineExceeded("LLM deadline budget exhausted")
+            read = min(read, remaining)
+        expires_at = time.monotonic() + read if deadline is not None or cap is not None else None
+        return _Attempt(self._config.timeout(read=read), expires_at)
+
+    @staticmethod
+    def _raise_if_deadline_exceeded(exc: BaseException, deadline: Optional[Deadline]) -> None:
+        # 남은 예산으로 줄인 타임아웃에 걸린 것이면 Job 예산 초과로 알린다 (Job 오류 코드 TRANSLATION_TIMEOUT).
+        if isinstance(exc, APITimeoutError) and deadline is not None and deadline.remaining() <= 0:
+            raise LLMDeadlineExceeded("LLM deadline budget exhausted") from exc
+
+    @staticmethod
+    def _retry_delay(
+        request: _ChatRequest,
+        attempt: int,
+        exc: BaseException,
+        deadline: Optional[Deadline],
+    ) -> Optional[float]:
+        """재시도까지 기다릴 시간. 재시도하지 않으면 None (남은 Job 예산 안에 다시 시도할 수 없는 경우 포함)."""
+
+        if attempt >= request.max_retries:
+            return None
+        if isinstance(exc, APIStatusError):
+            if exc.status_code not in _RETRY_STATUS and exc.status_code < 500:
+                return None
+        elif not isinstance(exc, APIConnectionError):
+            return None
+
+        delay = _retry_after(exc)
+        if delay is None:
+            delay = min(_RETRY_INITIAL_DELAY * 2**attempt, _RETRY_MAX_DELAY) * (1 - 0.25 * random.random())
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+        return delay
+
+    def _prepare(
+        self,
+        text: str,
+        *,
+        deadline: Optional[Deadline],
+        glossary: Optional[Dict[str, str]],
+        model: Optional[str],
+        timeout: Optional[float],
+        max_retries: Optional[int],
+        system_prompt: Optional[str],
+        references: Optional[Sequence[Tuple[str, str]]],
+    ) -> _ChatRequest:
+        """translate_chunk 인자로 요청을 만든다.
+
+        model/timeout/max_retries 를 넘기면 이 요청에 한해 기본 모델, 시도당 응답 시간 상한,
+        재시도 횟수를 바꾼다 (ModelRouter 의 라우팅/폴백용).
+        system_prompt 는 Job 의 번역 설정(TranslationProfile.system_prompt)이며 없으면 기본값.
+        references 는 번역 메모리의 유사 일치 (원문, 번역) 목록으로, 참고용으로만 프롬프트에 넣는다.
+        """
+
+        model = model or settings.llm_model
+        return _ChatRequest(
+            model,
+            {
+                "model": model,
+                "messages": self._messages(text, glossary, system_prompt, references),
+                "temperature": 0.1,
+            },
+            timeout,
+            self._config.max_retries if max_retries is None else max_retries,
         )
 
+    def _failed(self, request: _ChatRequest, started: float, exc: BaseException) -> None:
+        self._record(request.model, started, self._outcome(exc))
+
+    def _completed(self, request: _ChatRequest, started: float, resp, usage: Optional[JobUsage]) -> str:
+        self._record(request.model, started, "ok", resp, usage)
         content = resp.choices[0].message.content
         return content or ""
+
+    def _record(
+        self,
+        model: str,
+        started: float,
+        outcome: str,
+        resp=None,
+        usage: Optional[JobUsage] = None,
+    ) -> None:
+        elapsed = time.perf_counter() - started
+        self.latency.observe(elapsed)
+        resp_usage = getattr(resp, "usage", None)
+        telemetry.observe_llm_request(model, outcome, elapsed, resp_usage)
+        if usage is not None and resp_usage is not None:
+            usage.add(model, resp_usage.prompt_tokens or 0, resp_usage.completion_tokens or 0)
+
+    @staticmethod
+    def _outcome(exc: BaseException) -> str:
+        return "timeout" if isinstance(exc, APITimeoutError) else "error"
+
+
+    @staticmethod
+    def _messages(
+        text: str,
+        glossary: Optional[Dict[str, str]] = None,
+        system_prompt: Optional[str] = None,
+        references: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> List[Dict[str, str]]:
+        system = system_prompt or SYSTEM_PROMPT
+        if glossary:
+            # 청크에 실제로 등장하는 용어만 넘겨 프롬프트 길이를 최소화한다.
+            terms = "\n".join(f"- {term} => {translation}" for term, translation in glossary.items())
+            system = f"{system}\nAlways use these fixed translations for terms:\n{terms}"
+        if references:
+            # 번역 메모리의 유사 일치: 용어/문체 참고용이며, 내용(숫자·이름 등)은 다를 수 있다.
+            examples = "\n\n".join(f"Source: {source}\nTranslation: {target}" for source, target in references)
+            system = (
+                f"{system}\nPreviously translated similar passages are given below for terminology and style. "
+                "They may differ in numbers, names or details, so translate the input itself in full "
+                f"and never copy them verbatim:\n{examples}"
+            )
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": text},
+        ]
+
+
+class LLMClient(_LLMClientBase):
+    """LLM 번역 클라이언트.
+
+    환경 변수 OPENAI_API_KEY 를 사용해 인증한다.
+    HTTP 커넥션 풀은 인스턴스(프로세스)당 하나를 만들어 여러 Job/청크가 재사용한다.
+    """
+
+    def __init__(self, config: Optional[LLMTransportConfig] = None) -> None:
+        super().__init__(config)
+        transport = httpx.HTTPTransport(limits=self._config.limits(), http2=self._config.http2)
+        self._http_client = httpx.Client(transport=_DeadlineTransport(transport), timeout=self._config.timeout())
+        # 재시도는 translate_chunk 에서 Job 예산을 확인하며 직접 한다.
+        self._client = OpenAI(base_url=self._config.base_url, http_client=self._http_client, max_retries=0)
+
+    def translate_chunk(
+        self,
+        text: str,
+        *,
+        deadline: Optional[Deadline] = None,
+        usage: Optional[JobUsage] = None,
+        glossary: Optional[Dict[str, str]] = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        references: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> str:
+        """청크 하나를 번역한다 (옵션은 _LLMClientBase._prepare 참고)."""
+
+        request = self._prepare(
+            text,
+            deadline=deadline,
+            glossary=glossary,
+            model=model,
+            timeout=timeout,
+            max_retries=max_retries,
+            system_prompt=system_prompt,
+            references=references,
+        )
+        attempt = 0
+        while True:
+            current = self._attempt(request, deadline)
+            token = _response_expires_at.set(current.expires_at)
+            started = time.perf_counter()
+            try:
+                with telemetry.timed("llm.translate_chunk", model=request.model):
+                    resp = self._client.chat.completions.create(**request.kwargs, timeout=current.timeout)
+            except Exception as exc:
+                self._failed(request, started, exc)
+                self._raise_if_deadline_exceeded(exc, deadline)
+                delay = self._retry_delay(request, attempt, exc, deadline)
+                if delay is None:
+                    raise
+            else:
+                return self._completed(request, started, resp, usage)
+            finally:
+                _response_expires_at.reset(token)
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._http_client.close()
+
+
+class AsyncLLMClient(_LLMClientBase):
+    """asyncio 기반 LLM 번역 클라이언트.
+
+    하나의 커넥션 풀 위에서 여러 청크를 동시에 번역할 때 사용한다.
+    """
+
+    def __init__(self, config: Optional[LLMTransportConfig] = None) -> None:
+        super().__init__(config)
+        transport = httpx.AsyncHTTPTransport(limits=self._config.limits(), http2=self._config.http2)
+        self._http_client = httpx.AsyncClient(
+            transport=_AsyncDeadlineTransport(transport),
+            timeout=self._config.timeout(),
+        )
+        # 재시도는 translate_chunk 에서 Job 예산을 확인하며 직접 한다.
+        self._client = AsyncOpenAI(base_url=self._config.base_url, http_client=self._http_client, max_retries=0)
+
+    async def translate_chunk(
+        self,
+        text: str,
+        *,
+        deadline: Optional[Deadline] = None,
+        usage: Optional[JobUsage] = None,
+        glossary: Optional[Dict[str, str]] = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        references: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> str:
+        """청크 하나를 번역한다 (옵션은 _LLMClientBase._prepare 참고)."""
+
+        request = self._prepare(
+            text,
+            deadline=deadline,
+            glossary=glossary,
+            model=model,
+            timeout=timeout,
+            max_retries=max_retries,
+            system_prompt=system_prompt,
+            references=references,
+        )
+        attempt = 0
+        while True:
+            current = self._attempt(request, deadline)
+            token = _response_expires_at.set(current.expires_at)
+            started = time.perf_counter()
+            try:
+                with telemetry.timed("llm.translate_chunk", model=request.model):
+                    resp = await self._client.chat.completions.create(**request.kwargs, timeout=current.timeout)
+            except Exception as exc:
+                self._failed(request, started, exc)
+                self._raise_if_deadline_exceeded(exc, deadline)
+                delay = self._retry_delay(request, attempt, exc, deadline)
+                if delay is None:
+                    raise
+            else:
+                return self._completed(request, started, resp, usage)
+            finally:
+                _response_expires_at.reset(token)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._http_client.aclose()
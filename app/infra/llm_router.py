@@ -0,0 +1,190 @@
+"""청크 난이도에 따른 LLM 모델 라우팅.
+
+청크마다 난이도 점수(길이, 수식 밀도, 원문 언어 외 문자 비율, 번역 메모리 미스)를 계산해
+- 점수가 임계값 미만이면 저렴한 기본 모델(settings.llm_model)
+- 임계값 이상이면 강한 모델(settings.llm_strong_model)
+로 보낸다. 1차 요청이 타임아웃되면 보조 모델(settings.llm_fallback_model)로 한 번 더 시도해
+꼬리 지연을 줄인다. 1차 요청은 재시도하지 않으므로 429/5xx/연결 오류도 보조 모델로 넘기며,
+보조 모델 요청은 SDK 기본 재시도를 그대로 사용한다. Job 단위 시간 예산(Deadline) 초과는 폴백하지 않는다.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import httpx
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+from app.config import settings
+from app.infra import telemetry
+from app.infra.llm_client import Deadline, LLMDeadlineExceeded
+from app.infra.llm_usage import JobUsage
+from app.infra.prompts import DEFAULT_SOURCE_LANGUAGE
+
+
+# 1차 요청(재시도 없음)에서 보조 모델로 넘기는 오류: 타임아웃과 일시적 오류(429, 5xx, 연결 실패)
+_FALLBACK_ERRORS = (
+    APITimeoutError,
+    APIConnectionError,
+    RateLimitError,
+    InternalServerError,
+    httpx.TransportError,
+)
+
+# 수식으로 보는 문자: 연산자, LaTeX 흔적, 그리스 문자, 화살표/수학 연산자 블록
+_MATH_RE = re.compile(r"[=+^_<>|{}\\$±×÷\u0370-\u03ff\u2190-\u21ff\u2200-\u22ff]")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+# 원문 언어별로 흔한 문자. 라틴 문자(전문 용어, 변수명)와 그리스 문자(수식 기호)는
+# 모든 언어의 논문에 흔하므로 항상 원문 문자로 본다.
+_LATIN = "A-Za-z\u00c0-\u024f\u0370-\u03ff"
+_CJK = "\u3400-\u4dbf\u4e00-\u9fff"
+_SOURCE_SCRIPT_RES: Dict[str, "re.Pattern[str]"] = {
+    "en": re.compile(f"[{_LATIN}]"),
+    "de": re.compile(f"[{_LATIN}]"),
+    "fr": re.compile(f"[{_LATIN}]"),
+    "es": re.compile(f"[{_LATIN}]"),
+    "ja": re.compile(f"[{_LATIN}\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f{_CJK}]"),
+    "zh": re.compile(f"[{_LATIN}{_CJK}]"),
+    "ko": re.compile(f"[{_LATIN}\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3]"),
+}
+
+
+@dataclass(frozen=True)
+class ChunkFeatures:
+    length: int
+    math_density: float  # 공백 제외 문자 중 수식/기호 비율
+    foreign_ratio: float  # 문자(letter) 중 원문 언어 문자(+ 라틴/그리스 문자) 외 비율
+    cache_miss: bool  # 번역 메모리를 조회했지만 정확 일치도 참고 번역(유사 일치)도 없었던 청크
+
+    @classmethod
+    def from_text(
+        cls,
+        text: str,
+        *,
+        source_language: str = DEFAULT_SOURCE_LANGUAGE,
+        cache_miss: bool = False,
+    ) -> "ChunkFeatures":
+        visible = len(text) - text.count(" ") - text.count("\n")
+        letters = len(_LETTER_RE.findall(text))
+        source_script = _SOURCE_SCRIPT_RES.get(source_language, _SOURCE_SCRIPT_RES[DEFAULT_SOURCE_LANGUAGE])
+        return cls(
+            length=len(text),
+            math_density=len(_MATH_RE.findall(text)) / visible if visible else 0.0,
+            foreign_ratio=(letters - len(source_script.findall(text))) / letters if letters else 0.0,
+            cache_miss=cache_miss,
+        )
+
+
+@dataclass(frozen=True)
+class RoutingPolicy:
+    """난이도 점수 가중치와 모델 구성.
+
+    점수는 0~1 로 정규화한 각 특징의 가중합이며, threshold 이상이면 strong_model 을 사용한다.
+    """
+
+    cheap_model: str
+    strong_model: Optional[str] = None
+    fallback_model: Optional[str] = None
+    threshold: float = 0.5
+    fallback_after_seconds: Optional[float] = None
+    length_scale: int = 3000  # 이 길이 이상이면 길이 점수 1.0
+    math_scale: float = 0.08  # 이 밀도 이상이면 수식 점수 1.0
+    foreign_scale: float = 0.2
+    length_weight: float = 0.2
+    math_weight: float = 0.5
+    foreign_weight: float = 0.5
+    cache_miss_weight: float = 0.1
+
+    @classmethod
+    def from_settings(cls) -> "RoutingPolicy":
+        return cls(
+            cheap_model=settings.llm_model,
+            strong_model=settings.llm_strong_model,
+            fallback_model=settings.llm_fallback_model,
+            threshold=settings.llm_route_threshold,
+            fallback_after_seconds=settings.llm_fallback_after_seconds,
+        )
+
+    def score(self, features: ChunkFeatures) -> float:
+        return (
+            self.length_weight * min(features.length / self.length_scale, 1.0)
+            + self.math_weight * min(features.math_density / self.math_scale, 1.0)
+            + self.foreign_weight * min(features.foreign_ratio / self.foreign_scale, 1.0)
+            + self.cache_miss_weight * features.cache_miss
+        )
+
+    def choose(self, features: ChunkFeatures) -> str:
+        if self.strong_model and self.score(features) >= self.threshold:
+            return self.strong_model
+        return self.cheap_model
+
+
+class ModelRouter:
+    """LLMClient 를 감싸 청크별로 모델을 고르고, 타임아웃 시 보조 모델로 폴백한다."""
+
+    def __init__(self, client, policy: Optional[RoutingPolicy] = None) -> None:
+        self._client = client
+        self.policy = policy or RoutingPolicy.from_settings()
+
+    def translate_chunk(
+        self,
+        text: str,
+        *,
+        deadline: Optional[Deadline] = None,
+        usage: Optional[JobUsage] = None,
+        glossary: Optional[Dict[str, str]] = None,
+        cache_miss: bool = False,
+        system_prompt: Optional[str] = None,
+        references: Optional[Sequence[Tuple[str, str]]] = None,
+        source_language: str = DEFAULT_SOURCE_LANGUAGE,
+    ) -> str:
+        policy = self.policy
+        features = ChunkFeatures.from_text(text, source_language=source_language, cache_miss=cache_miss)
+        model = policy.choose(features)
+        fallback = policy.fallback_model if policy.fallback_model != model else None
+
+        if fallback is None:
+            telemetry.count_llm_route(model, "primary")
+            return self._client.translate_chunk(
+                text,
+                deadline=deadline,
+                usage=usage,
+                glossary=glossary,
+                model=model,
+                system_prompt=system_prompt,
+                references=references,
+            )
+
+        # 폴백이 있으면 1차 요청은 재시도 없이 fallback_after_seconds 안에 끝나야 한다.
+        # 실패(타임아웃/일시적 오류)하면 재시도 대신 보조 모델 요청이 SDK 기본 재시도로 처리한다.
+        started = time.monotonic()
+        try:
+            telemetry.count_llm_route(model, "primary")
+            return self._client.translate_chunk(
+                text,
+                deadline=deadline,
+                usage=usage,
+                glossary=glossary,
+                model=model,
+                timeout=policy.fallback_after_seconds,
+                max_retries=0,
+                system_prompt=system_prompt,
+                references=references,
+            )
+        except _FALLBACK_ERRORS:
+            if deadline is not None and deadline.remaining() <= 0:
+                raise LLMDeadlineExceeded(
+                    f"LLM deadline exhausted after {time.monotonic() - started:.1f}s on {model}"
+                )
+
+        telemetry.count_llm_route(fallback, "fallback")
+        return self._client.translate_chunk(
+            text,
+            deadline=deadline,
+            usage=usage,
+            glossary=glossary,
+            model=fallback,
+            system_prompt=system_prompt,
+            references=references,
+        )
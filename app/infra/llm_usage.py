@@ -0,0 +1,50 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class JobUsage:
+    """Job 단위 LLM 토큰 사용량 누적기.
+
+    청크별 응답의 usage 를 모델별로 합산하고, Job 종료 시 JobRepository 에 한 번에 기록한다.
+    """
+
+    def __init__(self) -> None:
+        self._by_model: Dict[str, List[int]] = {}  # model -> [prompt, completion, calls]
+        self._lock = threading.Lock()
+
+    def add(self, model: str, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            totals = self._by_model.setdefault(model, [0, 0, 0])
+            totals[0] += prompt_tokens
+            totals[1] += completion_tokens
+            totals[2] += 1
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(t[0] for t in self._by_model.values())
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(t[1] for t in self._by_model.values())
+
+    @property
+    def calls(self) -> int:
+        return sum(t[2] for t in self._by_model.values())
+
+    def by_model(self) -> Dict[str, Tuple[int, int, int]]:
+        with self._lock:
+            return {model: tuple(t) for model, t in self._by_model.items()}  # type: ignore[misc]
+
+    def cost_usd(self, prices: Dict[str, Tuple[float, float]]) -> Optional[float]:
+        """모델별 (입력, 출력) 100만 토큰당 USD 가격으로 비용을 계산한다.
+
+        가격 정보가 없는 모델이 하나라도 있으면 None을 반환한다.
+        """
+
+        total = 0.0
+        for model, (prompt, completion, _calls) in self.by_model().items():
+            if model not in prices:
+                return None
+            input_price, output_price = prices[model]
+            total += (prompt * input_price + completion * output_price) / 1_000_000
+        return total
@@ -0,0 +1,109 @@
+"""워커 프로세스 메모리 관리.
+
+- MemoryBudget: Job 실행 중 프로세스 RSS 가 시작 시점 대비 예산을 넘으면 MemoryBudgetExceeded 를 발생시킨다.
+  단계/페이지 창(window) 경계마다 checkpoint() 를 호출하며, 단계별 최대 RSS(와 tracemalloc 추적 중이면
+  Python 힙 최대치)를 기록해 벤치마크에서도 사용한다.
+- release_memory: Job 이 끝난 뒤 PyMuPDF 캐시와 해제된 힙을 운영체제에 반환한다.
+
+RSS 는 Linux 의 /proc/self/statm 으로 읽으며, 없으면 getrusage 의 최대 RSS 로 대신한다.
+"""
+
+import ctypes
+import ctypes.util
+import functools
+import gc
+import os
+import resource
+import sys
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+from app.config import settings
+
+
+class MemoryBudgetExceeded(RuntimeError):
+    """Job 이 메모리 예산을 넘었다 (워커가 OOM 으로 종료되기 전에 Job 을 실패시킨다)."""
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        # Linux 는 KB, macOS 는 bytes 단위 (현재값이 아닌 최대값)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+class MemoryBudget:
+    """한 Job 의 메모리 예산.
+
+    limit_bytes 가 None 이면 검사 없이 단계별 최대 사용량만 기록한다.
+    """
+
+    def __init__(
+        self,
+        limit_bytes: Optional[int] = None,
+        *,
+        rss: Callable[[], int] = current_rss_bytes,
+    ) -> None:
+        self.limit_bytes = limit_bytes
+        self._rss = rss
+        self.baseline = rss()
+        self.peak_rss: Dict[str, int] = {}
+        self.peak_traced: Dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls) -> "MemoryBudget":
+        mb = settings.job_memory_budget_mb
+        return cls(mb * 1024 * 1024 if mb else None)
+
+    @property
+    def used_bytes(self) -> int:
+        return max(self._rss() - self.baseline, 0)
+
+    def checkpoint(self, stage: str) -> None:
+        used = self.used_bytes
+        self.peak_rss[stage] = max(self.peak_rss.get(stage, 0), used)
+        if tracemalloc.is_tracing():
+            _current, peak = tracemalloc.get_traced_memory()
+            self.peak_traced[stage] = max(self.peak_traced.get(stage, 0), peak)
+            tracemalloc.reset_peak()
+        if self.limit_bytes is not None and used > self.limit_bytes:
+            raise MemoryBudgetExceeded(
+                f"job memory {used // (1024 * 1024)}MB exceeded budget "
+                f"{self.limit_bytes // (1024 * 1024)}MB during {stage}"
+            )
+
+
+@functools.lru_cache(maxsize=1)
+def _malloc_trim() -> Optional[Callable[[int], int]]:
+    name = ctypes.util.find_library("c")
+    if not name:
+        return None
+    try:
+        return ctypes.CDLL(name).malloc_trim
+    except (OSError, AttributeError):
+        # glibc 가 아닌 환경(musl, macOS)
+        return None
+
+
+def shrink_pdf_cache() -> None:
+    """PyMuPDF(MuPDF) 의 전역 리소스 캐시를 비운다. PyMuPDF 를 임포트하지 않은 프로세스에서는 아무 것도 하지 않는다."""
+
+    fitz = sys.modules.get("fitz")
+    if fitz is not None:
+        fitz.TOOLS.store_shrink(100)
+
+
+def release_memory() -> None:
+    """Job 사이에 해제된 메모리를 정리해 다음 Job 이 이전 Job 의 잔여 메모리 위에서 시작하지 않게 한다."""
+
+    shrink_pdf_cache()
+    gc.collect()
+    trim = _malloc_trim()
+    if trim is not None:
+        trim(0)
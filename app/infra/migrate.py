@@ -0,0 +1,89 @@
+"""스키마 마이그레이션 one-shot 명령.
+
+API/Worker 프로세스는 기동 시 DDL을 실행하지 않으므로, 배포 시 한 번 실행한다.
+오브젝트 스토리지(s3/minio)를 쓰는 경우 로컬 디렉터리(settings.data_dir)에 남아 있는
+이전 Job 파일을 버킷으로 복사한다 (이미 있는 객체는 건너뛰고, 로컬 파일은 지우지 않는다).
+
+    python -m app.infra.migrate
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import psycopg2
+
+from app.config import settings
+from app.infra.job_repository import JobRepository
+from app.infra.storage import LocalStorage, S3Storage, get_storage
+from app.infra.translation_memory import PostgresTranslationMemory
+
+
+def wait_for_db(db_url: str, *, timeout: float = 60.0, interval: float = 1.0) -> None:
+    """DB가 접속을 받을 때까지 기다린다 (컨테이너 동시 기동 시 Postgres 준비 전 실패 방지)."""
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            psycopg2.connect(db_url, connect_timeout=5).close()
+            return
+        except psycopg2.OperationalError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(interval)
+
+
+def copy_local_to_object_storage(source: LocalStorage, target: S3Storage) -> int:
+    """로컬 Storage 의 원본/번역/아티팩트를 오브젝트 스토리지로 복사하고, 복사한 객체 수를 반환한다.
+
+    storage_backend 를 local 에서 s3/minio 로 바꾸면 기존 Job 파일에 접근할 수 없게 되므로
+    마이그레이션 단계에서 옮긴다. 여러 번 실행해도 안전하다.
+    """
+
+    copied = 0
+    for job_id in source.job_ids():
+        if not target.has_original(job_id):
+            with tempfile.TemporaryDirectory(prefix="migrate-") as tmp:
+                # 압축 보관된 원본도 풀어서 올린다 (오브젝트 스토리지는 원본을 압축하지 않는다).
+                original = source.fetch_original(job_id, Path(tmp))
+                if original is not None:
+                    with original.open("rb") as f:
+                        target.save_original_stream(job_id, f)
+                    copied += 1
+
+        if target.stat_translated(job_id) is None and source.stat_translated(job_id) is not None:
+            target.save_translated_file(job_id, Path(source.get_translated_path(job_id)))
+            copied += 1
+
+        for name in source.artifact_names(job_id):
+            if target.load_artifact(job_id, name) is None:
+                target.save_artifact(job_id, name, source.load_artifact(job_id, name))
+                copied += 1
+    return copied
+
+
+def run_migrations() -> None:
+    wait_for_db(settings.db_url)
+    JobRepository(settings.db_url).migrate()
+    PostgresTranslationMemory(settings.db_url).migrate()
+
+    storage = get_storage()
+    if isinstance(storage, S3Storage):
+        storage.ensure_bucket()
+        if Path(settings.data_dir).is_dir():
+            copied = copy_local_to_object_storage(LocalStorage(settings.data_dir), storage)
+            if copied:
+                print(f"copied {copied} local files to object storage")
+    elif isinstance(storage, LocalStorage):
+        moved = storage.migrate_layout()
+        if moved:
+            print(f"moved {moved} files to sharded layout")
+
+
+def main() -> None:
+    run_migrations()
+    print("migrations applied")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""스캔(이미지 전용) 페이지 OCR.
+
+PyMuPDF 의 Tesseract 연동(Page.get_textpage_ocr)을 사용하며, 여러 페이지를
+ProcessPoolExecutor 로 병렬 처리한다. OCR 결과는 페이지 이미지 내용의 해시를 키로
+로컬 디렉터리에 캐시해, 같은 스캔 문서를 다시 처리할 때 OCR 을 건너뛴다.
+
+OCR 언어는 Job 의 원문 언어로 정한다 (TESSERACT_LANGUAGES, 영어 외 언어는 영어 학습 데이터를
+함께 쓴다). settings.ocr_language 를 지정하면 모든 Job 에 그 언어를 쓴다.
+Tesseract 가 설치되어 있지 않으면 OCR 을 건너뛰고 빈 결과를 반환한다.
+"""
+
+import functools
+import hashlib
+import logging
+import contextlib
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+import fitz  # PyMuPDF
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 원문 언어 코드 → Tesseract 언어 (Dockerfile 에서 해당 학습 데이터를 설치한다)
+TESSERACT_LANGUAGES: Dict[str, str] = {
+    "en": "eng",
+    "ko": "kor+eng",
+    "ja": "jpn+eng",
+    "zh": "chi_sim+eng",
+    "de": "deu+eng",
+    "fr": "fra+eng",
+    "es": "spa+eng",
+}
+DEFAULT_OCR_LANGUAGE = "eng"
+
+
+def is_image_only(page: "fitz.Page", text: str) -> bool:
+    """텍스트 레이어가 없고 이미지가 있는 페이지인지 확인한다."""
+
+    return not text and bool(page.get_images(full=False))
+
+
+def page_fingerprint(doc: "fitz.Document", page: "fitz.Page") -> str:
+    """페이지 이미지 스트림과 페이지 크기로 만든 캐시 키 (OCR 설정은 포함하지 않음)."""
+
+    digest = hashlib.sha256(repr(tuple(page.rect)).encode("ascii"))
+    for image in page.get_images(full=False):
+        digest.update(doc.xref_stream_raw(image[0]) or b"")
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def tesseract_available() -> bool:
+    try:
+        return bool(fitz.get_tessdata())
+    except Exception:
+        return False
+
+
+def _run_tesseract(pdf_path: str, page_index: int, language: str, dpi: int) -> str:
+    doc = fitz.open(pdf_path)
+    try:
+        page = doc[page_index]
+        textpage = page.get_textpage_ocr(language=language, dpi=dpi, full=True)
+        return page.get_text(textpage=textpage).strip()
+    finally:
+        doc.close()
+
+
+def _ocr_worker(args: Tuple[str, int, str, int]) -> str:
+    # ProcessPoolExecutor 에서 피클링할 수 있도록 모듈 최상위 함수로 둔다.
+    return _run_tesseract(*args)
+
+
+@contextlib.contextmanager
+def _allow_children() -> Iterator[None]:
+    """데몬 프로세스에서도 자식 프로세스를 띄울 수 있게 daemon 플래그를 잠시 끈다.
+
+    Celery prefork 자식은 데몬 프로세스라 multiprocessing 이 자식 생성을 거부한다.
+    풀 워커는 spawn 으로 띄우고 작업 파이프가 닫히면 스스로 종료하므로,
+    Celery 자식이 종료되어도 남지 않는다.
+    """
+
+    process = multiprocessing.current_process()
+    daemon = process.daemon
+    if daemon:
+        process.daemon = False
+    try:
+        yield
+    finally:
+        if daemon:
+            process.daemon = True
+
+
+class PageOCR:
+    """이미지 전용 페이지들의 OCR 을 수행한다.
+
+    - language 를 지정하면 원문 언어와 상관없이 그 Tesseract 언어를 쓴다.
+    - workers=0 이면 현재 프로세스에서 순차 처리한다.
+    - 풀은 처음 사용할 때 만들어 프로세스 수명 동안 재사용한다.
+    - Celery prefork 자식(데몬 프로세스) 안에서도 풀을 사용한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        language: Optional[str] = None,
+        dpi: int = 300,
+        workers: Optional[int] = None,
+        cache_dir: Optional[Path | str] = None,
+    ) -> None:
+        self.language = language
+        self.dpi = dpi
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._pool: Optional[Executor] = None
+
+    @classmethod
+    def from_settings(cls) -> "PageOCR":
+        return cls(
+            language=settings.ocr_language,
+            dpi=settings.ocr_dpi,
+            workers=settings.ocr_workers,
+            cache_dir=settings.ocr_cache_dir or Path(settings.data_dir) / "ocr-cache",
+        )
+
+    def language_for(self, source_language: Optional[str]) -> str:
+        """원문 언어 코드에 맞는 Tesseract 언어."""
+
+        if self.language:
+            return self.language
+        return TESSERACT_LANGUAGES.get(source_language or "", DEFAULT_OCR_LANGUAGE)
+
+    def recognize(
+        self,
+        pdf_path: Path | str,
+        pages: Sequence[Tuple[int, str]],
+        *,
+        source_language: Optional[str] = None,
+    ) -> Dict[int, str]:
+        """(페이지 번호, 지문) 목록을 OCR 해 페이지 번호 → 텍스트를 반환한다."""
+
+        language = self.language_for(source_language)
+        results: Dict[int, str] = {}
+        todo: List[Tuple[int, str]] = []
+        for index, fingerprint in pages:
+            cached = self._cache_get(fingerprint, language)
+            if cached is not None:
+                results[index] = cached
+            else:
+                todo.append((index, fingerprint))
+
+        if not todo:
+            return results
+        if not tesseract_available():
+            logger.warning("tesseract not available; skipping OCR for %d pages", len(todo))
+            return results
+
+        args = [(str(pdf_path), index, language, self.dpi) for index, _fp in todo]
+        for (index, fingerprint), text in zip(todo, self._map(args)):
+            results[index] = text
+            self._cache_put(fingerprint, language, text)
+        return results
+
+    def _map(self, args: List[Tuple[str, int, str, int]]) -> List[str]:
+        if self.workers > 1 and len(args) > 1:
+            return self._pool_map(_ocr_worker, args)
+        return [_ocr_worker(a) for a in args]
+
+    def _pool_map(self, fn: Callable[[T], R], args: Sequence[T]) -> List[R]:
+        # 풀 워커는 작업을 제출할 때 필요한 만큼 뜨므로 map 전체를 감싼다.
+        with _allow_children():
+            return list(self._get_pool().map(fn, args))
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            # fork 는 부모의 스레드/커넥션 상태를 복제하므로 spawn 으로 깨끗한 프로세스를 띄운다.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def _cache_key(self, fingerprint: str, language: str) -> str:
+        return hashlib.sha256(f"{fingerprint}:{language}:{self.dpi}".encode("ascii")).hexdigest()
+
+    def _cache_path(self, fingerprint: str, language: str) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        key = self._cache_key(fingerprint, language)
+        return self._cache_dir / key[:2] / f"{key}.txt"
+
+    def _cache_get(self, fingerprint: str, language: str) -> Optional[str]:
+        path = self._cache_path(fingerprint, language)
+        if path is None or not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def _cache_put(self, fingerprint: str, language: str, text: str) -> None:
+        path = self._cache_path(fingerprint, language)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            # 캐시는 최적화일 뿐이므로 기록 실패는 무시한다.
+            logger.warning("failed to write OCR cache %s", path)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,60 @@
+"""번역 문단 스트림 직렬화.
+
+번역이 끝난 문단을 (원문, 번역) 쌍의 gzip JSONL 로 저장해 두면,
+LLM 을 다시 호출하지 않고도 다른 형식(Markdown/HTML/대역 PDF)으로 다시 렌더링할 수 있다.
+
+    {"format": "paragraphs", "version": 1, "source": "en", "target": "ko", "prompt": "academic-v1"}
+    {"src": "...", "tgt": "..."}
+    ...
+"""
+
+import gzip
+import json
+from typing import Dict, Iterable, List, Tuple
+
+from app.infra.prompts import DEFAULT_PROFILE, TranslationProfile
+
+
+PARAGRAPHS_ARTIFACT = "paragraphs.jsonl.gz"
+FORMAT_VERSION = 1
+
+
+def encode_paragraphs(
+    pairs: Iterable[Tuple[str, str]],
+    profile: TranslationProfile = DEFAULT_PROFILE,
+) -> bytes:
+    header = {
+        "format": "paragraphs",
+        "version": FORMAT_VERSION,
+        "source": profile.source_language,
+        "target": profile.target_language,
+        "prompt": profile.prompt_id,
+    }
+    lines = [json.dumps(header)]
+    lines.extend(json.dumps({"src": src, "tgt": tgt}, ensure_ascii=False) for src, tgt in pairs)
+    return gzip.compress(("\n".join(lines) + "\n").encode("utf-8"), compresslevel=6)
+
+
+def decode_paragraphs(data: bytes) -> List[Tuple[str, str]]:
+    return decode_paragraph_stream(data)[1]
+
+
+def decode_paragraph_stream(data: bytes) -> Tuple[Dict, List[Tuple[str, str]]]:
+    """(헤더, 문단 쌍 목록)을 반환한다. 헤더의 source/target/prompt 는 번역 설정이다."""
+
+    lines = gzip.decompress(data).decode("utf-8").splitlines()
+    header = json.loads(lines[0]) if lines else {}
+    if header.get("format") != "paragraphs" or header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported paragraph stream header: {header}")
+    pairs = []
+    for line in lines[1:]:
+        if line:
+            item = json.loads(line)
+            pairs.append((item["src"], item["tgt"]))
+    return header, pairs
+
+
+def target_paragraphs(pairs: Iterable[Tuple[str, str]]) -> List[str]:
+    """PDF 렌더링용 번역 문단 목록 (빈 번역은 건너뛰고, 한 자리에 합쳐진 청크는 다시 나눈다)."""
+
+    return "\n\n".join(tgt for _src, tgt in pairs if tgt).split("\n\n")
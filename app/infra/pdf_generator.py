@@ -1,19 +1,49 @@
 from pathlib import Path
 from textwrap import wrap
-from typing import Iterable
+from typing import Callable, Iterable, Optional, Tuple
 
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 
+from app.infra import telemetry
+
 
 class PDFGenerator:
     """아주 단순한 텍스트 기반 PDF 생성기.
 
     번역된 문단 리스트를 받아 A4 단일 컬럼 텍스트 PDF로 렌더링한다.
+    generate_bilingual 은 (원문, 번역) 쌍을 좌우 2단 대역 PDF로 렌더링한다.
     레이아웃 품질보다는 최소 동작에 초점을 둔다.
+
+    ReportLab 은 저장 전까지 완성된 페이지를 모두 메모리에 들고 있으므로 렌더링 메모리는 문서 분량에
+    비례한다. page_window 는 이 메모리를 제한하지 않으며, 그 간격으로 checkpoint 를 호출해
+    메모리 예산 초과를 저장 전에 조기에 감지할 뿐이다.
     """
 
-    def generate(self, paragraphs: Iterable[str], output_path: Path | str) -> None:
+    def __init__(self, *, page_window: int = 32) -> None:
+        self._page_window = max(page_window, 1)
+
+    def generate(
+        self,
+        paragraphs: Iterable[str],
+        output_path: Path | str,
+        *,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> None:
+        with telemetry.timed("pdf.generate", stage="render"):
+            self._generate(paragraphs, output_path, checkpoint)
+
+    def _new_page(self, c: "canvas.Canvas", checkpoint: Optional[Callable[[], None]]) -> None:
+        c.showPage()
+        if checkpoint is not None and (c.getPageNumber() - 1) % self._page_window == 0:
+            checkpoint()
+
+    def _generate(
+        self,
+        paragraphs: Iterable[str],
+        output_path: Path | str,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> None:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -31,10 +61,55 @@ class PDFGenerator:
             for line in lines:
                 for chunk in wrap(line, max_chars_per_line) or [""]:
                     if y <= margin:
-                        c.showPage()
+                        self._new_page(c, checkpoint)
                         y = height - margin
                     c.drawString(x, y, chunk)
                     y -= line_height
             y -= line_height  # 문단 간 간격
 
         c.save()
+
+    def generate_bilingual(self, pairs: Iterable[Tuple[str, str]], output_path: Path | str) -> None:
+        with telemetry.timed("pdf.generate_bilingual", stage="render"):
+            self._generate_bilingual(pairs, output_path)
+
+    def _generate_bilingual(self, pairs: Iterable[Tuple[str, str]], output_path: Path | str) -> None:
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        c = canvas.Canvas(str(path), pagesize=A4)
+        width, height = A4
+
+        margin = 54
+        gutter = 18
+        column_width = (width - 2 * margin - gutter) / 2
+        left_x = margin
+        right_x = margin + column_width + gutter
+        y = height - margin
+        line_height = 12
+        max_chars_per_line = 42
+
+        def wrap_lines(text: str) -> list[str]:
+            lines = []
+            for line in (text or "").splitlines() or [""]:
+                lines.extend(wrap(line, max_chars_per_line) or [""])
+            return lines
+
+        for source, target in pairs:
+            if not source.strip() and not target.strip():
+                continue
+            left = wrap_lines(source)
+            right = wrap_lines(target)
+            # 원문과 번역의 같은 줄을 나란히 그리므로 한 문단이 페이지를 넘어가도 대응이 유지된다.
+            for i in range(max(len(left), len(right))):
+                if y <= margin:
+                    self._new_page(c, None)
+                    y = height - margin
+                if i < len(left):
+                    c.drawString(left_x, y, left[i])
+                if i < len(right):
+                    c.drawString(right_x, y, right[i])
+                y -= line_height
+            y -= line_height  # 문단 간 간격
+
+        c.save()
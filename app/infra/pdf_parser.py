@@ -1,25 +1,95 @@
+import shutil
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Callable, List, Optional, Tuple
 
 import fitz  # PyMuPDF
 
+from app.infra import telemetry
+from app.infra.memory import shrink_pdf_cache
+from app.infra.ocr import PageOCR, is_image_only, page_fingerprint
+
+
+class NoTextExtracted(ValueError):
+    """텍스트 레이어도 OCR 결과도 없어 번역할 텍스트가 없는 문서."""
+
 
 class PDFParser:
     """간단한 PDF 파서.
 
     현재는 페이지별 전체 텍스트를 추출해서 리스트로 반환한다.
+    텍스트 레이어가 없는 이미지 전용(스캔) 페이지는 ocr 이 주어지면 OCR 로 텍스트를 얻는다.
+    page_window 페이지마다 MuPDF 캐시(글꼴/이미지)를 비우고 checkpoint 를 호출해,
+    긴 문서에서도 캐시가 문서 전체 분량만큼 쌓이지 않게 한다.
+    창이 제한하는 것은 MuPDF 캐시뿐이다. 추출한 텍스트는 청크 분할과 번역 메모리 조회에
+    문서 전체 문단이 필요하므로 모든 페이지 분량을 리스트로 모아 반환한다.
     나중에 Block/섹션 단위 파싱이 필요하면 여기서 확장한다.
     """
 
-    def extract_pages(self, pdf_path: Path | str) -> List[str]:
+    def __init__(self, ocr: Optional[PageOCR] = None, *, page_window: int = 32) -> None:
+        self._ocr = ocr
+        self._page_window = max(page_window, 1)
+
+    def extract_pages(
+        self,
+        pdf_path: Path | str,
+        *,
+        checkpoint: Optional[Callable[[], None]] = None,
+        source_language: Optional[str] = None,
+    ) -> List[str]:
+        """페이지별 텍스트를 추출한다. source_language(원문 언어 코드)로 OCR 언어를 정한다."""
+
         path = Path(pdf_path)
-        doc = fitz.open(path)
-        texts: List[str] = []
-        try:
-            for page in doc:
-                text = page.get_text().strip()
-                if text:
+        with telemetry.timed("pdf.extract_pages", stage="parse"):
+            doc = fitz.open(path)
+            texts: List[str] = []
+            scanned: List[Tuple[int, str]] = []
+            try:
+                for page in doc:
+                    text = page.get_text().strip()
                     texts.append(text)
+                    if self._ocr is not None and is_image_only(page, text):
+                        scanned.append((page.number, page_fingerprint(doc, page)))
+                    if (page.number + 1) % self._page_window == 0:
+                        shrink_pdf_cache()
+                        if checkpoint is not None:
+                            checkpoint()
+            finally:
+                doc.close()
+            shrink_pdf_cache()
+
+        if scanned:
+            with telemetry.timed("pdf.ocr", stage="ocr"):
+                recognized = self._ocr.recognize(path, scanned, source_language=source_language)
+                for index, text in recognized.items():
+                    texts[index] = text
+
+        return [text for text in texts if text]
+
+    def page_count(self, pdf_path: Path | str) -> int:
+        doc = fitz.open(Path(pdf_path))
+        try:
+            return doc.page_count
         finally:
             doc.close()
-        return texts
+
+
+def count_pages_in_stream(stream: BinaryIO) -> int:
+    """업로드 스트림의 페이지 수를 센다.
+
+    PyMuPDF 는 파일 객체를 직접 열 수 없으므로, 메모리에 올리지 않고 임시 파일로 복사해 연다.
+    유효한 PDF가 아니면 예외가 발생한다. 스트림 위치는 처음으로 되돌려 둔다.
+    """
+
+    stream.seek(0)
+    try:
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+            shutil.copyfileobj(stream, tmp, 1024 * 1024)
+            tmp.flush()
+            doc = fitz.open(tmp.name, filetype="pdf")
+            try:
+                return doc.page_count
+            finally:
+                doc.close()
+    finally:
+        stream.seek(0)
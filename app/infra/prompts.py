@@ -0,0 +1,131 @@
+"""번역 언어쌍과 프롬프트 프로필.
+
+Job 마다 원문/번역 언어와 프롬프트 프로필을 고를 수 있다. 프롬프트 템플릿은 모듈 임포트 시
+한 번 파싱하고, (프로필, 언어쌍)별 시스템 프롬프트는 프로세스당 한 번만 만든다.
+
+캐시 키(번역 메모리, 렌더링 캐시)에는 TranslationProfile.cache_namespace 를 쓴다.
+네임스페이스에 언어쌍과 프롬프트 버전이 들어가므로, 언어쌍이나 프롬프트를 추가/변경해도
+다른 언어쌍·프롬프트의 기존 번역은 그대로 재사용된다. 프롬프트 문구를 바꾸면 version 을 올린다.
+"""
+
+import functools
+from dataclasses import dataclass
+from string import Template
+from typing import Dict, Optional
+
+
+LANGUAGES: Dict[str, str] = {
+    "en": "English",
+    "ko": "Korean",
+    "ja": "Japanese",
+    "zh": "Chinese",
+    "de": "German",
+    "fr": "French",
+    "es": "Spanish",
+}
+
+DEFAULT_SOURCE_LANGUAGE = "en"
+DEFAULT_TARGET_LANGUAGE = "ko"
+DEFAULT_PROMPT_PROFILE = "academic"
+
+
+@dataclass(frozen=True)
+class PromptProfile:
+    name: str
+    version: int
+    template: Template
+
+    @property
+    def prompt_id(self) -> str:
+        return f"{self.name}-v{self.version}"
+
+
+PROMPT_PROFILES: Dict[str, PromptProfile] = {
+    profile.name: profile
+    for profile in (
+        PromptProfile(
+            "academic",
+            1,
+            Template(
+                "You are a professional academic translator. "
+                "Translate $source into $target. "
+                "Do not summarize, do not add explanations, keep structure. "
+                "Translate as literally as possible while keeping grammar natural."
+            ),
+        ),
+        PromptProfile(
+            "fluent",
+            1,
+            Template(
+                "You are a professional translator of technical documents. "
+                "Translate $source into $target. "
+                "Do not summarize, do not add explanations, keep paragraph structure. "
+                "Prefer natural, readable $target over literal word order, "
+                "and keep formulas, code and citations unchanged."
+            ),
+        ),
+    )
+}
+
+# 프로필 도입 전 번역 메모리는 언어쌍만으로 키를 만들었다 (en-ko + academic-v1).
+# 이 조합은 이전 네임스페이스를 그대로 써서 기존 항목을 계속 재사용한다.
+_LEGACY_NAMESPACES = {("en", "ko", "academic-v1"): "en-ko"}
+
+
+@dataclass(frozen=True)
+class TranslationProfile:
+    """한 Job 의 번역 설정 (원문 언어, 번역 언어, 프롬프트 프로필)."""
+
+    source_language: str = DEFAULT_SOURCE_LANGUAGE
+    target_language: str = DEFAULT_TARGET_LANGUAGE
+    prompt_profile: str = DEFAULT_PROMPT_PROFILE
+
+    def __post_init__(self) -> None:
+        for code in (self.source_language, self.target_language):
+            if code not in LANGUAGES:
+                raise ValueError(f"unsupported language: {code}")
+        if self.source_language == self.target_language:
+            raise ValueError("source and target language must differ")
+        if self.prompt_profile not in PROMPT_PROFILES:
+            raise ValueError(f"unknown prompt profile: {self.prompt_profile}")
+
+    @classmethod
+    def from_job(cls, job: Optional[Dict]) -> "TranslationProfile":
+        """JobRepository 의 Job 정보로 만든다 (설정이 없는 이전 Job 은 기본값)."""
+
+        job = job or {}
+        return cls(
+            job.get("sourceLanguage") or DEFAULT_SOURCE_LANGUAGE,
+            job.get("targetLanguage") or DEFAULT_TARGET_LANGUAGE,
+            job.get("promptProfile") or DEFAULT_PROMPT_PROFILE,
+        )
+
+    @property
+    def lang_pair(self) -> str:
+        return f"{self.source_language}-{self.target_language}"
+
+    @property
+    def prompt_id(self) -> str:
+        return PROMPT_PROFILES[self.prompt_profile].prompt_id
+
+    @property
+    def cache_namespace(self) -> str:
+        """캐시 키 접두어 (언어쌍 + 버전 포함 프롬프트 id, 파일 이름으로도 안전한 문자만 사용)."""
+
+        key = (self.source_language, self.target_language, self.prompt_id)
+        return _LEGACY_NAMESPACES.get(key) or f"{self.lang_pair}.{self.prompt_id}"
+
+    @property
+    def system_prompt(self) -> str:
+        return system_prompt(self.prompt_profile, self.source_language, self.target_language)
+
+
+@functools.lru_cache(maxsize=None)
+def system_prompt(profile: str, source_language: str, target_language: str) -> str:
+    return PROMPT_PROFILES[profile].template.substitute(
+        source=LANGUAGES[source_language],
+        target=LANGUAGES[target_language],
+    )
+
+
+DEFAULT_PROFILE = TranslationProfile()
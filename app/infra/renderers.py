@@ -0,0 +1,34 @@
+"""번역 문단 스트림을 텍스트 기반 형식(Markdown/HTML)으로 렌더링한다.
+
+PDF 형식은 PDFGenerator 가 담당한다.
+"""
+
+import html
+from typing import List, Tuple
+
+
+def render_markdown(pairs: List[Tuple[str, str]]) -> bytes:
+    paragraphs = [tgt.strip() for _src, tgt in pairs if tgt.strip()]
+    return ("\n\n".join(paragraphs) + "\n").encode("utf-8")
+
+
+def render_html(
+    pairs: List[Tuple[str, str]],
+    *,
+    title: str = "Translated paper",
+    lang: str = "ko",
+) -> bytes:
+    body = "\n".join(
+        "<p>" + html.escape(tgt.strip()).replace("\n", "<br>\n") + "</p>"
+        for _src, tgt in pairs
+        if tgt.strip()
+    )
+    document = (
+        "<!DOCTYPE html>\n"
+        f'<html lang="{html.escape(lang)}">\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{html.escape(title)}</title>\n"
+        "</head>\n<body>\n"
+        f"{body}\n"
+        "</body>\n</html>\n"
+    )
+    return document.encode("utf-8")
@@ -1,36 +1,122 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import os
+import shutil
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Iterator, List, Optional
+from uuid import uuid4
 
 from app.config import settings
 
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """저장된 파일의 메타데이터."""
+
+    size: int
+    modified_at: int  # epoch 초
+    etag: Optional[str] = None  # 내용 해시 기반 강한(strong) ETag 값 (따옴표 제외)
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 class Storage(ABC):
     """원본/번역 PDF 파일 저장소 추상화.
 
-    현재는 로컬 파일 시스템 구현(LocalStorage)만 제공한다.
+    로컬 파일 시스템 구현(LocalStorage)과 S3 호환 오브젝트 스토리지 구현(S3Storage)을 제공한다.
+    상위 계층은 로컬 경로가 존재한다고 가정하지 말고 fetch/stream 계열 메서드를 사용한다.
     """
 
     @abstractmethod
     def save_original(self, job_id: str, data: bytes) -> str:  # returns path
         """원본 PDF를 저장하고, 저장 경로를 문자열로 반환한다."""
 
+    @abstractmethod
+    def save_original_stream(self, job_id: str, stream: BinaryIO) -> str:
+        """파일 객체에서 원본 PDF를 스트리밍으로 저장한다 (전체를 메모리에 올리지 않음)."""
+
     @abstractmethod
     def save_translated(self, job_id: str, data: bytes) -> str:  # returns path
         """번역된 PDF를 저장하고, 저장 경로를 문자열로 반환한다."""
 
+    @abstractmethod
+    def save_translated_file(self, job_id: str, src: Path) -> str:
+        """로컬에 생성된 번역 PDF 파일을 저장소로 옮긴다."""
+
     @abstractmethod
     def get_original_path(self, job_id: str) -> str:
-        """원본 PDF의 예상 경로를 문자열로 반환한다.
+        """원본 PDF의 예상 경로(또는 URI)를 문자열로 반환한다.
 
-        파일 존재 여부는 호출자가 Path.exists() 등으로 확인한다.
+        파일 존재 여부는 보장하지 않는다.
         """
 
     @abstractmethod
     def get_translated_path(self, job_id: str) -> str:
-        """번역된 PDF의 예상 경로를 문자열로 반환한다."""
+        """번역된 PDF의 예상 경로(또는 URI)를 문자열로 반환한다."""
+
+    @abstractmethod
+    def fetch_original(self, job_id: str, workdir: Path) -> Optional[Path]:
+        """원본 PDF를 로컬에서 읽을 수 있는 경로로 준비한다.
+
+        필요하면 workdir 아래로 내려받는다. 원본이 없으면 None을 반환한다.
+        """
+
+    @abstractmethod
+    def stat_translated(self, job_id: str) -> Optional[StoredObject]:
+        """번역된 PDF의 메타데이터를 반환한다 (없으면 None)."""
+
+    @abstractmethod
+    def iter_translated(
+        self,
+        job_id: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """번역된 PDF의 [start, end] 바이트 구간(end 포함)을 청크 단위로 스트리밍한다."""
+
+    def get_translated_url(self, job_id: str, *, filename: str) -> Optional[str]:
+        """클라이언트가 직접 내려받을 수 있는 (presigned) URL을 반환한다.
+
+        URL을 제공하지 않는 구현은 None을 반환하며, 이 경우 API가 직접 스트리밍한다.
+        """
+
+        return None
+
+    def archive_original(self, job_id: str) -> None:
+        """번역이 끝나 더 이상 자주 읽지 않는 원본을 보관용으로 전환한다.
+
+        기본 구현은 아무 것도 하지 않는다.
+        """
+
+    @abstractmethod
+    def save_artifact(self, job_id: str, name: str, data: bytes) -> str:
+        """Job 부속 산출물(번역 문단 스트림, 렌더링 캐시 등)을 저장한다.
+
+        name 은 Job 안에서의 상대 이름이며 "/" 로 하위 경로를 만들 수 있다.
+        """
+
+    @abstractmethod
+    def load_artifact(self, job_id: str, name: str) -> Optional[bytes]:
+        """저장된 산출물을 읽는다 (없으면 None)."""
+
+    @abstractmethod
+    def delete_artifacts(self, job_id: str) -> None:
+        """Job 의 모든 산출물을 삭제한다 (없으면 무시)."""
 
     @abstractmethod
     def delete_original(self, job_id: str) -> None:
@@ -45,32 +131,143 @@ class LocalStorage(Storage):
     """로컬 디렉터리 기반 Storage 구현.
 
     기본 베이스 디렉터리는 settings.data_dir (기본 /data)를 사용한다.
-    구조:
-    - {base}/original/{job_id}.pdf
-    - {base}/translated/{job_id}.pdf
+    구조 (job_id 해시 앞 4자리로 2단계 fan-out, 디렉터리당 파일 수를 제한한다):
+    - {base}/original/{h[0:2]}/{h[2:4]}/{job_id}.pdf[.zst|.gz]
+    - {base}/translated/{h[0:2]}/{h[2:4]}/{job_id}.pdf
+    - {base}/translated/{h[0:2]}/{h[2:4]}/{job_id}.pdf.sha256  (ETag 용 내용 해시)
+    - {base}/artifacts/{h[0:2]}/{h[2:4]}/{job_id}/{name}  (번역 문단 스트림, 렌더링 캐시)
+
+    - 이전 버전의 평면(flat) 구조 파일은 조회 시 샤딩 경로로 옮겨지며,
+      migrate_layout() 으로 한 번에 옮길 수도 있다.
+    - 모든 쓰기는 임시 파일 → fsync → rename 순서로 원자적으로 수행한다.
+    - 번역이 끝난 원본은 archive_original() 로 압축(zstd/deflate)해 보관할 수 있다.
     """
 
-    def __init__(self, base_dir: Optional[str | Path] = None) -> None:
+    COMPRESSION_SUFFIXES = {"zstd": ".zst", "deflate": ".gz"}
+
+    def __init__(
+        self,
+        base_dir: Optional[str | Path] = None,
+        *,
+        compression: str = "none",
+        fsync: bool = True,
+    ) -> None:
+        if compression != "none" and compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
         self._base_dir = Path(base_dir or settings.data_dir)
+        self._compression = compression
+        self._fsync = fsync
+
+    # --- 경로 계산 ---
+
+    @staticmethod
+    def _shard(job_id: str) -> tuple[str, str]:
+        h = hashlib.sha1(job_id.encode("utf-8")).hexdigest()
+        return h[0:2], h[2:4]
+
+    def _sharded_path(self, kind: str, job_id: str) -> Path:
+        a, b = self._shard(job_id)
+        return self._base_dir / kind / a / b / f"{job_id}.pdf"
+
+    def _legacy_path(self, kind: str, job_id: str) -> Path:
+        return self._base_dir / kind / f"{job_id}.pdf"
+
+    def _resolve(self, kind: str, job_id: str) -> Path:
+        """샤딩 경로를 반환하되, 평면 구조에 남아 있는 파일은 먼저 옮긴다."""
+
+        path = self._sharded_path(kind, job_id)
+        if not path.exists():
+            legacy = self._legacy_path(kind, job_id)
+            if legacy.exists():
+                self._move_legacy(legacy, path)
+        return path
+
+    def _move_legacy(self, legacy: Path, path: Path) -> bool:
+        """평면 구조 파일을 샤딩 경로로 옮기고, 실제로 옮겼는지 반환한다."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(legacy, path)
+        except FileNotFoundError:
+            # 다른 프로세스가 먼저 옮긴 경우
+            return False
+        legacy_digest = self._digest_path(legacy)
+        if legacy_digest.exists():
+            os.replace(legacy_digest, self._digest_path(path))
+        return True
 
     def _original_path(self, job_id: str) -> Path:
-        return self._base_dir / "original" / f"{job_id}.pdf"
+        return self._resolve("original", job_id)
 
     def _translated_path(self, job_id: str) -> Path:
-        return self._base_dir / "translated" / f"{job_id}.pdf"
+        return self._resolve("translated", job_id)
+
+    def _compressed_original_paths(self, job_id: str) -> list[tuple[str, Path]]:
+        path = self._sharded_path("original", job_id)
+        return [
+            (method, path.with_name(path.name + suffix))
+            for method, suffix in self.COMPRESSION_SUFFIXES.items()
+        ]
+
+    @staticmethod
+    def _digest_path(path: Path) -> Path:
+        return path.with_name(path.name + ".sha256")
+
+    # --- 원자적 쓰기 ---
+
+    def _atomic_write(self, path: Path, write: Callable[[BinaryIO], None]) -> None:
+        """같은 디렉터리의 임시 파일에 쓴 뒤 rename 해 부분 쓰기가 노출되지 않도록 한다."""
 
-    def save_original(self, job_id: str, data: bytes) -> str:
-        path = self._original_path(job_id)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as f:
-            f.write(data)
+        tmp = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            with tmp.open("wb") as f:
+                write(f)
+                if self._fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+        if self._fsync:
+            # rename 자체를 영속화하기 위해 디렉터리도 fsync 한다.
+            dir_fd = os.open(path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def _write_digest(self, path: Path) -> str:
+        digest = _sha256_file(path)
+        self._atomic_write(self._digest_path(path), lambda f: f.write(digest.encode("ascii")))
+        return digest
+
+    # --- Storage 구현 ---
+
+    def save_original(self, job_id: str, data: bytes) -> str:
+        path = self._sharded_path("original", job_id)
+        self._atomic_write(path, lambda f: f.write(data))
+        return str(path)
+
+    def save_original_stream(self, job_id: str, stream: BinaryIO) -> str:
+        path = self._sharded_path("original", job_id)
+        self._atomic_write(path, lambda f: shutil.copyfileobj(stream, f, DEFAULT_CHUNK_SIZE))
         return str(path)
 
     def save_translated(self, job_id: str, data: bytes) -> str:
-        path = self._translated_path(job_id)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as f:
-            f.write(data)
+        path = self._sharded_path("translated", job_id)
+        self._atomic_write(path, lambda f: f.write(data))
+        self._write_digest(path)
+        return str(path)
+
+    def save_translated_file(self, job_id: str, src: Path) -> str:
+        path = self._sharded_path("translated", job_id)
+        with Path(src).open("rb") as sf:
+            self._atomic_write(path, lambda f: shutil.copyfileobj(sf, f, DEFAULT_CHUNK_SIZE))
+        Path(src).unlink(missing_ok=True)
+        self._write_digest(path)
         return str(path)
 
     def get_original_path(self, job_id: str) -> str:
@@ -79,24 +276,445 @@ class LocalStorage(Storage):
     def get_translated_path(self, job_id: str) -> str:
         return str(self._translated_path(job_id))
 
-    def delete_original(self, job_id: str) -> None:
+    def fetch_original(self, job_id: str, workdir: Path) -> Optional[Path]:
+        # 비압축 로컬 파일은 복사 없이 그대로 사용한다.
         path = self._original_path(job_id)
         if path.exists():
-            path.unlink()
+            return path
+
+        for method, compressed in self._compressed_original_paths(job_id):
+            if compressed.exists():
+                dest = Path(workdir) / f"{job_id}.pdf"
+                with compressed.open("rb") as src, dest.open("wb") as dst:
+                    _decompress_stream(method, src, dst)
+                return dest
+
+        return None
+
+    def archive_original(self, job_id: str) -> None:
+        if self._compression == "none":
+            return
+
+        path = self._original_path(job_id)
+        if not path.exists():
+            return
+
+        target = path.with_name(path.name + self.COMPRESSION_SUFFIXES[self._compression])
+        with path.open("rb") as src:
+            self._atomic_write(target, lambda f: _compress_stream(self._compression, src, f))
+        path.unlink()
+
+    def stat_translated(self, job_id: str) -> Optional[StoredObject]:
+        path = self._translated_path(job_id)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+
+        try:
+            digest = self._digest_path(path).read_text().strip()
+        except FileNotFoundError:
+            # 해시 파일 도입 이전에 저장된 번역본: 조회 경로에서는 쓰지 않고 메모리에서만 계산한다.
+            # 해시 파일은 migrate_layout() 이 만든다.
+            digest = _sha256_file(path)
+
+        return StoredObject(size=st.st_size, modified_at=int(st.st_mtime), etag=digest)
+
+    def iter_translated(
+        self,
+        job_id: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        with self._translated_path(job_id).open("rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                data = f.read(size)
+                if not data:
+                    break
+                if remaining is not None:
+                    remaining -= len(data)
+                yield data
+
+    def _artifact_dir(self, job_id: str) -> Path:
+        a, b = self._shard(job_id)
+        return self._base_dir / "artifacts" / a / b / job_id
+
+    def _artifact_path(self, job_id: str, name: str) -> Path:
+        root = self._artifact_dir(job_id)
+        path = (root / name).resolve()
+        if not path.is_relative_to(root.resolve()):
+            raise ValueError(f"Invalid artifact name: {name}")
+        return path
+
+    def save_artifact(self, job_id: str, name: str, data: bytes) -> str:
+        path = self._artifact_path(job_id, name)
+        self._atomic_write(path, lambda f: f.write(data))
+        return str(path)
+
+    def load_artifact(self, job_id: str, name: str) -> Optional[bytes]:
+        try:
+            return self._artifact_path(job_id, name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def delete_artifacts(self, job_id: str) -> None:
+        shutil.rmtree(self._artifact_dir(job_id), ignore_errors=True)
+
+    def delete_original(self, job_id: str) -> None:
+        self._original_path(job_id).unlink(missing_ok=True)
+        for _method, compressed in self._compressed_original_paths(job_id):
+            compressed.unlink(missing_ok=True)
 
     def delete_translated(self, job_id: str) -> None:
         path = self._translated_path(job_id)
-        if path.exists():
-            path.unlink()
+        path.unlink(missing_ok=True)
+        self._digest_path(path).unlink(missing_ok=True)
+
+    def job_ids(self) -> List[str]:
+        """원본/번역 파일이나 아티팩트가 남아 있는 job_id 목록 (샤딩/평면 구조 모두)."""
+
+        suffixes = (".pdf",) + tuple(f".pdf{suffix}" for suffix in self.COMPRESSION_SUFFIXES.values())
+        found = set()
+        for kind in ("original", "translated"):
+            for _dirpath, _dirnames, filenames in os.walk(self._base_dir / kind):
+                for name in filenames:
+                    if name.startswith("."):
+                        continue
+                    for suffix in suffixes:
+                        if name.endswith(suffix):
+                            found.add(name[: -len(suffix)])
+                            break
+        artifacts = self._base_dir / "artifacts"
+        if artifacts.is_dir():
+            found.update(path.name for path in artifacts.glob("*/*/*") if path.is_dir())
+        return sorted(found)
+
+    def artifact_names(self, job_id: str) -> List[str]:
+        root = self._artifact_dir(job_id)
+        if not root.is_dir():
+            return []
+        return sorted(
+            path.relative_to(root).as_posix()
+            for path in root.rglob("*")
+            if path.is_file() and not path.name.startswith(".")
+        )
+
+    def migrate_layout(self) -> int:
+        """평면 구조에 남아 있는 파일을 모두 샤딩 경로로 옮기고, 실제로 옮긴 파일 수를 반환한다.
+
+        해시 파일이 없는 번역본에는 ETag 용 해시 파일을 함께 만든다.
+        """
+
+        moved = 0
+        for kind in ("original", "translated"):
+            root = self._base_dir / kind
+            if not root.is_dir():
+                continue
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if not entry.is_file() or not entry.name.endswith(".pdf"):
+                        continue
+                    job_id = entry.name[: -len(".pdf")]
+                    if self._move_legacy(Path(entry.path), self._sharded_path(kind, job_id)):
+                        moved += 1
+
+        translated = self._base_dir / "translated"
+        if translated.is_dir():
+            for path in translated.glob("*/*/*.pdf"):
+                if not self._digest_path(path).exists():
+                    self._write_digest(path)
+        return moved
+
+
+def _compress_stream(method: str, src: BinaryIO, dst: BinaryIO) -> None:
+    if method == "zstd":
+        # zstandard 는 zstd 압축을 켰을 때만 필요하다.
+        import zstandard
+
+        zstandard.ZstdCompressor(level=10).copy_stream(src, dst)
+    elif method == "deflate":
+        with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6, mtime=0) as gz:
+            shutil.copyfileobj(src, gz, DEFAULT_CHUNK_SIZE)
+    else:
+        raise ValueError(f"Unsupported compression: {method}")
+
+
+def _decompress_stream(method: str, src: BinaryIO, dst: BinaryIO) -> None:
+    if method == "zstd":
+        import zstandard
+
+        zstandard.ZstdDecompressor().copy_stream(src, dst)
+    elif method == "deflate":
+        with gzip.GzipFile(fileobj=src, mode="rb") as gz:
+            shutil.copyfileobj(gz, dst, DEFAULT_CHUNK_SIZE)
+    else:
+        raise ValueError(f"Unsupported compression: {method}")
+
+
+class S3Storage(Storage):
+    """S3 호환 오브젝트 스토리지(AWS S3, MinIO 등) 기반 Storage 구현.
+
+    구조:
+    - s3://{bucket}/original/{job_id}.pdf
+    - s3://{bucket}/translated/{job_id}.pdf
+    - s3://{bucket}/artifacts/{job_id}/{name}
+
+    - 업로드는 boto3 TransferConfig 기반 multipart 스트리밍으로 수행한다.
+    - 다운로드는 presigned URL 리다이렉트를 기본으로 하여 API가 파일 바이트를 중계하지 않는다.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        public_endpoint_url: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        region: Optional[str] = None,
+        presign_expires: int = 600,
+        multipart_chunk_size: int = 8 * 1024 * 1024,
+    ) -> None:
+        # boto3 는 S3 백엔드를 쓸 때만 필요하므로 지연 임포트한다.
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+
+        session = boto3.session.Session(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+        )
+        self._bucket = bucket
+        self._client = session.client("s3", endpoint_url=endpoint_url)
+        # presigned URL 은 브라우저가 접근 가능한 엔드포인트 기준으로 서명해야 한다.
+        if public_endpoint_url and public_endpoint_url != endpoint_url:
+            self._presign_client = session.client("s3", endpoint_url=public_endpoint_url)
+        else:
+            self._presign_client = self._client
+        self._presign_expires = presign_expires
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunk_size,
+            multipart_chunksize=multipart_chunk_size,
+        )
+
+    @staticmethod
+    def _original_key(job_id: str) -> str:
+        return f"original/{job_id}.pdf"
+
+    @staticmethod
+    def _translated_key(job_id: str) -> str:
+        return f"translated/{job_id}.pdf"
+
+    @staticmethod
+    def _is_not_found(exc: Exception) -> bool:
+        code = getattr(exc, "response", {}).get("Error", {}).get("Code")
+        return code in ("404", "NoSuchKey", "NotFound", "NoSuchBucket")
+
+    def ensure_bucket(self) -> None:
+        """버킷이 없으면 생성한다 (마이그레이션 단계에서 호출)."""
+
+        from botocore.exceptions import ClientError
+
+        try:
+            self._client.head_bucket(Bucket=self._bucket)
+        except ClientError as exc:
+            if not self._is_not_found(exc):
+                raise
+            self._client.create_bucket(Bucket=self._bucket)
+
+    def save_original(self, job_id: str, data: bytes) -> str:
+        key = self._original_key(job_id)
+        self._client.put_object(Bucket=self._bucket, Key=key, Body=data, ContentType="application/pdf")
+        return self._uri(key)
+
+    def save_original_stream(self, job_id: str, stream: BinaryIO) -> str:
+        key = self._original_key(job_id)
+        self._client.upload_fileobj(
+            stream,
+            self._bucket,
+            key,
+            ExtraArgs={"ContentType": "application/pdf"},
+            Config=self._transfer_config,
+        )
+        return self._uri(key)
+
+    def save_translated(self, job_id: str, data: bytes) -> str:
+        key = self._translated_key(job_id)
+        self._client.put_object(
+            Bucket=self._bucket,
+            Key=key,
+            Body=data,
+            ContentType="application/pdf",
+            Metadata={"sha256": hashlib.sha256(data).hexdigest()},
+        )
+        return self._uri(key)
+
+    def save_translated_file(self, job_id: str, src: Path) -> str:
+        key = self._translated_key(job_id)
+        self._client.upload_file(
+            str(src),
+            self._bucket,
+            key,
+            ExtraArgs={
+                "ContentType": "application/pdf",
+                # multipart ETag 는 청크 크기에 따라 달라지므로 내용 해시를 메타데이터로 함께 저장한다.
+                "Metadata": {"sha256": _sha256_file(Path(src))},
+            },
+            Config=self._transfer_config,
+        )
+        return self._uri(key)
+
+    def _uri(self, key: str) -> str:
+        return f"s3://{self._bucket}/{key}"
+
+    def get_original_path(self, job_id: str) -> str:
+        return self._uri(self._original_key(job_id))
+
+    def get_translated_path(self, job_id: str) -> str:
+        return self._uri(self._translated_key(job_id))
+
+    def fetch_original(self, job_id: str, workdir: Path) -> Optional[Path]:
+        from botocore.exceptions import ClientError
+
+        dest = Path(workdir) / f"{job_id}.pdf"
+        try:
+            self._client.download_file(
+                self._bucket,
+                self._original_key(job_id),
+                str(dest),
+                Config=self._transfer_config,
+            )
+        except ClientError as exc:
+            if self._is_not_found(exc):
+                return None
+            raise
+        return dest
+
+    def has_original(self, job_id: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self._client.head_object(Bucket=self._bucket, Key=self._original_key(job_id))
+        except ClientError as exc:
+            if self._is_not_found(exc):
+                return False
+            raise
+        return True
+
+    def stat_translated(self, job_id: str) -> Optional[StoredObject]:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self._client.head_object(Bucket=self._bucket, Key=self._translated_key(job_id))
+        except ClientError as exc:
+            if self._is_not_found(exc):
+                return None
+            raise
+        etag = head.get("Metadata", {}).get("sha256") or head.get("ETag", "").strip('"') or None
+        return StoredObject(
+            size=int(head["ContentLength"]),
+            modified_at=int(head["LastModified"].timestamp()),
+            etag=etag,
+        )
+
+    def iter_translated(
+        self,
+        job_id: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        params = {"Bucket": self._bucket, "Key": self._translated_key(job_id)}
+        if start or end is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+        body = self._client.get_object(**params)["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def get_translated_url(self, job_id: str, *, filename: str) -> Optional[str]:
+        return self._presign_client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self._bucket,
+                "Key": self._translated_key(job_id),
+                "ResponseContentDisposition": f'attachment; filename="{filename}"',
+            },
+            ExpiresIn=self._presign_expires,
+        )
+
+    @staticmethod
+    def _artifact_prefix(job_id: str) -> str:
+        return f"artifacts/{job_id}/"
+
+    def save_artifact(self, job_id: str, name: str, data: bytes) -> str:
+        key = self._artifact_prefix(job_id) + name
+        self._client.put_object(Bucket=self._bucket, Key=key, Body=data)
+        return self._uri(key)
+
+    def load_artifact(self, job_id: str, name: str) -> Optional[bytes]:
+        from botocore.exceptions import ClientError
+
+        try:
+            body = self._client.get_object(Bucket=self._bucket, Key=self._artifact_prefix(job_id) + name)["Body"]
+        except ClientError as exc:
+            if self._is_not_found(exc):
+                return None
+            raise
+        try:
+            return body.read()
+        finally:
+            body.close()
+
+    def delete_artifacts(self, job_id: str) -> None:
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._bucket, Prefix=self._artifact_prefix(job_id)):
+            keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+            if keys:
+                self._client.delete_objects(Bucket=self._bucket, Delete={"Objects": keys, "Quiet": True})
+
+    def delete_original(self, job_id: str) -> None:
+        # S3 DeleteObject 는 키가 없어도 성공한다.
+        self._client.delete_object(Bucket=self._bucket, Key=self._original_key(job_id))
+
+    def delete_translated(self, job_id: str) -> None:
+        self._client.delete_object(Bucket=self._bucket, Key=self._translated_key(job_id))
 
 
 def get_storage() -> Storage:
-    """현재 설정에 따른 Storage 인스턴스를 반환한다.
+    """현재 설정(settings.storage_backend)에 따른 Storage 인스턴스를 반환한다.
 
-    v1.0.0에서는 로컬 스토리지만 지원하며, 이후 S3/MinIO 등으로 확장 가능하다.
+    - local: 로컬 디렉터리 (settings.data_dir)
+    - s3 / minio: S3 호환 오브젝트 스토리지 (settings.minio_*)
     """
 
-    base_dir = getattr(settings, "data_dir", "/data")
-    # storage_backend 설정은 향후 S3/MinIO 도입 시 분기용으로 사용한다.
-    _backend = getattr(settings, "storage_backend", "local")
-    return LocalStorage(base_dir=base_dir)
+    backend = getattr(settings, "storage_backend", "local").lower()
+
+    if backend == "local":
+        base_dir = getattr(settings, "data_dir", "/data")
+        return LocalStorage(
+            base_dir=base_dir,
+            compression=settings.local_original_compression,
+            fsync=settings.local_fsync,
+        )
+
+    if backend in ("s3", "minio"):
+        return S3Storage(
+            bucket=settings.minio_bucket,
+            endpoint_url=settings.minio_endpoint,
+            public_endpoint_url=settings.minio_public_endpoint,
+            access_key=settings.minio_access_key,
+            secret_key=settings.minio_secret_key,
+            region=settings.minio_region,
+            presign_expires=settings.storage_presign_expires_seconds,
+            multipart_chunk_size=settings.storage_multipart_chunk_mb * 1024 * 1024,
+        )
+
+    raise ValueError(f"Unsupported storage backend: {backend}")
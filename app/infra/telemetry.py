@@ -0,0 +1,321 @@
+"""Prometheus 메트릭 / OpenTelemetry 트레이싱 계층.
+
+- 비활성화(기본값) 상태에서는 재사용 가능한 no-op 컨텍스트를 반환해 오버헤드가 거의 없다.
+- prometheus_client / opentelemetry 는 활성화했을 때만 임포트한다.
+- 현재 처리 중인 job_id 를 ContextVar 로 전파해 span 속성에 자동으로 포함한다.
+
+    with telemetry.job_context(job_id):
+        with telemetry.timed("pdf.extract_pages", stage="parse"):
+            ...
+"""
+
+import functools
+import logging
+import os
+import shutil
+import time
+import weakref
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+current_job_id: ContextVar[Optional[str]] = ContextVar("current_job_id", default=None)
+
+_NOOP = nullcontext()
+
+_metrics_enabled = False
+_tracing_enabled = False
+_registry = None
+_metrics: Dict[str, Any] = {}
+# 레지스트리별로 한 번만 메트릭을 등록한다 (같은 이름을 다시 등록하면 prometheus_client 가 예외를 낸다).
+_registered: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_tracer = None
+_tracer_provider_configured = False
+
+
+def configure(
+    *,
+    metrics: Optional[bool] = None,
+    tracing: Optional[bool] = None,
+    registry=None,
+) -> None:
+    """설정값(또는 인자)에 따라 메트릭/트레이싱을 초기화한다.
+
+    여러 번 호출해도 안전하다. 같은 레지스트리의 메트릭은 처음 만든 것을 재사용한다.
+    """
+
+    global _metrics_enabled, _registry
+
+    _metrics_enabled = settings.metrics_enabled if metrics is None else metrics
+    _metrics.clear()
+
+    if _metrics_enabled:
+        prepare_multiprocess_dir(clear=False)
+        from prometheus_client import REGISTRY
+
+        _registry = registry or REGISTRY
+        created = _registered.get(_registry)
+        if created is None:
+            created = _create_metrics(_registry)
+            _registered[_registry] = created
+        _metrics.update(created)
+
+    configure_tracing(tracing)
+
+
+def prepare_multiprocess_dir(*, clear: bool) -> None:
+    """PROMETHEUS_MULTIPROC_DIR 가 설정되어 있으면 디렉터리를 만든다.
+
+    clear=True 면 이전 기동에서 남은 값 파일을 지운다. 여러 프로세스가 같은 디렉터리를 쓰므로
+    메트릭을 기록하기 전에, 프로세스들을 띄우는 쪽(Celery 워커 부모)에서 한 번만 호출한다.
+    """
+
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        return
+    if clear:
+        shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def configure_tracing(tracing: Optional[bool] = None) -> None:
+    """트레이싱만 초기화한다.
+
+    span 내보내기 스레드는 fork 후 자식 프로세스에 남지 않으므로 prefork 자식에서 다시 호출한다.
+    (메트릭은 부모에서 등록한 것을 그대로 물려받으므로 다시 만들지 않는다.)
+    """
+
+    global _tracing_enabled, _tracer
+
+    _tracing_enabled = settings.tracing_enabled if tracing is None else tracing
+    if _tracing_enabled:
+        from opentelemetry import trace
+
+        _configure_tracer_provider()
+        _tracer = trace.get_tracer("paper_translator")
+
+
+def _configure_tracer_provider() -> None:
+    """전역 TracerProvider 를 OTLP(HTTP) exporter 로 프로세스당 한 번 설정한다.
+
+    opentelemetry-sdk / opentelemetry-exporter-otlp-proto-http 가 없으면 경고를 남기고,
+    opentelemetry-instrument 등 외부에서 설정한 provider 를 그대로 사용한다.
+    """
+
+    global _tracer_provider_configured
+
+    if _tracer_provider_configured:
+        return
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError as exc:
+        logger.warning("tracing enabled but OTLP exporter is unavailable (%s); spans are not exported", exc)
+        return
+
+    _tracer_provider_configured = True
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.otel_service_name}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+
+
+def _create_metrics(registry) -> Dict[str, Any]:
+    from prometheus_client import Counter, Histogram
+
+    metrics: Dict[str, Any] = {}
+
+    metrics["queue_wait"] = Histogram(
+        "paper_job_queue_wait_seconds",
+        "업로드(enqueue)부터 워커가 Job을 시작하기까지의 대기 시간",
+        buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600),
+        registry=registry,
+    )
+    metrics["stage"] = Histogram(
+        "paper_pipeline_stage_seconds",
+        "번역 파이프라인 단계별 소요 시간",
+        ["stage"],
+        registry=registry,
+    )
+    metrics["llm_request"] = Histogram(
+        "paper_llm_request_seconds",
+        "LLM 요청 지연",
+        ["model", "outcome"],
+        buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60, 120),
+        registry=registry,
+    )
+    metrics["llm_tokens"] = Counter(
+        "paper_llm_tokens",
+        "LLM 토큰 사용량",
+        ["model", "kind"],
+        registry=registry,
+    )
+    metrics["llm_route"] = Counter(
+        "paper_llm_route",
+        "모델 라우팅 결과 (primary: 1차 요청, fallback: 타임아웃 후 보조 모델)",
+        ["model", "attempt"],
+        registry=registry,
+    )
+    metrics["db_query"] = Histogram(
+        "paper_db_query_seconds",
+        "JobRepository 쿼리 소요 시간",
+        ["operation"],
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+        registry=registry,
+    )
+    metrics["jobs"] = Counter(
+        "paper_jobs",
+        "종료 상태별 번역 Job 수",
+        ["status"],
+        registry=registry,
+    )
+    metrics["admission"] = Counter(
+        "paper_upload_admission",
+        "업로드 승인 제어 결과",
+        ["outcome"],
+        registry=registry,
+    )
+    metrics["http_request"] = Histogram(
+        "paper_http_request_seconds",
+        "API 요청 처리 시간",
+        ["method", "route", "status"],
+        registry=registry,
+    )
+    return metrics
+
+
+def metrics_enabled() -> bool:
+    return _metrics_enabled
+
+
+def enabled() -> bool:
+    return _metrics_enabled or _tracing_enabled
+
+
+@contextmanager
+def job_context(job_id: str) -> Iterator[None]:
+    """블록 안에서 생성되는 span 에 job_id 를 붙인다."""
+
+    token = current_job_id.set(job_id)
+    try:
+        yield
+    finally:
+        current_job_id.reset(token)
+
+
+def _span(name: str, attributes: Dict[str, Any]):
+    job_id = current_job_id.get()
+    if job_id is not None:
+        attributes = {**attributes, "job_id": job_id}
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+@contextmanager
+def _timed(name: str, metric: Optional[str], labels: Dict[str, str]) -> Iterator[None]:
+    span_cm = _span(name, labels) if _tracing_enabled else _NOOP
+    started = time.perf_counter()
+    try:
+        with span_cm:
+            yield
+    finally:
+        if metric is not None and _metrics_enabled:
+            _metrics[metric].labels(**labels).observe(time.perf_counter() - started)
+
+
+def timed(name: str, metric: Optional[str] = None, **labels: str):
+    """span 을 열고, metric 이 주어지면 소요 시간을 히스토그램에 기록한다.
+
+    - stage=... 를 넘기면 파이프라인 단계 히스토그램(paper_pipeline_stage_seconds)에 기록한다.
+    """
+
+    if not (_metrics_enabled or _tracing_enabled):
+        return _NOOP
+    if metric is None and "stage" in labels:
+        metric = "stage"
+    return _timed(name, metric, labels)
+
+
+def traced_query(operation: str) -> Callable:
+    """JobRepository 메서드용 데코레이터: DB span + 쿼리 시간 히스토그램."""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not (_metrics_enabled or _tracing_enabled):
+                return fn(*args, **kwargs)
+            with _timed(f"db.{operation}", "db_query", {"operation": operation}):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def observe_llm_request(model: str, outcome: str, seconds: float, usage: Any = None) -> None:
+    if not _metrics_enabled:
+        return
+    _metrics["llm_request"].labels(model=model, outcome=outcome).observe(seconds)
+    if usage is not None:
+        _metrics["llm_tokens"].labels(model=model, kind="prompt").inc(getattr(usage, "prompt_tokens", 0) or 0)
+        _metrics["llm_tokens"].labels(model=model, kind="completion").inc(
+            getattr(usage, "completion_tokens", 0) or 0
+        )
+
+
+def count_llm_route(model: str, attempt: str) -> None:
+    if _metrics_enabled:
+        _metrics["llm_route"].labels(model=model, attempt=attempt).inc()
+
+
+def observe_queue_wait(seconds: float) -> None:
+    if _metrics_enabled:
+        _metrics["queue_wait"].observe(max(seconds, 0.0))
+
+
+def count_job(status: str) -> None:
+    if _metrics_enabled:
+        _metrics["jobs"].labels(status=status).inc()
+
+
+def count_admission(outcome: str) -> None:
+    if _metrics_enabled:
+        _metrics["admission"].labels(outcome=outcome).inc()
+
+
+def observe_http_request(method: str, route: str, status: int, seconds: float) -> None:
+    if _metrics_enabled:
+        _metrics["http_request"].labels(method=method, route=route, status=str(status)).observe(seconds)
+
+
+def _exposition_registry():
+    # 멀티 프로세스(gunicorn/Celery prefork)에서는 PROMETHEUS_MULTIPROC_DIR 의 값을 합산한다.
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import CollectorRegistry, multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return _registry
+
+
+def render_latest() -> tuple[bytes, str]:
+    """/metrics 응답 본문과 Content-Type 을 반환한다."""
+
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+    return generate_latest(_exposition_registry()), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int) -> None:
+    """워커용 /metrics HTTP 서버를 띄운다."""
+
+    from prometheus_client import start_http_server
+
+    start_http_server(port, registry=_exposition_registry())
@@ -0,0 +1,443 @@
+"""번역 메모리(Translation Memory)와 용어집(Glossary).
+
+- 번역 메모리: 문단(segment) 단위 원문→번역 쌍을 저장하고,
+  정확 일치(정규화 해시)와 유사 일치(단어 3-gram MinHash + LSH 밴딩)로 조회한다.
+- 용어집: 도메인 용어의 고정 번역을 보관하고, 청크에 등장하는 용어만 골라 프롬프트에 주입한다.
+
+저장소 구현은 두 가지다.
+- InMemoryTranslationMemory: 테스트/벤치마크용
+- PostgresTranslationMemory: 운영용 (band_keys BIGINT[] + GIN 인덱스로 후보 조회)
+"""
+
+import hashlib
+import re
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+from app.infra.telemetry import traced_query
+
+
+DEFAULT_LANG_PAIR = "en-ko"
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_segment(text: str) -> str:
+    """공백 차이를 무시하기 위해 연속 공백을 하나로 합친다."""
+
+    return _WS_RE.sub(" ", text).strip()
+
+
+def segment_key(lang_pair: str, text: str) -> str:
+    """정확 일치 조회용 키 (언어쌍 + 정규화 원문의 해시)."""
+
+    normalized = normalize_segment(text)
+    return hashlib.sha1(f"{lang_pair}\x00{normalized}".encode("utf-8")).hexdigest()
+
+
+class MinHasher:
+    """단어 n-gram(shingle) 기반 MinHash 서명과 LSH 밴드 키 생성기.
+
+    shingle 해시는 crc32, 순열은 고정 시드와의 XOR 로 근사해 순수 파이썬에서도 빠르게 계산한다.
+    밴드 수(bands) × 밴드당 행 수(rows) = 서명 길이이며, 두 문단의 Jaccard 유사도가
+    대략 (1/bands)^(1/rows) 이상이면 높은 확률로 같은 밴드 키를 공유한다.
+    문자 n-gram 은 서로 무관한 문단끼리도 겹치는 조각이 많아 후보가 폭증하므로 단어 단위를 쓴다.
+    """
+
+    def __init__(self, *, ngram: int = 3, bands: int = 8, rows: int = 4, seed: int = 1) -> None:
+        self.ngram = ngram
+        self.bands = bands
+        self.rows = rows
+        state = seed
+        masks: List[int] = []
+        for _ in range(bands * rows):
+            # 결정적(프로세스/재시작과 무관한) 32비트 마스크 — 저장된 band_keys 와 호환되어야 한다.
+            state = (state * 6364136223846793005 + 1442695040888963407) & 0xFFFFFFFFFFFFFFFF
+            masks.append(state >> 32)
+        self._masks = masks
+
+    def shingles(self, text: str) -> FrozenSet[int]:
+        words = normalize_segment(text).lower().split(" ")
+        n = self.ngram
+        if len(words) <= n:
+            return frozenset((zlib.crc32(" ".join(words).encode("utf-8")),))
+        return frozenset(
+            zlib.crc32(" ".join(words[i : i + n]).encode("utf-8")) for i in range(len(words) - n + 1)
+        )
+
+    def band_keys(self, shingles: FrozenSet[int]) -> List[int]:
+        signature = [min(map(mask.__xor__, shingles)) for mask in self._masks]
+        keys: List[int] = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows : (band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                repr((band, chunk)).encode("ascii"), digest_size=8
+            ).digest()
+            # Postgres BIGINT 범위에 맞춘 부호 있는 64비트 정수
+            keys.append(int.from_bytes(digest, "big", signed=True))
+        return keys
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass(frozen=True)
+class MemoryMatch:
+    source: str
+    target: str
+    score: float  # 1.0 = 정확 일치
+
+    @property
+    def exact(self) -> bool:
+        """정확 일치만 번역을 그대로 재사용한다.
+
+        유사 일치는 숫자/이름 한 단어만 달라도 점수가 높으므로("10 epochs" ↔ "50 epochs"),
+        번역을 대신하지 않고 LLM 에 참고 번역으로만 넘긴다.
+        """
+
+        return self.score >= 1.0
+
+
+class TranslationMemory(ABC):
+    """번역 메모리 저장소 추상화."""
+
+    def __init__(
+        self,
+        *,
+        fuzzy_threshold: float = 0.92,
+        min_chars: int = 40,
+        hasher: Optional[MinHasher] = None,
+    ) -> None:
+        self.fuzzy_threshold = fuzzy_threshold
+        self.min_chars = min_chars
+        self._hasher = hasher or MinHasher()
+
+    def eligible(self, text: str) -> bool:
+        """너무 짧은 문단(번호, 제목 조각 등)은 재사용/저장 대상에서 제외한다."""
+
+        return len(normalize_segment(text)) >= self.min_chars
+
+    def lookup_many(
+        self,
+        segments: Sequence[str],
+        *,
+        lang_pair: str = DEFAULT_LANG_PAIR,
+    ) -> List[Optional[MemoryMatch]]:
+        """segments 각각에 대해 정확 일치 또는 유사 일치(참고용) 번역을 찾는다."""
+
+        results: List[Optional[MemoryMatch]] = [None] * len(segments)
+        indices = [i for i, seg in enumerate(segments) if self.eligible(seg)]
+        if not indices:
+            return results
+
+        keys = {i: segment_key(lang_pair, segments[i]) for i in indices}
+        exact = self._get_exact(lang_pair, list(set(keys.values())))
+
+        pending: Dict[int, Tuple[FrozenSet[int], List[int]]] = {}
+        for i in indices:
+            hit = exact.get(keys[i])
+            if hit is not None:
+                results[i] = MemoryMatch(source=hit[0], target=hit[1], score=1.0)
+            else:
+                shingles = self._hasher.shingles(segments[i])
+                pending[i] = (shingles, self._hasher.band_keys(shingles))
+
+        if pending:
+            all_band_keys = sorted({k for _s, bands in pending.values() for k in bands})
+            candidates = self._get_candidates(lang_pair, all_band_keys)
+            # 같은 후보가 여러 문단과 비교되므로 후보 shingle 은 조회당 한 번만 계산한다.
+            candidate_shingles: Dict[str, FrozenSet[int]] = {}
+            for i, (shingles, bands) in pending.items():
+                results[i] = self._best_candidate(shingles, set(bands), candidates, candidate_shingles)
+
+        return results
+
+    def _best_candidate(
+        self,
+        shingles: FrozenSet[int],
+        bands: set,
+        candidates: Iterable[Tuple[str, str, Sequence[int]]],
+        candidate_shingles: Dict[str, FrozenSet[int]],
+    ) -> Optional[MemoryMatch]:
+        best: Optional[MemoryMatch] = None
+        for source, target, cand_bands in candidates:
+            if bands.isdisjoint(cand_bands):
+                continue
+            cand = candidate_shingles.get(source)
+            if cand is None:
+                cand = candidate_shingles[source] = self._hasher.shingles(source)
+            score = jaccard(shingles, cand)
+            if score >= self.fuzzy_threshold and (best is None or score > best.score):
+                best = MemoryMatch(source=source, target=target, score=score)
+        return best
+
+    def add_many(self, pairs: Iterable[Tuple[str, str]], *, lang_pair: str = DEFAULT_LANG_PAIR) -> int:
+        """(원문, 번역) 쌍을 저장하고 저장 대상이 된 개수를 반환한다."""
+
+        rows = []
+        seen = set()
+        for source, target in pairs:
+            if not self.eligible(source) or not target.strip():
+                continue
+            key = segment_key(lang_pair, source)
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append((key, source, target, self._hasher.band_keys(self._hasher.shingles(source))))
+        if rows:
+            self._insert(lang_pair, rows)
+        return len(rows)
+
+    @abstractmethod
+    def _get_exact(self, lang_pair: str, keys: List[str]) -> Dict[str, Tuple[str, str]]:
+        """key → (원문, 번역)"""
+
+    @abstractmethod
+    def _get_candidates(self, lang_pair: str, band_keys: List[int]) -> List[Tuple[str, str, Sequence[int]]]:
+        """band_keys 중 하나라도 공유하는 (원문, 번역, band_keys) 후보 목록.
+
+        후보 수에 상한을 두는 구현은 공유하는 밴드 키가 많은(유사할 가능성이 높은) 후보부터 남긴다.
+        """
+
+    @abstractmethod
+    def _insert(self, lang_pair: str, rows: List[Tuple[str, str, str, List[int]]]) -> None:
+        """(key, 원문, 번역, band_keys) 행을 저장한다 (이미 있으면 무시)."""
+
+
+class InMemoryTranslationMemory(TranslationMemory):
+    """메모리 기반 번역 메모리 (테스트/벤치마크용)."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._entries: Dict[str, Tuple[str, str, List[int]]] = {}
+        self._bands: Dict[Tuple[str, int], List[str]] = {}  # (언어쌍, 밴드 키) → 항목 키
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_exact(self, lang_pair: str, keys: List[str]) -> Dict[str, Tuple[str, str]]:
+        found = {}
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None:
+                found[key] = (entry[0], entry[1])
+        return found
+
+    def _get_candidates(self, lang_pair: str, band_keys: List[int]) -> List[Tuple[str, str, Sequence[int]]]:
+        keys = {key for band in band_keys for key in self._bands.get((lang_pair, band), ())}
+        return [self._entries[key] for key in keys]
+
+    def _insert(self, lang_pair: str, rows: List[Tuple[str, str, str, List[int]]]) -> None:
+        for key, source, target, bands in rows:
+            if key in self._entries:
+                continue
+            self._entries[key] = (source, target, bands)
+            for band in bands:
+                self._bands.setdefault((lang_pair, band), []).append(key)
+
+
+class PostgresTranslationMemory(TranslationMemory):
+    """PostgreSQL 기반 번역 메모리 / 용어집 저장소.
+
+    테이블:
+    - translation_memory(key PK, lang_pair, source_text, target_text, band_keys BIGINT[], created_at, expires_at)
+      - band_keys 에 GIN 인덱스를 두어 `band_keys && ARRAY[...]` 로 유사 후보를 한 번에 조회한다.
+    - glossary(lang_pair, term, translation)
+    """
+
+    def __init__(self, db_url: str, *, ttl_days: Optional[int] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._db_url = db_url
+        self._ttl_days = ttl_days
+
+    def _get_conn(self):
+        return psycopg2.connect(self._db_url)
+
+    def migrate(self) -> None:
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS translation_memory (
+                        key TEXT PRIMARY KEY,
+                        lang_pair TEXT NOT NULL,
+                        source_text TEXT NOT NULL,
+                        target_text TEXT NOT NULL,
+                        band_keys BIGINT[] NOT NULL,
+                        created_at BIGINT NOT NULL,
+                        expires_at BIGINT
+                    )
+                    """
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS translation_memory_band_keys_idx "
+                    "ON translation_memory USING GIN (band_keys)"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS translation_memory_expires_at_idx "
+                    "ON translation_memory (expires_at)"
+                )
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS glossary (
+                        lang_pair TEXT NOT NULL,
+                        term TEXT NOT NULL,
+                        translation TEXT NOT NULL,
+                        PRIMARY KEY (lang_pair, term)
+                    )
+                    """
+                )
+                conn.commit()
+
+    @traced_query("tm_get_exact")
+    def _get_exact(self, lang_pair: str, keys: List[str]) -> Dict[str, Tuple[str, str]]:
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT key, source_text, target_text
+                    FROM translation_memory
+                    WHERE key = ANY(%s)
+                      AND (expires_at IS NULL OR expires_at > %s)
+                    """,
+                    (keys, int(time.time())),
+                )
+                rows = cur.fetchall()
+        return {key: (source, target) for key, source, target in rows}
+
+    @traced_query("tm_get_candidates")
+    def _get_candidates(self, lang_pair: str, band_keys: List[int]) -> List[Tuple[str, str, Sequence[int]]]:
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT source_text, target_text, band_keys
+                    FROM translation_memory
+                    WHERE lang_pair = %(lang_pair)s
+                      AND band_keys && %(band_keys)s::BIGINT[]
+                      AND (expires_at IS NULL OR expires_at > %(now)s)
+                    ORDER BY cardinality(ARRAY(
+                        SELECT unnest(band_keys) INTERSECT SELECT unnest(%(band_keys)s::BIGINT[])
+                    )) DESC
+                    LIMIT %(limit)s
+                    """,
+                    # 흔한 문구가 후보를 폭증시키지 않도록 밴드 키당 상한을 두되,
+                    # 밴드 키를 많이 공유하는 후보부터 남겨 진짜 유사 문단이 잘리지 않게 한다.
+                    {
+                        "lang_pair": lang_pair,
+                        "band_keys": band_keys,
+                        "now": int(time.time()),
+                        "limit": 8 * len(band_keys),
+                    },
+                )
+                return cur.fetchall()
+
+    @traced_query("tm_insert")
+    def _insert(self, lang_pair: str, rows: List[Tuple[str, str, str, List[int]]]) -> None:
+        now = int(time.time())
+        expires_at = now + self._ttl_days * 24 * 60 * 60 if self._ttl_days else None
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO translation_memory
+                        (key, lang_pair, source_text, target_text, band_keys, created_at, expires_at)
+                    VALUES %s
+                    ON CONFLICT (key) DO NOTHING
+                    """,
+                    [(key, lang_pair, source, target, bands, now, expires_at) for key, source, target, bands in rows],
+                )
+                conn.commit()
+
+    @traced_query("tm_delete_expired")
+    def delete_expired(self, *, now: Optional[int] = None) -> int:
+        """보관 기한이 지난 번역 메모리 항목을 삭제하고 삭제 건수를 반환한다."""
+
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM translation_memory WHERE expires_at IS NOT NULL AND expires_at <= %s",
+                    (now or int(time.time()),),
+                )
+                deleted = cur.rowcount
+                conn.commit()
+        return deleted
+
+    @traced_query("glossary_load")
+    def load_glossary(self, lang_pair: str = DEFAULT_LANG_PAIR) -> "Glossary":
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT term, translation FROM glossary WHERE lang_pair = %s",
+                    (lang_pair,),
+                )
+                rows = cur.fetchall()
+        return Glossary(dict(rows))
+
+    @traced_query("glossary_load_all")
+    def load_glossaries(self) -> Dict[str, "Glossary"]:
+        """언어쌍 → 용어집 (워커 기동 시 모든 언어쌍을 한 번에 읽는다)."""
+
+        entries: Dict[str, Dict[str, str]] = {}
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT lang_pair, term, translation FROM glossary")
+                for lang_pair, term, translation in cur.fetchall():
+                    entries.setdefault(lang_pair, {})[term] = translation
+        return {lang_pair: Glossary(terms) for lang_pair, terms in entries.items()}
+
+    @traced_query("glossary_upsert")
+    def upsert_glossary(self, entries: Dict[str, str], *, lang_pair: str = DEFAULT_LANG_PAIR) -> None:
+        if not entries:
+            return
+        with self._get_conn() as conn:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO glossary (lang_pair, term, translation)
+                    VALUES %s
+                    ON CONFLICT (lang_pair, term) DO UPDATE SET translation = EXCLUDED.translation
+                    """,
+                    [(lang_pair, term, translation) for term, translation in entries.items()],
+                )
+                conn.commit()
+
+
+class Glossary:
+    """용어집. 등록된 용어를 하나의 정규식으로 컴파일해 청크에서 한 번에 찾는다."""
+
+    def __init__(self, entries: Dict[str, str]) -> None:
+        self._entries = {term.lower(): (term, translation) for term, translation in entries.items()}
+        self._pattern: Optional[re.Pattern] = None
+        if entries:
+            # 긴 용어를 먼저 시도해 "neural network" 가 "network" 보다 우선하도록 한다.
+            terms = sorted(entries, key=len, reverse=True)
+            self._pattern = re.compile(
+                r"(?<!\w)(" + "|".join(re.escape(t) for t in terms) + r")(?!\w)",
+                re.IGNORECASE,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find(self, text: str) -> Dict[str, str]:
+        """text 에 등장하는 용어 → 번역 (등장 순서 유지)."""
+
+        if self._pattern is None:
+            return {}
+        found: Dict[str, str] = {}
+        for match in self._pattern.finditer(text):
+            term, translation = self._entries[match.group(1).lower()]
+            found.setdefault(term, translation)
+        return found
@@ -1,49 +1,228 @@
-from pathlib import Path
 from uuid import uuid4
-from typing import Optional
+from typing import List, Optional
+import hashlib
 import time
 
-from fastapi import FastAPI, File, HTTPException, UploadFile, Query
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile, Query
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
+from app.api.http_cache import (
+    RangeNotSatisfiable,
+    http_date,
+    if_range_matches,
+    is_not_modified,
+    parse_range,
+    quote_etag,
+)
 from app.config import settings
 from app.infra.job_repository import JobRepository
-from app.infra.jobs import translate_paper
+from app.infra import telemetry
+from app.infra.jobs import broker_queue_depth, enqueue_translations, translate_paper
+from app.infra.lazy import ProcessLocal
+from app.infra.prompts import DEFAULT_PROFILE, LANGUAGES, PROMPT_PROFILES, TranslationProfile
 from app.infra.storage import get_storage
+from app.services.admission import AdmissionController
+from app.services.output_service import OUTPUT_FORMATS, OutputService
 
 
 app = FastAPI(title="Paper Translator API")
 
-job_store = JobRepository(settings.db_url)
-storage = get_storage()
+telemetry.configure()
+
+if telemetry.metrics_enabled():
+
+    @app.middleware("http")
+    async def _observe_requests(request: Request, call_next):
+        started = time.perf_counter()
+        response = await call_next(request)
+        route = request.scope.get("route")
+        telemetry.observe_http_request(
+            request.method,
+            getattr(route, "path", "unmatched"),
+            response.status_code,
+            time.perf_counter() - started,
+        )
+        return response
+
+# 첫 요청 시점에 프로세스별로 생성한다 (임포트/기동 시 DB 접속 없음).
+job_store = ProcessLocal(lambda: JobRepository(settings.db_url))
+storage = ProcessLocal(get_storage)
+admission = ProcessLocal(lambda: AdmissionController.from_settings(broker_queue_depth))
+
+
+def _count_pages(stream) -> int:
+    # PyMuPDF 는 업로드를 처리할 때 처음 임포트한다 (API 기동 시간 영향 없음).
+    from app.infra.pdf_parser import count_pages_in_stream
+
+    return count_pages_in_stream(stream)
+
+
+def _expires_at() -> int:
+    # TTL 설정: 현재 시각 + job_ttl_days
+    ttl_days = getattr(settings, "job_ttl_days", 7)
+    return int(time.time()) + ttl_days * 24 * 60 * 60
+
+
+async def _admit(incoming_pages: int = 0) -> Optional[int]:
+    """업로드(incoming_pages 페이지)를 받으면 대기열이 포화되는 경우 429 로 거절하고,
+    아니면 예상 시작 시각(epoch 초)을 반환한다."""
+
+    if not settings.admission_enabled:
+        return None
+
+    decision = await run_in_threadpool(admission.evaluate, job_store, incoming_pages)
+    telemetry.count_admission("admitted" if decision.admitted else "rejected")
+    if not decision.admitted:
+        raise HTTPException(
+            status_code=429,
+            detail="처리 대기 중인 작업이 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(decision.retry_after)},
+        )
+    return decision.estimated_start_at
+
+
+def _translation_profile(
+    source_language: Optional[str],
+    target_language: Optional[str],
+    prompt_profile: Optional[str],
+) -> TranslationProfile:
+    try:
+        return TranslationProfile(
+            source_language or DEFAULT_PROFILE.source_language,
+            target_language or DEFAULT_PROFILE.target_language,
+            prompt_profile or DEFAULT_PROFILE.prompt_profile,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"지원하지 않는 번역 설정입니다. 언어: {', '.join(LANGUAGES)} / "
+                f"프롬프트: {', '.join(PROMPT_PROFILES)}"
+            ),
+        )
+
+
+def _profile_fields(profile: TranslationProfile) -> dict:
+    return {
+        "source_language": profile.source_language,
+        "target_language": profile.target_language,
+        "prompt_profile": profile.prompt_profile,
+    }
 
 
 @app.post("/upload")
-async def upload_pdf(file: UploadFile = File(...)):
+async def upload_pdf(
+    file: UploadFile = File(...),
+    source_language: Optional[str] = Form(None, alias="sourceLanguage"),
+    target_language: Optional[str] = Form(None, alias="targetLanguage"),
+    prompt_profile: Optional[str] = Form(None, alias="promptProfile"),
+):
+    """PDF 하나를 업로드한다. 번역 설정(언어쌍/프롬프트 프로필)을 생략하면 en → ko, academic."""
+
+    profile = _translation_profile(source_language, target_language, prompt_profile)
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="PDF만 업로드 가능합니다.")
 
+    try:
+        page_count = await run_in_threadpool(_count_pages, file.file)
+    except Exception:
+        raise HTTPException(status_code=400, detail="올바른 PDF 파일이 아닙니다.")
+
+    # 대기열이 포화 상태면 저장/큐 등록 전에 거절한다.
+    estimated_start_at = await _admit(page_count)
+
     job_id = str(uuid4())
 
-    contents = await file.read()
-    storage.save_original(job_id, contents)
+    # 업로드 파일을 메모리에 모두 올리지 않고 Storage 로 스트리밍한다.
+    await run_in_threadpool(storage.save_original_stream, job_id, file.file)
 
-    # TTL 설정: 현재 시각 + job_ttl_days
-    ttl_days = getattr(settings, "job_ttl_days", 7)
-    expires_at = int(time.time()) + ttl_days * 24 * 60 * 60
+    # DB 쓰기와 브로커 전송은 블로킹 I/O 이므로 이벤트 루프를 막지 않도록 스레드풀에서 실행한다.
+    await run_in_threadpool(
+        job_store.create_job,
+        job_id,
+        file_name=file.filename,
+        page_count=page_count,
+        expires_at=_expires_at(),
+        **_profile_fields(profile),
+    )
+    await run_in_threadpool(translate_paper.delay, job_id, enqueued_at=time.time())
 
-    job_store.create_job(job_id, file_name=file.filename, expires_at=expires_at)
-    translate_paper.delay(job_id)
+    resp = {"job_id": job_id, "pageCount": page_count}
+    if estimated_start_at is not None:
+        resp["estimatedStartAt"] = estimated_start_at
+    return resp
 
-    return {"job_id": job_id}
 
+@app.post("/upload:batch")
+async def upload_batch(
+    files: List[UploadFile] = File(...),
+    source_language: Optional[str] = Form(None, alias="sourceLanguage"),
+    target_language: Optional[str] = Form(None, alias="targetLanguage"),
+    prompt_profile: Optional[str] = Form(None, alias="promptProfile"),
+):
+    """여러 PDF를 한 번에 업로드한다.
 
-@app.get("/status/{job_id}")
-def status(job_id: str):
-    job = job_store.get_job(job_id)
-    if job is None:
-        raise HTTPException(status_code=404, detail="존재하지 않는 job_id")
+    - 번역 설정(언어쌍/프롬프트 프로필)은 배치의 모든 파일에 같이 적용한다.
+    - Job 생성은 하나의 multi-row INSERT, 큐 등록은 하나의 브로커 연결로 처리한다.
+    - PDF가 아니거나 읽을 수 없는 파일은 해당 항목에만 error 를 담고 나머지는 진행한다.
+    - 승인 제어는 배치 전체(받을 파일들의 페이지 합계)에 한 번 적용한다.
+    """
 
+    profile = _translation_profile(source_language, target_language, prompt_profile)
+    if len(files) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.batch_max_items}개까지 업로드할 수 있습니다.",
+        )
+
+    items: List[dict] = []
+    accepted: List[tuple[int, UploadFile, int]] = []
+    for index, file in enumerate(files):
+        item = {"fileName": file.filename}
+        items.append(item)
+        if file.content_type != "application/pdf":
+            item["error"] = "PDF만 업로드 가능합니다."
+            continue
+        try:
+            page_count = await run_in_threadpool(_count_pages, file.file)
+        except Exception:
+            item["error"] = "올바른 PDF 파일이 아닙니다."
+            continue
+        accepted.append((index, file, page_count))
+
+    estimated_start_at = (
+        await _admit(sum(page_count for _index, _file, page_count in accepted)) if accepted else None
+    )
+
+    expires_at = _expires_at()
+    new_jobs: List[dict] = []
+    for index, file, page_count in accepted:
+        job_id = str(uuid4())
+        await run_in_threadpool(storage.save_original_stream, job_id, file.file)
+        items[index].update({"job_id": job_id, "pageCount": page_count})
+        new_jobs.append(
+            {
+                "job_id": job_id,
+                "file_name": file.filename,
+                "page_count": page_count,
+                "expires_at": expires_at,
+                **_profile_fields(profile),
+            }
+        )
+
+    if new_jobs:
+        await run_in_threadpool(job_store.create_jobs, new_jobs)
+        await run_in_threadpool(enqueue_translations, [job["job_id"] for job in new_jobs])
+
+    resp = {"items": items}
+    if estimated_start_at is not None:
+        resp["estimatedStartAt"] = estimated_start_at
+    return resp
+
+
+def _status_payload(job_id: str, job: dict) -> dict:
     resp = {
         "job_id": job_id,
         "status": job.get("lastStatus"),
@@ -55,10 +234,61 @@ def status(job_id: str):
         resp["pageCount"] = job["pageCount"]
     if job.get("expiresAt") is not None:
         resp["expiresAt"] = job["expiresAt"]
+    profile = TranslationProfile.from_job(job)
+    resp["sourceLanguage"] = profile.source_language
+    resp["targetLanguage"] = profile.target_language
+    resp["promptProfile"] = profile.prompt_profile
+    if job.get("llmCalls") is not None:
+        resp["usage"] = {
+            "promptTokens": job["promptTokens"],
+            "completionTokens": job["completionTokens"],
+            "llmCalls": job["llmCalls"],
+            "costUsd": job["costUsd"],
+        }
 
     return resp
 
 
+@app.get("/status/{job_id}")
+def status(job_id: str):
+    job = job_store.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="존재하지 않는 job_id")
+
+    return _status_payload(job_id, job)
+
+
+class StatusBatchRequest(BaseModel):
+    job_ids: List[str] = Field(alias="jobIds")
+
+
+@app.post("/status:batch")
+def status_batch(body: StatusBatchRequest):
+    """여러 Job의 상태를 한 번의 쿼리로 조회한다. 존재하지 않는 id 는 missing 에 담는다."""
+
+    job_ids = list(dict.fromkeys(body.job_ids))
+    if len(job_ids) > settings.batch_max_status_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.batch_max_status_ids}개까지 조회할 수 있습니다.",
+        )
+
+    jobs = job_store.get_jobs(job_ids)
+    return {
+        "items": [_status_payload(job_id, jobs[job_id]) for job_id in job_ids if job_id in jobs],
+        "missing": [job_id for job_id in job_ids if job_id not in jobs],
+    }
+
+
+@app.get("/metrics")
+def metrics():
+    if not telemetry.metrics_enabled():
+        raise HTTPException(status_code=404, detail="메트릭이 비활성화되어 있습니다.")
+
+    body, content_type = telemetry.render_latest()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/jobs")
 def list_jobs(
     q: Optional[str] = None,
@@ -81,14 +311,148 @@ def list_jobs(
     return {"items": items}
 
 
+def _download_cache_control(job_id: str, job: Optional[dict] = None) -> str:
+    """완료(터미널) 상태의 Job은 만료 시각까지 길게 캐시하도록 허용한다."""
+
+    if job is None:
+        job = job_store.get_job(job_id)
+    if job is None or job.get("lastStatus") != "COMPLETED":
+        return "no-cache"
+
+    max_age = 365 * 24 * 60 * 60
+    if job.get("expiresAt") is not None:
+        max_age = max(min(max_age, job["expiresAt"] - int(time.time())), 0)
+    return f"private, max-age={max_age}, immutable"
+
+
+@app.get("/usage/summary")
+def usage_summary(
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+    owner_id: Optional[str] = Query(None, alias="ownerId"),
+):
+    """LLM 토큰/비용 사용량을 소유자·일자(UTC)별로 집계한다.
+
+    - since/until: 집계 기간 (Job 생성 시각, epoch 초). 기본값은 최근 30일.
+    """
+
+    now = int(time.time())
+    until_ts = until if until is not None else now + 1
+    since_ts = since if since is not None else until_ts - 30 * 24 * 60 * 60
+
+    items = job_store.usage_summary(since=since_ts, until=until_ts, owner_id=owner_id)
+    totals = {
+        key: sum(item[key] for item in items)
+        for key in ("jobs", "promptTokens", "completionTokens", "llmCalls", "costUsd")
+    }
+    return {"since": since_ts, "until": until_ts, "items": items, "totals": totals}
+
+
 @app.get("/download/{job_id}")
-def download(job_id: str):
-    path = Path(storage.get_translated_path(job_id))
+def download(job_id: str, request: Request):
+    stored = storage.stat_translated(job_id)
+
+    if stored is None:
+        raise HTTPException(
+            status_code=404,
+            detail="아직 번역이 완료되지 않았거나 없는 job입니다.",
+        )
+
+    filename = f"translated_{job_id}.pdf"
+
+    # 오브젝트 스토리지는 presigned URL 로 리다이렉트해 API가 파일 바이트를 중계하지 않는다.
+    # (조건부/Range 요청은 오브젝트 스토리지가 직접 처리한다.)
+    url = storage.get_translated_url(job_id, filename=filename)
+    if url is not None:
+        return RedirectResponse(url, status_code=307)
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": _download_cache_control(job_id),
+        "Last-Modified": http_date(stored.modified_at),
+    }
+    if stored.etag is not None:
+        headers["ETag"] = quote_etag(stored.etag)
+
+    if is_not_modified(
+        etag=stored.etag,
+        modified_at=stored.modified_at,
+        if_none_match=request.headers.get("if-none-match"),
+        if_modified_since=request.headers.get("if-modified-since"),
+    ):
+        return Response(status_code=304, headers=headers)
+
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    byte_range = None
+    if if_range_matches(request.headers.get("if-range"), etag=stored.etag, modified_at=stored.modified_at):
+        try:
+            byte_range = parse_range(request.headers.get("range"), stored.size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{stored.size}"},
+            )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(stored.size)
+        return StreamingResponse(
+            storage.iter_translated(job_id),
+            media_type="application/pdf",
+            headers=headers,
+        )
+
+    start, end = byte_range
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{stored.size}"
+    return StreamingResponse(
+        storage.iter_translated(job_id, start=start, end=end),
+        status_code=206,
+        media_type="application/pdf",
+        headers=headers,
+    )
+
 
-    if not path.exists():
+@app.get("/download/{job_id}/{output_format}")
+def download_output(job_id: str, output_format: str, request: Request):
+    """번역 결과를 다른 형식(pdf/markdown/html/bilingual)으로 내려받는다.
+
+    처음 요청할 때 저장된 문단 스트림으로 렌더링해 캐시하며, LLM 재번역은 하지 않는다.
+    """
+
+    if output_format not in OUTPUT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 형식입니다. ({', '.join(OUTPUT_FORMATS)})",
+        )
+
+    job = job_store.get_job(job_id)
+    if job is None:
         raise HTTPException(
             status_code=404,
             detail="아직 번역이 완료되지 않았거나 없는 job입니다.",
         )
 
-    return FileResponse(path, filename=f"translated_{job_id}.pdf")
+    rendered = OutputService(storage).render(job_id, output_format, TranslationProfile.from_job(job))
+    if rendered is None:
+        raise HTTPException(
+            status_code=404,
+            detail="아직 번역이 완료되지 않았거나 해당 형식을 만들 수 없는 job입니다.",
+        )
+
+    etag = hashlib.sha256(rendered.data).hexdigest()[:32]
+    headers = {
+        # RENDER_VERSION 이 바뀌면 같은 URL 의 내용이 바뀌므로 immutable 로 캐시하지 않고 ETag 로 재검증한다.
+        "Cache-Control": "private, no-cache",
+        "ETag": quote_etag(etag),
+    }
+    if is_not_modified(
+        etag=etag,
+        modified_at=0,
+        if_none_match=request.headers.get("if-none-match"),
+        if_modified_since=None,
+    ):
+        return Response(status_code=304, headers=headers)
+
+    headers["Content-Disposition"] = f'attachment; filename="{rendered.filename}"'
+    return Response(rendered.data, media_type=rendered.media_type, headers=headers)
@@ -0,0 +1,116 @@
+"""업로드 승인 제어(Admission control).
+
+새 업로드를 받기 전에
+- 브로커 큐 길이(대기 중인 Celery 메시지 수)와
+- 대기/실행 중 Job 의 예상 작업량(페이지 합계 × 페이지당 처리 시간 ÷ 워커 동시성)에
+  이번 업로드의 페이지 수를 더한 작업량
+을 확인해, 포화 상태면 거절(429 + Retry-After)하고 아니면 예상 시작 시각을 알려준다.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    admitted: bool
+    estimated_start_at: int  # epoch 초
+    backlog_seconds: float
+    queue_depth: Optional[int]
+    retry_after: Optional[int] = None  # 거절 시 재시도까지 권장 대기 시간(초)
+
+
+class AdmissionController:
+    """대기열 상태로 업로드 승인 여부와 예상 시작 시각을 계산한다.
+
+    브로커 큐 길이 조회는 AMQP 연결이 필요하므로 queue_depth_ttl 초 동안 캐시한다.
+    조회에 실패하면(None) 작업량 기준으로만 판단한다.
+    """
+
+    def __init__(
+        self,
+        queue_depth: Callable[[], Optional[int]],
+        *,
+        seconds_per_page: float = 6.0,
+        concurrency: int = 4,
+        max_wait_seconds: float = 1800.0,
+        max_queue_depth: int = 500,
+        window_seconds: int = 6 * 60 * 60,
+        default_page_count: int = 10,
+        queue_depth_ttl: float = 2.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._queue_depth = queue_depth
+        self.seconds_per_page = seconds_per_page
+        self.concurrency = max(concurrency, 1)
+        self.max_wait_seconds = max_wait_seconds
+        self.max_queue_depth = max_queue_depth
+        self.window_seconds = window_seconds
+        self.default_page_count = default_page_count
+        self._queue_depth_ttl = queue_depth_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cached_depth: Optional[int] = None
+        self._cached_at = float("-inf")
+
+    @classmethod
+    def from_settings(cls, queue_depth: Callable[[], Optional[int]]) -> "AdmissionController":
+        return cls(
+            queue_depth,
+            seconds_per_page=settings.admission_seconds_per_page,
+            concurrency=settings.admission_worker_concurrency,
+            max_wait_seconds=settings.admission_max_wait_seconds,
+            max_queue_depth=settings.admission_max_queue_depth,
+            window_seconds=settings.admission_window_seconds,
+            default_page_count=settings.admission_default_page_count,
+        )
+
+    def queue_depth(self) -> Optional[int]:
+        now = self._clock()
+        with self._lock:
+            if now - self._cached_at < self._queue_depth_ttl:
+                return self._cached_depth
+        depth = self._queue_depth()
+        with self._lock:
+            self._cached_depth, self._cached_at = depth, now
+        return depth
+
+    def evaluate(self, job_store, incoming_pages: int = 0) -> AdmissionDecision:
+        """승인 여부를 판단한다. incoming_pages 는 이번에 받을 업로드(배치면 합계)의 페이지 수.
+
+        - backlog_seconds 와 한도 초과 판단에는 incoming_pages 를 포함한다.
+        - estimated_start_at 은 기존 대기열이 비는 시각(이번 업로드가 시작되는 시각)이다.
+        - 기존 대기열이 비어 있으면 업로드가 아무리 커도 승인한다 (기다려도 나아지지 않음).
+        """
+
+        now = self._clock()
+        stats = job_store.backlog_stats(
+            since=int(now - self.window_seconds),
+            default_page_count=self.default_page_count,
+        )
+        queued_seconds = stats["pages"] * self.seconds_per_page / self.concurrency
+        backlog_seconds = queued_seconds + incoming_pages * self.seconds_per_page / self.concurrency
+        depth = self.queue_depth()
+        estimated_start_at = int(now + queued_seconds)
+
+        # 포화 해소까지 걸릴 것으로 보이는 시간 (기존 대기열이 빠지는 만큼만 줄어든다)
+        excess = min(backlog_seconds - self.max_wait_seconds, queued_seconds)
+        if depth is not None and depth >= self.max_queue_depth:
+            pages_per_job = stats["pages"] / stats["jobs"] if stats["jobs"] else self.default_page_count
+            seconds_per_job = pages_per_job * self.seconds_per_page / self.concurrency
+            excess = max(excess, (depth - self.max_queue_depth + 1) * seconds_per_job)
+        elif excess <= 0:
+            return AdmissionDecision(True, estimated_start_at, backlog_seconds, depth)
+
+        return AdmissionDecision(
+            False,
+            estimated_start_at,
+            backlog_seconds,
+            depth,
+            retry_after=max(math.ceil(excess), 1),
+        )
@@ -0,0 +1,111 @@
+"""번역 결과의 출력 형식(번역 PDF / Markdown / HTML / 대역 PDF) 생성.
+
+번역 Job 이 저장해 둔 문단 스트림(paragraphs.jsonl.gz)으로부터 요청 시점에 렌더링하고,
+결과를 Storage 아티팩트로 캐시해 같은 형식을 다시 요청하면 렌더링 없이 돌려준다.
+렌더러 출력이 바뀌면 RENDER_VERSION 을 올려 이전 캐시를 무효화한다.
+pdf 형식은 Job 이 만든 번역 PDF 와 같은 내용을 현재 PDFGenerator 로 다시 렌더링한 것으로,
+글꼴/레이아웃을 바꾼 뒤 재번역 없이 다시 만들 때 쓴다.
+캐시 이름에는 Job 번역 설정의 cache_namespace(언어쌍 + 프롬프트 버전)가 들어간다.
+"""
+
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.infra.paragraph_stream import PARAGRAPHS_ARTIFACT, decode_paragraph_stream, target_paragraphs
+from app.infra.prompts import DEFAULT_PROFILE, DEFAULT_TARGET_LANGUAGE, TranslationProfile
+from app.infra.renderers import render_html, render_markdown
+from app.infra.storage import Storage
+
+
+RENDER_VERSION = 1
+
+
+@dataclass(frozen=True)
+class OutputFormat:
+    extension: str
+    media_type: str
+    render: Callable[[List[Tuple[str, str]], str], bytes]  # (문단 쌍, 번역 언어 코드)
+
+
+def _render_pdf(pairs: List[Tuple[str, str]], _lang: str) -> bytes:
+    # ReportLab 은 PDF 를 처음 요청할 때 임포트한다 (API 기동 시간 영향 없음).
+    from app.infra.pdf_generator import PDFGenerator
+
+    with tempfile.TemporaryDirectory(prefix="render-") as tmp:
+        path = Path(tmp) / "translated.pdf"
+        PDFGenerator().generate(target_paragraphs(pairs), path)
+        return path.read_bytes()
+
+
+def _render_bilingual_pdf(pairs: List[Tuple[str, str]], _lang: str) -> bytes:
+    from app.infra.pdf_generator import PDFGenerator
+
+    with tempfile.TemporaryDirectory(prefix="render-") as tmp:
+        path = Path(tmp) / "bilingual.pdf"
+        PDFGenerator().generate_bilingual(pairs, path)
+        return path.read_bytes()
+
+
+OUTPUT_FORMATS: Dict[str, OutputFormat] = {
+    "pdf": OutputFormat("pdf", "application/pdf", _render_pdf),
+    "markdown": OutputFormat(
+        "md", "text/markdown; charset=utf-8", lambda pairs, _lang: render_markdown(pairs)
+    ),
+    "html": OutputFormat(
+        "html", "text/html; charset=utf-8", lambda pairs, lang: render_html(pairs, lang=lang)
+    ),
+    "bilingual": OutputFormat("pdf", "application/pdf", _render_bilingual_pdf),
+}
+
+
+@dataclass(frozen=True)
+class RenderedOutput:
+    data: bytes
+    media_type: str
+    filename: str
+
+
+class OutputService:
+    """문단 스트림 아티팩트로 대체 출력 형식을 만들고 캐시한다."""
+
+    def __init__(self, storage: Storage) -> None:
+        self._storage = storage
+
+    @staticmethod
+    def cache_name(output_format: str, profile: TranslationProfile = DEFAULT_PROFILE) -> str:
+        fmt = OUTPUT_FORMATS[output_format]
+        return f"render-{output_format}-v{RENDER_VERSION}-{profile.cache_namespace}.{fmt.extension}"
+
+    def render(
+        self,
+        job_id: str,
+        output_format: str,
+        profile: TranslationProfile = DEFAULT_PROFILE,
+    ) -> Optional[RenderedOutput]:
+        """출력을 반환한다. 문단 스트림이 없으면(번역 전/이전 버전 Job) None.
+
+        알 수 없는 형식이면 KeyError 가 발생한다.
+        """
+
+        fmt = OUTPUT_FORMATS[output_format]
+        filename = f"translated_{job_id}.{fmt.extension}"
+        name = self.cache_name(output_format, profile)
+
+        cached = self._storage.load_artifact(job_id, name)
+        if cached is not None:
+            return RenderedOutput(cached, fmt.media_type, filename)
+
+        stream = self._storage.load_artifact(job_id, PARAGRAPHS_ARTIFACT)
+        if stream is None:
+            return None
+
+        header, pairs = decode_paragraph_stream(stream)
+        data = fmt.render(pairs, header.get("target") or DEFAULT_TARGET_LANGUAGE)
+        try:
+            self._storage.save_artifact(job_id, name, data)
+        except Exception:
+            # 캐시 저장 실패는 응답에 영향을 주지 않는다 (다음 요청에서 다시 렌더링).
+            pass
+        return RenderedOutput(data, fmt.media_type, filename)
@@ -1,67 +1,203 @@
+import time
 from pathlib import Path
-from typing import List
-
-from app.infra.llm_client import LLMClient
+from typing import Dict, List, Optional, Tuple
+
+from app.infra import telemetry
+from app.infra.llm_client import Deadline, LLMClient
+from app.infra.llm_router import ModelRouter
+from app.infra.llm_usage import JobUsage
+from app.infra.memory import MemoryBudget
+from app.infra.paragraph_stream import target_paragraphs
 from app.infra.pdf_generator import PDFGenerator
-from app.infra.pdf_parser import PDFParser
+from app.infra.pdf_parser import NoTextExtracted, PDFParser
+from app.infra.prompts import DEFAULT_PROFILE, TranslationProfile
+from app.infra.translation_memory import Glossary, TranslationMemory
+
+
+# 프롬프트 길이를 제한하기 위한 청크당 참고 번역(유사 일치) 최대 개수
+MAX_REFERENCES_PER_CHUNK = 3
 
 
 class TranslationService:
     """PDF → 번역 → PDF 최소 파이프라인 서비스."""
 
-    def __init__(self, max_chars_per_chunk: int = 3000) -> None:
-        self._parser = PDFParser()
-        self._llm = LLMClient()
-        self._generator = PDFGenerator()
+    def __init__(
+        self,
+        max_chars_per_chunk: int = 3000,
+        *,
+        parser: Optional[PDFParser] = None,
+        llm: Optional[LLMClient] = None,
+        generator: Optional[PDFGenerator] = None,
+        memory: Optional[TranslationMemory] = None,
+        glossary: Optional[Glossary] = None,
+        glossaries: Optional[Dict[str, Glossary]] = None,
+        router: Optional[ModelRouter] = None,
+    ) -> None:
+        self._parser = parser or PDFParser()
+        self._llm = llm or LLMClient()
+        self._generator = generator or PDFGenerator()
+        self._memory = memory
+        # 언어쌍 → 용어집. glossary 는 기본 언어쌍(en-ko)의 용어집이다.
+        self._glossaries: Dict[str, Glossary] = dict(glossaries or {})
+        if glossary is not None:
+            self._glossaries[DEFAULT_PROFILE.lang_pair] = glossary
+        self._router = router
         self._max_chars_per_chunk = max_chars_per_chunk
 
-    def translate_pdf(self, input_pdf: Path | str, output_pdf: Path | str) -> None:
-        """PDF를 읽어 간단히 페이지 단위 텍스트로 추출 → LLM 번역 → 새 PDF 생성."""
-
-        pages = self._parser.extract_pages(input_pdf)
-        if not pages:
-            # 빈 문서라도 최소한 빈 PDF는 생성
-            self._generator.generate([""], output_pdf)
-            return
+    def translate_pdf(
+        self,
+        input_pdf: Path | str,
+        output_pdf: Path | str,
+        *,
+        timings: Optional[Dict[str, float]] = None,
+        usage: Optional[JobUsage] = None,
+        memory_budget: Optional[MemoryBudget] = None,
+        profile: TranslationProfile = DEFAULT_PROFILE,
+    ) -> List[Tuple[str, str]]:
+        """PDF를 읽어 간단히 페이지 단위 텍스트로 추출 → LLM 번역 → 새 PDF 생성.
+
+        timings 를 넘기면 단계별 소요 시간(초)을 parse/chunk/translate/render 키로 기록한다.
+        usage 를 넘기면 청크별 LLM 토큰 사용량을 누적한다.
+        memory_budget 을 넘기면 단계/페이지 창/청크 경계마다 메모리 예산을 점검한다
+        (초과 시 MemoryBudgetExceeded).
+        profile 은 Job 의 언어쌍/프롬프트 설정이며, 번역 메모리는 profile.cache_namespace 로 분리된다.
+        반환값은 (원문, 번역) 문단 쌍 목록으로, 재번역 없이 다른 형식으로 다시 렌더링할 때 쓴다.
+        """
 
-        joined = "\n\n".join(pages)
-        chunks = self._split_into_chunks(joined)
+        stages: Dict[str, float] = {} if timings is None else timings
 
-        translated_chunks: List[str] = []
-        for chunk in chunks:
-            translated = self._llm.translate_chunk(chunk)
-            translated_chunks.append(translated)
+        def checkpoint(stage: str):
+            if memory_budget is None:
+                return None
+            return lambda: memory_budget.checkpoint(stage)
 
-        translated_text = "\n\n".join(translated_chunks)
-        translated_paragraphs = translated_text.split("\n\n")
+        started = time.perf_counter()
+        pages = self._parser.extract_pages(
+            input_pdf,
+            checkpoint=checkpoint("parse"),
+            source_language=profile.source_language,
+        )
+        stages["parse"] = time.perf_counter() - started
+        if memory_budget is not None:
+            memory_budget.checkpoint("parse")
 
-        self._generator.generate(translated_paragraphs, output_pdf)
+        if not pages:
+            # 텍스트 레이어도 OCR 결과도 없으면 빈 PDF를 "완료"로 내보내지 않고 실패시킨다.
+            raise NoTextExtracted(f"no text extracted from {input_pdf}")
+
+        started = time.perf_counter()
+        with telemetry.timed("pipeline.chunk", stage="chunk"):
+            paragraphs = "\n\n".join(pages).split("\n\n")
+            # 번역 메모리의 정확 일치 문단은 LLM 요청에서 제외하고,
+            # 유사 일치는 내용이 다를 수 있으므로 해당 청크의 참고 번역으로만 넘긴다.
+            slots: List[Optional[str]] = [None] * len(paragraphs)
+            references: Dict[int, Tuple[str, str]] = {}
+            if self._memory is not None:
+                matches = self._memory.lookup_many(paragraphs, lang_pair=profile.cache_namespace)
+                for i, match in enumerate(matches):
+                    if match is None:
+                        continue
+                    if match.exact:
+                        slots[i] = match.target
+                    else:
+                        references[i] = (match.source, match.target)
+            pending = [i for i, slot in enumerate(slots) if slot is None]
+            chunks = self._split_into_chunks(pending, paragraphs)
+            del pages
+        stages["chunk"] = time.perf_counter() - started
+        if memory_budget is not None:
+            memory_budget.checkpoint("chunk")
+
+        # Job 단위 시간 예산: 모든 청크 요청이 하나의 데드라인을 공유한다.
+        deadline = Deadline.from_settings()
+
+        glossary_for_pair = self._glossaries.get(profile.lang_pair)
+        system_prompt = profile.system_prompt
+
+        started = time.perf_counter()
+        learned: List[tuple[str, str]] = []
+        with telemetry.timed("pipeline.translate", stage="translate"):
+            for indices in chunks:
+                chunk = "\n\n".join(paragraphs[i] for i in indices)
+                glossary = glossary_for_pair.find(chunk) if glossary_for_pair is not None else None
+                chunk_references = [references[i] for i in indices if i in references][:MAX_REFERENCES_PER_CHUNK]
+                if self._router is not None:
+                    # 정확 일치 문단은 이미 빠졌으므로, 청크 단위 미스는 참고 번역(유사 일치)도 하나 없는 경우다.
+                    translated = self._router.translate_chunk(
+                        chunk,
+                        deadline=deadline,
+                        usage=usage,
+                        glossary=glossary or None,
+                        cache_miss=self._memory is not None and not chunk_references,
+                        system_prompt=system_prompt,
+                        references=chunk_references or None,
+                        source_language=profile.source_language,
+                    )
+                else:
+                    translated = self._llm.translate_chunk(
+                        chunk,
+                        deadline=deadline,
+                        usage=usage,
+                        glossary=glossary or None,
+                        system_prompt=system_prompt,
+                        references=chunk_references or None,
+                    )
+                parts = translated.split("\n\n")
+                if len(parts) == len(indices):
+                    for i, part in zip(indices, parts):
+                        slots[i] = part
+                        learned.append((paragraphs[i], part))
+                else:
+                    # 문단 수가 어긋나면 문단 단위 대응을 알 수 없으므로 청크 전체를 한 자리에 둔다.
+                    slots[indices[0]] = translated
+                    for i in indices[1:]:
+                        slots[i] = ""
+                if memory_budget is not None:
+                    memory_budget.checkpoint("translate")
+        stages["translate"] = time.perf_counter() - started
+
+        if self._memory is not None and learned:
+            try:
+                self._memory.add_many(learned, lang_pair=profile.cache_namespace)
+            except Exception:
+                # 번역 메모리 저장 실패는 Job 결과에 영향을 주지 않는다.
+                pass
+
+        pairs = [(source, slot or "") for source, slot in zip(paragraphs, slots)]
+
+        started = time.perf_counter()
+        self._generator.generate(target_paragraphs(pairs), output_pdf, checkpoint=checkpoint("render"))
+        stages["render"] = time.perf_counter() - started
+        if memory_budget is not None:
+            memory_budget.checkpoint("render")
+        return pairs
 
     def get_page_count(self, input_pdf: Path | str) -> int:
         """PDF 페이지 수를 반환하는 헬퍼.
 
-        메타데이터(page_count) 저장용으로 사용된다.
+        메타데이터(page_count) 저장용으로 사용된다. 텍스트가 없는 페이지도 센다.
         """
 
-        pages = self._parser.extract_pages(input_pdf)
-        return len(pages)
+        return self._parser.page_count(input_pdf)
+
+    def _split_into_chunks(self, indices: List[int], paragraphs: List[str]) -> List[List[int]]:
+        """문단 인덱스를 max_chars_per_chunk 예산 안에서 청크 단위로 묶는다."""
 
-    def _split_into_chunks(self, text: str) -> List[str]:
-        chunks: List[str] = []
-        current = []
+        chunks: List[List[int]] = []
+        current: List[int] = []
         current_len = 0
 
-        for part in text.split("\n\n"):
-            part_len = len(part)
+        for i in indices:
+            part_len = len(paragraphs[i])
             if current_len + part_len > self._max_chars_per_chunk and current:
-                chunks.append("\n\n".join(current))
-                current = [part]
+                chunks.append(current)
+                current = [i]
                 current_len = part_len
             else:
-                current.append(part)
+                current.append(i)
                 current_len += part_len
 
         if current:
-            chunks.append("\n\n".join(current))
+            chunks.append(current)
 
         return chunks
@@ -0,0 +1,78 @@
+"""API/Worker 모듈 임포트(콜드 스타트) 시간 벤치마크.
+
+새 인터프리터에서 모듈을 임포트하는 데 걸리는 시간을 여러 번 측정하고,
+`-X importtime` 결과에서 누적 시간이 큰 모듈을 함께 출력한다.
+임포트 시점에 로드되면 안 되는 무거운 모듈(openai, PyMuPDF, ReportLab)이 있으면 표시한다.
+
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --module app.infra.jobs --runs 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("openai", "fitz", "pymupdf", "reportlab")
+
+
+def _measure_once(module: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=ROOT,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def _import_profile(module: str) -> Tuple[List[Tuple[int, str]], List[str]]:
+    """`-X importtime` 출력에서 (누적 us, 모듈명) 목록과 로드된 무거운 모듈을 반환한다."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    entries: List[Tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # 형식: "import time: <self us> | <cumulative us> | <module>"
+        _self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        entries.append((int(cumulative_us), name.rstrip()))
+
+    loaded = {name.strip().split(".")[0] for _us, name in entries}
+    heavy = sorted(m for m in HEAVY_MODULES if m in loaded)
+    return entries, heavy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    timings = [_measure_once(args.module) for _ in range(args.runs)]
+    entries, heavy = _import_profile(args.module)
+
+    print(f"module={args.module} runs={args.runs}")
+    print(f"wall_ms median={statistics.median(timings):.1f} min={min(timings):.1f} max={max(timings):.1f}")
+    print(f"heavy_modules_loaded={','.join(heavy) or 'none'}")
+    print("top cumulative imports (ms):")
+    for cumulative_us, name in sorted(entries, reverse=True)[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f}  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""LLMClient 전송 계층(커넥션 풀/keep-alive) 벤치마크.
+
+로컬 모의 서버(tests.mock_llm_server)에 동시 요청을 보내 처리량과 지연 분포를 측정한다.
+- sync: 스레드 N개가 하나의 LLMClient(공유 커넥션 풀)를 사용
+- async: AsyncLLMClient 하나로 N개 동시 요청
+
+    python -m benchmarks.bench_llm_client --requests 200 --concurrency 16 --latency-ms 100
+    python -m benchmarks.bench_llm_client --max-connections 4   # 풀 고갈 시 비교
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.infra.llm_client import AsyncLLMClient, LLMClient, LLMTransportConfig
+from tests.mock_llm_server import MockLLMServer
+
+
+def _report(mode: str, elapsed: float, requests: int, client, server: MockLLMServer) -> None:
+    snap = client.latency.snapshot()
+    print(
+        f"mode={mode:<5} requests={requests} elapsed={elapsed:.2f}s "
+        f"throughput={requests / elapsed:.1f}req/s "
+        f"p50<={snap['p50']}s p95<={snap['p95']}s p99<={snap['p99']}s "
+        f"mean={snap['mean']:.3f}s connections={server.connection_count}"
+    )
+
+
+def _run_sync(config: LLMTransportConfig, server: MockLLMServer, requests: int, concurrency: int) -> None:
+    client = LLMClient(config)
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda i: client.translate_chunk(f"chunk {i}"), range(requests)))
+        _report("sync", time.perf_counter() - start, requests, client, server)
+    finally:
+        client.close()
+
+
+async def _run_async(config: LLMTransportConfig, server: MockLLMServer, requests: int, concurrency: int) -> None:
+    client = AsyncLLMClient(config)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> str:
+        async with semaphore:
+            return await client.translate_chunk(f"chunk {i}")
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        _report("async", time.perf_counter() - start, requests, client, server)
+    finally:
+        await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--max-connections", type=int, default=20)
+    parser.add_argument("--max-keepalive", type=int, default=10)
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+    for mode in ("sync", "async") if args.mode == "both" else (args.mode,):
+        server = MockLLMServer(latency_seconds=args.latency_ms / 1000).start()
+        config = LLMTransportConfig(
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_keepalive,
+            max_retries=0,
+            base_url=server.base_url,
+        )
+        try:
+            if mode == "sync":
+                _run_sync(config, server, args.requests, args.concurrency)
+            else:
+                asyncio.run(_run_async(config, server, args.requests, args.concurrency))
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
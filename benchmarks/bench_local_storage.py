@@ -0,0 +1,120 @@
+"""LocalStorage 디렉터리 구조별 조회/정리 시간 벤치마크.
+
+평면(flat) 구조와 샤딩(sharded) 구조에 N개의 번역 PDF(더미)를 만든 뒤,
+- 무작위 job_id 조회 (stat_translated 와 같은 작업: PDF stat + 해시 파일 읽기)
+- 디렉터리 전체 나열 (운영 도구/백업이 하는 작업)
+- 일부 Job 정리 (PDF + 해시 파일 삭제)
+에 걸리는 시간을 비교한다. 두 구조 모두 같은 파일 연산을 하므로 차이는 디렉터리 구조에서만 나온다.
+
+    python -m benchmarks.bench_local_storage --files 100000
+    python -m benchmarks.bench_local_storage --files 1000000 --dir /mnt/scratch
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from app.infra.storage import LocalStorage
+
+
+def _translated_path(storage: LocalStorage, base: Path, job_id: str, layout: str) -> Path:
+    if layout == "flat":
+        return base / "translated" / f"{job_id}.pdf"
+    return storage._sharded_path("translated", job_id)
+
+
+def _populate(storage: LocalStorage, base: Path, job_ids: list[str], layout: str) -> None:
+    # 준비 단계는 Storage API(원자적 쓰기/fsync)를 거치지 않고 빠르게 파일만 만든다.
+    for job_id in job_ids:
+        path = _translated_path(storage, base, job_id, layout)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"%PDF")
+        path.with_name(path.name + ".sha256").write_bytes(b"0" * 64)
+
+
+def _count_files(root: Path) -> int:
+    count = 0
+    for _dirpath, _dirnames, filenames in os.walk(root):
+        count += len(filenames)
+    return count
+
+
+def _run(layout: str, files: int, lookups: int, cleanup: int, workdir: Path) -> dict:
+    base = workdir / layout
+    storage = LocalStorage(base_dir=base, fsync=False)
+    job_ids = [f"job-{i:08d}" for i in range(files)]
+
+    start = time.perf_counter()
+    _populate(storage, base, job_ids, layout)
+    populate_s = time.perf_counter() - start
+
+    # 평면 구조 파일은 Storage API 로 조회하면 샤딩 경로로 옮겨지므로,
+    # 두 구조 모두 stat_translated 와 같은 파일 연산을 경로만 바꿔 직접 수행한다.
+    def lookup(job_id: str) -> None:
+        path = _translated_path(storage, base, job_id, layout)
+        path.stat()
+        path.with_name(path.name + ".sha256").read_text()
+
+    def delete(job_id: str) -> None:
+        path = _translated_path(storage, base, job_id, layout)
+        path.unlink(missing_ok=True)
+        path.with_name(path.name + ".sha256").unlink(missing_ok=True)
+
+    sample = random.sample(job_ids, min(lookups, files))
+    start = time.perf_counter()
+    for job_id in sample:
+        lookup(job_id)
+    lookup_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    listed = _count_files(base / "translated")
+    list_s = time.perf_counter() - start
+
+    victims = random.sample(job_ids, min(cleanup, files))
+    start = time.perf_counter()
+    for job_id in victims:
+        delete(job_id)
+    cleanup_s = time.perf_counter() - start
+
+    return {
+        "layout": layout,
+        "files": files,
+        "listed": listed,
+        "populate_s": populate_s,
+        "lookup_us": lookup_s / max(len(sample), 1) * 1e6,
+        "list_s": list_s,
+        "cleanup_us": cleanup_s / max(len(victims), 1) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--cleanup", type=int, default=10_000)
+    parser.add_argument("--layout", choices=["flat", "sharded", "both"], default="both")
+    parser.add_argument("--dir", default=None, help="벤치마크용 임시 디렉터리 위치")
+    args = parser.parse_args()
+
+    layouts = ["flat", "sharded"] if args.layout == "both" else [args.layout]
+    workdir = Path(tempfile.mkdtemp(prefix="bench-storage-", dir=args.dir))
+    try:
+        for layout in layouts:
+            result = _run(layout, args.files, args.lookups, args.cleanup, workdir)
+            print(
+                f"layout={result['layout']:<8} files={result['files']} "
+                f"populate={result['populate_s']:.1f}s "
+                f"lookup={result['lookup_us']:.1f}us/op "
+                f"list={result['list_s']:.2f}s "
+                f"cleanup={result['cleanup_us']:.1f}us/job"
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
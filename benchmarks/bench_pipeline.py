@@ -0,0 +1,260 @@
+"""번역 파이프라인 End-to-End 벤치마크.
+
+합성 논문 PDF를 만들고, 지연을 조절할 수 있는 FakeLLMClient 로
+- TranslationService.translate_pdf (단계별 시간: parse/chunk/translate/render)
+- translate_paper Celery Task (Storage/JobRepository 포함, 브로커 없이 동기 실행)
+을 실행해 단계별 시간, 최대 메모리, 분당 처리 Job 수를 측정한다.
+단계별 최대 메모리는 MemoryBudget 체크포인트에서 RSS 증가분과 tracemalloc 최대치로 기록하며,
+--tracemalloc-top N 으로 할당량이 큰 코드 위치를 출력한다.
+
+결과는 JSON으로 저장하며, --compare 로 이전 결과와 비교해 회귀 여부를 확인한다.
+
+    python -m benchmarks.bench_pipeline --pages 20 --jobs 5 --llm-latency-ms 200
+    python -m benchmarks.bench_pipeline --compare benchmarks/results/baseline.json
+    python -m benchmarks.bench_pipeline --scanned --ocr-workers 4   # 스캔 PDF (Tesseract 필요)
+    python -m benchmarks.bench_pipeline --pages 300 --tracemalloc-top 10
+"""
+
+import argparse
+import json
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from app.infra import jobs
+from app.infra.memory import MemoryBudget
+from app.infra.ocr import PageOCR
+from app.infra.pdf_parser import PDFParser
+from app.infra.storage import LocalStorage
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient, InMemoryJobRepository
+from tests.synthetic_pdf import generate_paper, rasterize
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+STAGES = ("parse", "chunk", "translate", "render")
+
+
+def _peak_rss_mb() -> float:
+    # Linux 는 KB, macOS 는 bytes 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+@contextmanager
+def _patched_jobs_module(job_store, storage, service) -> Iterator[None]:
+    """jobs 모듈의 프로세스 전역 의존성을 벤치마크용 구현으로 잠시 교체한다."""
+
+    original = (jobs.job_store, jobs.storage, jobs.translation_service)
+    jobs.job_store, jobs.storage, jobs.translation_service = job_store, storage, service
+    try:
+        yield
+    finally:
+        jobs.job_store, jobs.storage, jobs.translation_service = original
+
+
+def run_benchmark(
+    *,
+    pages: int,
+    paragraphs_per_page: int,
+    words_per_paragraph: int,
+    columns: int,
+    jobs_count: int,
+    llm_latency_ms: float,
+    llm_jitter_ms: float,
+    max_chars_per_chunk: int,
+    scanned: bool = False,
+    ocr_workers: Optional[int] = None,
+    tracemalloc_top: int = 0,
+) -> Dict:
+    llm = FakeLLMClient(llm_latency_ms / 1000, llm_jitter_ms / 1000)
+    ocr = PageOCR(workers=ocr_workers) if scanned else None
+    service = TranslationService(max_chars_per_chunk, parser=PDFParser(ocr=ocr), llm=llm)
+
+    with tempfile.TemporaryDirectory(prefix="bench-pipeline-") as tmp:
+        workdir = Path(tmp)
+        papers = [
+            generate_paper(
+                workdir / "input" / f"paper-{i}.pdf",
+                pages=pages,
+                paragraphs_per_page=paragraphs_per_page,
+                words_per_paragraph=words_per_paragraph,
+                columns=columns,
+                seed=i,
+            )
+            for i in range(jobs_count)
+        ]
+        if scanned:
+            papers = [rasterize(paper, paper.with_suffix(".scanned.pdf")) for paper in papers]
+
+        # 1) 서비스 단계별 측정
+        stage_samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        stage_peak_rss: Dict[str, int] = {stage: 0 for stage in STAGES}
+        stage_peak_traced: Dict[str, int] = {stage: 0 for stage in STAGES}
+        traced_peak = 0
+        tracemalloc.start()
+        for i, paper in enumerate(papers):
+            timings: Dict[str, float] = {}
+            budget = MemoryBudget()
+            service.translate_pdf(
+                paper, workdir / "service" / f"out-{i}.pdf", timings=timings, memory_budget=budget
+            )
+            for stage in STAGES:
+                stage_samples[stage].append(timings.get(stage, 0.0))
+                stage_peak_rss[stage] = max(stage_peak_rss[stage], budget.peak_rss.get(stage, 0))
+                stage_peak_traced[stage] = max(stage_peak_traced[stage], budget.peak_traced.get(stage, 0))
+        # 체크포인트마다 최대치를 초기화하므로 전체 최대치는 단계별 최대치 중 가장 큰 값이다.
+        traced_peak = max([tracemalloc.get_traced_memory()[1], *stage_peak_traced.values()])
+        top_allocations = []
+        if tracemalloc_top:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),)
+            )
+            top_allocations = [
+                {"location": str(stat.traceback), "size_kb": stat.size / 1024, "count": stat.count}
+                for stat in snapshot.statistics("lineno")[:tracemalloc_top]
+            ]
+        tracemalloc.stop()
+
+        # 2) Celery Task 전체 경로 (Storage/JobRepository 포함)
+        repo = InMemoryJobRepository()
+        storage = LocalStorage(base_dir=workdir / "data", fsync=False)
+        with _patched_jobs_module(repo, storage, service):
+            started = time.perf_counter()
+            for i, paper in enumerate(papers):
+                job_id = f"bench-{i}"
+                repo.create_job(job_id)
+                with paper.open("rb") as f:
+                    storage.save_original_stream(job_id, f)
+                jobs.translate_paper(job_id)
+                assert repo.get_status(job_id) == "COMPLETED"
+            task_elapsed = time.perf_counter() - started
+
+    if ocr is not None:
+        ocr.close()
+
+    return {
+        "params": {
+            "pages": pages,
+            "paragraphs_per_page": paragraphs_per_page,
+            "words_per_paragraph": words_per_paragraph,
+            "columns": columns,
+            "jobs": jobs_count,
+            "llm_latency_ms": llm_latency_ms,
+            "llm_jitter_ms": llm_jitter_ms,
+            "max_chars_per_chunk": max_chars_per_chunk,
+            "scanned": scanned,
+            "ocr_workers": ocr_workers,
+        },
+        "stages_ms": {
+            stage: {
+                "mean": statistics.mean(samples) * 1000,
+                "max": max(samples) * 1000,
+            }
+            for stage, samples in stage_samples.items()
+        },
+        "llm_calls": len(llm.calls),
+        "peak_traced_mb": traced_peak / (1024 * 1024),
+        "stage_peak_traced_mb": {stage: value / (1024 * 1024) for stage, value in stage_peak_traced.items()},
+        "stage_peak_rss_mb": {stage: value / (1024 * 1024) for stage, value in stage_peak_rss.items()},
+        "top_allocations": top_allocations,
+        "peak_rss_mb": _peak_rss_mb(),
+        "task_seconds": task_elapsed,
+        "jobs_per_minute": jobs_count / task_elapsed * 60 if task_elapsed else None,
+        "env": {"python": platform.python_version(), "platform": platform.platform()},
+        "timestamp": int(time.time()),
+    }
+
+
+def compare(current: Dict, baseline: Dict, *, tolerance: float) -> List[str]:
+    """baseline 대비 tolerance(비율) 이상 나빠진 지표 목록을 반환한다."""
+
+    regressions: List[str] = []
+
+    def check(name: str, now: Optional[float], before: Optional[float], higher_is_better: bool = False) -> None:
+        if not now or not before:
+            return
+        change = (now - before) / before
+        worse = -change if higher_is_better else change
+        print(f"  {name:<24} {before:10.2f} -> {now:10.2f} ({change:+.1%})")
+        if worse > tolerance:
+            regressions.append(name)
+
+    for stage in STAGES:
+        check(f"{stage}_ms", current["stages_ms"][stage]["mean"], baseline["stages_ms"][stage]["mean"])
+    check("peak_traced_mb", current["peak_traced_mb"], baseline["peak_traced_mb"])
+    check("jobs_per_minute", current["jobs_per_minute"], baseline["jobs_per_minute"], higher_is_better=True)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--paragraphs-per-page", type=int, default=6)
+    parser.add_argument("--words-per-paragraph", type=int, default=80)
+    parser.add_argument("--columns", type=int, default=1)
+    parser.add_argument("--jobs", type=int, default=3)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--max-chars-per-chunk", type=int, default=3000)
+    parser.add_argument("--scanned", action="store_true", help="페이지를 이미지로 바꾼 스캔 PDF로 OCR 경로 측정")
+    parser.add_argument("--ocr-workers", type=int, default=None)
+    parser.add_argument("--tracemalloc-top", type=int, default=0, help="할당량 상위 N개 코드 위치 출력")
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/<label>-<ts>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="회귀로 판단할 악화 비율")
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        pages=args.pages,
+        paragraphs_per_page=args.paragraphs_per_page,
+        words_per_paragraph=args.words_per_paragraph,
+        columns=args.columns,
+        jobs_count=args.jobs,
+        llm_latency_ms=args.llm_latency_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        max_chars_per_chunk=args.max_chars_per_chunk,
+        scanned=args.scanned,
+        ocr_workers=args.ocr_workers,
+        tracemalloc_top=args.tracemalloc_top,
+    )
+    result["label"] = args.label
+
+    for stage, values in result["stages_ms"].items():
+        print(
+            f"{stage:<10} mean={values['mean']:9.1f}ms max={values['max']:9.1f}ms "
+            f"traced={result['stage_peak_traced_mb'][stage]:7.1f}MB "
+            f"rss+={result['stage_peak_rss_mb'][stage]:7.1f}MB"
+        )
+    print(
+        f"llm_calls={result['llm_calls']} peak_traced={result['peak_traced_mb']:.1f}MB "
+        f"peak_rss={result['peak_rss_mb']:.1f}MB jobs_per_minute={result['jobs_per_minute']:.1f}"
+    )
+
+    for item in result["top_allocations"]:
+        print(f"  {item['size_kb']:10.1f}KB {item['count']:8d} {item['location']}")
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{args.label}-{result['timestamp']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"saved {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print(f"compare with {args.compare}:")
+        regressions = compare(result, baseline, tolerance=args.tolerance)
+        if regressions:
+            print(f"REGRESSION: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""번역 메모리 조회 지연 벤치마크.
+
+합성 문단 N개를 번역 메모리에 적재한 뒤, 정확 일치/유사 일치(일부 단어 변경)/미스 질의를
+배치 단위로 조회해 배치당 지연과 재현율(recall)을 측정한다.
+정확 일치만 번역을 재사용(reuse)하고, 유사 일치는 LLM 참고 번역(reference)으로만 쓰므로 따로 센다.
+
+    python -m benchmarks.bench_translation_memory --segments 100000
+    python -m benchmarks.bench_translation_memory --segments 1000000 --queries 2000
+    APP_DB_URL=... python -m benchmarks.bench_translation_memory --backend postgres --segments 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import List, Tuple
+
+from app.config import settings
+from app.infra.translation_memory import InMemoryTranslationMemory, PostgresTranslationMemory, TranslationMemory
+from tests.synthetic_pdf import WORDS, synthetic_paragraph
+
+
+def _mutate(rng: random.Random, text: str) -> str:
+    """긴 문단에서 단어 하나를 바꿔 유사 일치 질의를 만든다."""
+
+    words = text.split(" ")
+    words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def _load(memory: TranslationMemory, segments: List[str], batch_size: int) -> float:
+    started = time.perf_counter()
+    for start in range(0, len(segments), batch_size):
+        batch = segments[start : start + batch_size]
+        memory.add_many((source, source.upper()) for source in batch)
+    return time.perf_counter() - started
+
+
+def _measure(memory: TranslationMemory, queries: List[str], batch_size: int) -> Tuple[List[float], int, int]:
+    latencies: List[float] = []
+    reused = 0
+    referenced = 0
+    for start in range(0, len(queries), batch_size):
+        batch = queries[start : start + batch_size]
+        started = time.perf_counter()
+        results = memory.lookup_many(batch)
+        latencies.append(time.perf_counter() - started)
+        reused += sum(result is not None and result.exact for result in results)
+        referenced += sum(result is not None and not result.exact for result in results)
+    return latencies, reused, referenced
+
+
+def _report(kind: str, latencies: List[float], reused: int, referenced: int, total: int, batch_size: int) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{kind:<6} batches={len(latencies)} batch_size={batch_size} "
+        f"mean={statistics.mean(latencies) * 1000:8.2f}ms p95={p95 * 1000:8.2f}ms "
+        f"per_segment={statistics.mean(latencies) / batch_size * 1e6:8.1f}us "
+        f"reuse_rate={reused / total:.3f} reference_rate={referenced / total:.3f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--segments", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--words", type=int, default=80, help="문단당 단어 수")
+    parser.add_argument("--batch-size", type=int, default=50, help="조회 배치 크기 (한 Job 의 문단 수 수준)")
+    parser.add_argument(
+        "--threshold", type=float, default=settings.tm_fuzzy_threshold, help="유사 일치 임계값 (기본: 운영 설정)"
+    )
+    parser.add_argument("--backend", choices=["memory", "postgres"], default="memory")
+    parser.add_argument("--db-url", default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.backend == "postgres":
+        memory: TranslationMemory = PostgresTranslationMemory(
+            args.db_url or settings.db_url, fuzzy_threshold=args.threshold, min_chars=1
+        )
+        memory.migrate()
+    else:
+        memory = InMemoryTranslationMemory(fuzzy_threshold=args.threshold, min_chars=1)
+
+    segments = [synthetic_paragraph(rng, args.words) for _ in range(args.segments)]
+    load_seconds = _load(memory, segments, batch_size=1000)
+    print(f"loaded segments={args.segments} in {load_seconds:.1f}s ({args.segments / load_seconds:.0f}/s)")
+
+    sample = rng.sample(segments, min(args.queries, len(segments)))
+    exact_queries = sample
+    fuzzy_queries = [_mutate(rng, text) for text in sample]
+    miss_queries = [synthetic_paragraph(random.Random(args.seed + 1 + i), args.words) for i in range(len(sample))]
+
+    for kind, queries in (("exact", exact_queries), ("fuzzy", fuzzy_queries), ("miss", miss_queries)):
+        latencies, reused, referenced = _measure(memory, queries, args.batch_size)
+        _report(kind, latencies, reused, referenced, len(queries), args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -92,6 +92,10 @@ export default function App() {
         } catch {
           // ignore
         }
+        const retryAfter = res.headers.get('Retry-After');
+        if (res.status === 429 && retryAfter) {
+          detail = `${detail} (약 ${retryAfter}초 후 재시도)`;
+        }
         throw new Error(detail);
       }
       const data = await res.json();
@@ -103,6 +107,9 @@ export default function App() {
       setStatus('PENDING');
       setPageProgress(null);
       appendLog(`업로드 완료, job_id=${newJobId}`);
+      if (data.estimatedStartAt) {
+        appendLog(`예상 시작 시각: ${new Date(data.estimatedStartAt * 1000).toLocaleString()}`);
+      }
       appendLog('자동 상태 폴링을 시작합니다.');
       setIsPolling(true);
       fetchJobs();
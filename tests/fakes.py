@@ -0,0 +1,148 @@
+"""벤치마크/테스트용 가짜 인프라 구현."""
+
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.infra.latency import LatencyHistogram
+
+
+class FakeLLMClient:
+    """지연 시간을 설정할 수 있는 가짜 LLMClient.
+
+    실제 API를 호출하지 않고 latency_seconds(± jitter) 만큼 대기한 뒤 입력을 변형해 돌려준다.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        jitter_seconds: float = 0.0,
+        seed: int = 0,
+        model_latency: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._latency = latency_seconds
+        self._model_latency = model_latency or {}
+        self._jitter = jitter_seconds
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.latency = LatencyHistogram()
+        self.calls: List[str] = []
+        self.glossaries: List[Optional[Dict[str, str]]] = []
+        self.models: List[Optional[str]] = []
+        self.system_prompts: List[Optional[str]] = []
+        self.references: List[Optional[list]] = []
+
+    def translate_chunk(
+        self,
+        text: str,
+        *,
+        deadline=None,
+        usage=None,
+        glossary=None,
+        model=None,
+        timeout=None,
+        max_retries=None,
+        system_prompt=None,
+        references=None,
+    ) -> str:
+        with self._lock:
+            base = self._model_latency.get(model, self._latency)
+            delay = max(base + self._random.uniform(-self._jitter, self._jitter), 0.0)
+            self.calls.append(text)
+            self.glossaries.append(glossary)
+            self.models.append(model)
+            self.system_prompts.append(system_prompt)
+            self.references.append(references)
+
+        if timeout is not None and delay > timeout:
+            # 실제 클라이언트처럼 읽기 타임아웃까지 기다린 뒤 실패한다.
+            time.sleep(timeout)
+            raise httpx.ReadTimeout(f"fake timeout after {timeout}s")
+
+        started = time.perf_counter()
+        if delay:
+            time.sleep(delay)
+        self.latency.observe(time.perf_counter() - started)
+        if usage is not None:
+            # 대략 4글자 = 1토큰으로 가정
+            usage.add(model or "fake-model", len(text) // 4 + 1, len(text) // 4 + 1)
+        return text.upper()
+
+
+class InMemoryJobRepository:
+    """JobRepository 와 같은 인터페이스의 메모리 구현 (DB 없이 Task 실행용)."""
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def create_job(self, job_id: str, **fields) -> None:
+        now = int(time.time())
+        with self._lock:
+            self._jobs[job_id] = {
+                "jobId": job_id,
+                "lastStatus": "PENDING",
+                "createdAt": now * 1000,
+                "lastUpdatedAt": now * 1000,
+                "fileName": fields.get("file_name"),
+                "pageCount": fields.get("page_count"),
+                "errorCode": None,
+                "ownerId": fields.get("owner_id"),
+                "expiresAt": fields.get("expires_at"),
+                "sourceLanguage": fields.get("source_language"),
+                "targetLanguage": fields.get("target_language"),
+                "promptProfile": fields.get("prompt_profile"),
+            }
+
+    def create_jobs(self, jobs: List[Dict]) -> None:
+        for job in jobs:
+            fields = dict(job)
+            self.create_job(fields.pop("job_id"), **fields)
+
+    def _update(self, job_id: str, **values) -> None:
+        with self._lock:
+            job = self._jobs.setdefault(job_id, {"jobId": job_id})
+            job.update(values)
+            job["lastUpdatedAt"] = int(time.time()) * 1000
+
+    def set_status(self, job_id: str, status: str) -> None:
+        self._update(job_id, lastStatus=status)
+
+    def set_page_count(self, job_id: str, page_count: int) -> None:
+        self._update(job_id, pageCount=page_count)
+
+    def set_error(self, job_id: str, error_code: str, status: str = "FAILED") -> None:
+        self._update(job_id, lastStatus=status, errorCode=error_code)
+
+    def record_usage(self, job_id: str, **usage) -> None:
+        self._update(
+            job_id,
+            promptTokens=usage["prompt_tokens"],
+            completionTokens=usage["completion_tokens"],
+            llmCalls=usage["llm_calls"],
+            costUsd=usage["cost_usd"],
+        )
+
+    def backlog_stats(self, *, since: int, default_page_count: int = 10) -> Dict:
+        with self._lock:
+            active = [
+                job
+                for job in self._jobs.values()
+                if job.get("lastStatus") in ("PENDING", "RUNNING") and job.get("createdAt", 0) >= since * 1000
+            ]
+        pages = sum(job["pageCount"] if job.get("pageCount") is not None else default_page_count for job in active)
+        return {"jobs": len(active), "pages": pages}
+
+    def get_status(self, job_id: str) -> Optional[str]:
+        job = self._jobs.get(job_id)
+        return job["lastStatus"] if job else None
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job else None
+
+    def get_jobs(self, job_ids: List[str]) -> Dict[str, Dict]:
+        return {job_id: dict(self._jobs[job_id]) for job_id in job_ids if job_id in self._jobs}
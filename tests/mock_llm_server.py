@@ -0,0 +1,144 @@
+"""OpenAI 호환 Chat Completions 모의 서버.
+
+지정한 지연 후 입력 텍스트를 그대로 돌려준다. LLMClient 전송 계층 벤치마크/테스트용.
+
+    python -m tests.mock_llm_server --port 8001 --latency-ms 200
+    APP_LLM_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=dummy ...
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    server: "MockLLMServer"
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.record_connection(self.client_address)
+
+        time.sleep(self.server.model_latency.get(payload.get("model"), self.server.latency_seconds))
+        if self.server.take_failure():
+            self._send(500, b'{"error": {"message": "mock failure", "type": "server_error"}}')
+            return
+
+        text = payload.get("messages", [{}])[-1].get("content", "")
+        body = json.dumps(
+            {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": payload.get("model", "mock"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": max(len(text) // 4, 1),
+                    "completion_tokens": max(len(text) // 4, 1),
+                    "total_tokens": max(len(text) // 4, 1) * 2,
+                },
+            }
+        ).encode("utf-8")
+
+        self._send(200, body)
+
+    def _send(self, status: int, body: bytes) -> None:
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            trickle = self.server.trickle_seconds
+            if trickle:
+                # 응답 본문을 조금씩 보낸다 (소켓 read 마다의 타임아웃에는 걸리지 않는 느린 응답).
+                step = max(len(body) // 10, 1)
+                for offset in range(0, len(body), step):
+                    self.wfile.write(body[offset : offset + step])
+                    self.wfile.flush()
+                    time.sleep(trickle)
+            else:
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 타임아웃으로 먼저 연결을 끊은 경우
+            self.close_connection = True
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency_seconds: float = 0.0,
+        model_latency: Optional[Dict[str, float]] = None,
+        failures: int = 0,
+        trickle_seconds: float = 0.0,
+    ) -> None:
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.latency_seconds = latency_seconds
+        self.model_latency = model_latency or {}  # 모델별 지연 (라우팅/폴백 시험용)
+        self.failures = failures  # 처음 이 횟수만큼의 요청은 500 으로 응답 (재시도 시험용)
+        self.trickle_seconds = trickle_seconds  # 응답 본문 조각 사이의 지연
+        self.request_count = 0
+        self._connections: set = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    @property
+    def connection_count(self) -> int:
+        """요청을 보낸 서로 다른 클라이언트 소켓 수 (keep-alive 재사용 확인용)."""
+
+        return len(self._connections)
+
+    def record_connection(self, address) -> None:
+        with self._lock:
+            self._connections.add(address)
+            self.request_count += 1
+
+    def take_failure(self) -> bool:
+        with self._lock:
+            if self.failures <= 0:
+                return False
+            self.failures -= 1
+            return True
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    server = MockLLMServer(args.port, args.latency_ms / 1000)
+    print(f"mock LLM server listening on {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
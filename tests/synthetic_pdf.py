@@ -0,0 +1,87 @@
+"""합성 논문 PDF 생성기.
+
+페이지 수, 페이지당 문단 수, 문단 길이, 단(column) 수를 조절해 결정적인(seed 고정) 영어 PDF를 만든다.
+"""
+
+import random
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+
+WORDS = (
+    "model training data transformer attention layer network results method "
+    "proposed approach experiment baseline performance evaluation dataset learning "
+    "optimization gradient loss accuracy analysis section figure table equation "
+    "we show that our the of and in to for with on is are this by from"
+).split()
+
+
+def synthetic_paragraph(rng: random.Random, words: int) -> str:
+    """WORDS 에서 단어를 뽑아 문장 하나짜리 영어 문단을 만든다."""
+
+    tokens = [rng.choice(WORDS) for _ in range(words)]
+    tokens[0] = tokens[0].capitalize()
+    return " ".join(tokens) + "."
+
+
+def generate_paper(
+    output_path: Path | str,
+    *,
+    pages: int = 10,
+    paragraphs_per_page: int = 6,
+    words_per_paragraph: int = 80,
+    columns: int = 1,
+    seed: int = 0,
+) -> Path:
+    """합성 논문 PDF를 만들고 경로를 반환한다."""
+
+    rng = random.Random(seed)
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    doc = fitz.open()
+    try:
+        for page_no in range(pages):
+            page = doc.new_page()  # A4 기본 크기와 유사한 595x842
+            width, height = page.rect.width, page.rect.height
+            margin = 50
+            gap = 20
+            col_width = (width - 2 * margin - gap * (columns - 1)) / columns
+
+            paragraphs = [synthetic_paragraph(rng, words_per_paragraph) for _ in range(paragraphs_per_page)]
+            per_column = max(1, -(-len(paragraphs) // columns))
+
+            for col in range(columns):
+                x0 = margin + col * (col_width + gap)
+                rect = fitz.Rect(x0, margin, x0 + col_width, height - margin)
+                text = "\n\n".join(paragraphs[col * per_column : (col + 1) * per_column])
+                if page_no == 0 and col == 0:
+                    text = f"Synthetic Paper {seed}\n\n" + text
+                page.insert_textbox(rect, text, fontsize=9 if columns > 1 else 10, fontname="helv")
+        doc.save(path)
+    finally:
+        doc.close()
+
+    return path
+
+
+def rasterize(input_path: Path | str, output_path: Path | str, *, dpi: int = 150) -> Path:
+    """각 페이지를 이미지로 렌더링해 텍스트 레이어가 없는 스캔 PDF를 만든다."""
+
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    src = fitz.open(Path(input_path))
+    out = fitz.open()
+    try:
+        for page in src:
+            pixmap = page.get_pixmap(dpi=dpi)
+            target = out.new_page(width=page.rect.width, height=page.rect.height)
+            target.insert_image(target.rect, pixmap=pixmap)
+        out.save(path)
+    finally:
+        out.close()
+        src.close()
+
+    return path
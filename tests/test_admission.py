@@ -0,0 +1,191 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.infra.storage import LocalStorage
+from app.services.admission import AdmissionController
+from tests.fakes import InMemoryJobRepository
+from tests.synthetic_pdf import generate_paper
+
+
+class FakeTask:
+    def __init__(self) -> None:
+        self.enqueued: list[str] = []
+
+    def delay(self, job_id: str, **_kwargs) -> None:
+        self.enqueued.append(job_id)
+
+
+def _repo_with_backlog(pages: list[int]) -> InMemoryJobRepository:
+    repo = InMemoryJobRepository()
+    for i, page_count in enumerate(pages):
+        repo.create_job(f"queued-{i}", page_count=page_count)
+    return repo
+
+
+def test_controller_estimates_start_and_rejects_when_saturated() -> None:
+    now = 1_000_000.0
+    controller = AdmissionController(
+        lambda: 0,
+        seconds_per_page=2.0,
+        concurrency=2,
+        max_wait_seconds=100,
+        clock=lambda: now,
+    )
+
+    # 10 + 20 페이지 × 2초 ÷ 동시성 2 = 30초 대기
+    decision = controller.evaluate(_repo_with_backlog([10, 20]))
+    assert decision.admitted
+    assert decision.backlog_seconds == 30
+    assert decision.estimated_start_at == int(now) + 30
+
+    # 150 페이지 → 150초 대기, 한도(100초)를 50초 초과
+    rejected = controller.evaluate(_repo_with_backlog([150]))
+    assert not rejected.admitted
+    assert rejected.retry_after == 50
+
+
+def test_controller_counts_incoming_pages() -> None:
+    now = 1_000_000.0
+    controller = AdmissionController(
+        lambda: 0,
+        seconds_per_page=2.0,
+        concurrency=2,
+        max_wait_seconds=100,
+        clock=lambda: now,
+    )
+    repo = _repo_with_backlog([30])
+
+    # 기존 30페이지(30초) + 업로드 50페이지(50초): 시작은 30초 뒤, 한도 안
+    decision = controller.evaluate(repo, incoming_pages=50)
+    assert decision.admitted
+    assert decision.backlog_seconds == 80
+    assert decision.estimated_start_at == int(now) + 30
+
+    # 업로드 1000페이지 → 1030초, 한도를 넘지만 기존 대기열(30초)이 빠지는 것 이상은 기다려도 소용없다
+    rejected = controller.evaluate(repo, incoming_pages=1000)
+    assert not rejected.admitted
+    assert rejected.backlog_seconds == 1030
+    assert rejected.retry_after == 30
+
+    # 대기열이 비어 있으면 큰 업로드도 승인한다.
+    assert controller.evaluate(InMemoryJobRepository(), incoming_pages=1000).admitted
+
+
+def test_controller_rejects_on_queue_depth_and_caches_it() -> None:
+    calls: list[int] = []
+
+    def depth() -> int:
+        calls.append(1)
+        return 12
+
+    controller = AdmissionController(depth, seconds_per_page=1.0, concurrency=1, max_queue_depth=10)
+    repo = _repo_with_backlog([4])
+
+    decision = controller.evaluate(repo)
+    assert not decision.admitted
+    assert decision.queue_depth == 12
+    # 한도 초과 3건 × Job 당 4초
+    assert decision.retry_after == 12
+
+    controller.evaluate(repo)
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def upload_client(tmp_path: Path, monkeypatch):
+    repo = _repo_with_backlog([5])
+    storage = LocalStorage(base_dir=tmp_path / "data", fsync=False)
+    task = FakeTask()
+    controller = AdmissionController(lambda: None, seconds_per_page=4.0, concurrency=1, max_wait_seconds=60)
+    monkeypatch.setattr(main, "job_store", repo)
+    monkeypatch.setattr(main, "storage", storage)
+    monkeypatch.setattr(main, "translate_paper", task)
+    monkeypatch.setattr(main, "admission", controller)
+    return TestClient(main.app), repo, task, controller
+
+
+def _upload(client: TestClient, path: Path):
+    with path.open("rb") as f:
+        return client.post("/upload", files={"file": ("paper.pdf", f, "application/pdf")})
+
+
+def test_upload_returns_estimated_start(upload_client, tmp_path: Path) -> None:
+    client, repo, task, _controller = upload_client
+    paper = generate_paper(tmp_path / "paper.pdf", pages=3)
+
+    resp = _upload(client, paper)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["pageCount"] == 3
+    assert body["estimatedStartAt"] >= 20  # 앞선 5페이지 × 4초
+    assert task.enqueued == [body["job_id"]]
+    assert repo.get_job(body["job_id"])["pageCount"] == 3
+
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def test_upload_runs_blocking_calls_off_the_event_loop(upload_client, tmp_path: Path, monkeypatch) -> None:
+    client, repo, task, _controller = upload_client
+    seen: list[tuple[str, bool]] = []
+    create_job, delay = repo.create_job, task.delay
+
+    def recording_create_job(*args, **kwargs):
+        seen.append(("create_job", _on_event_loop()))
+        return create_job(*args, **kwargs)
+
+    def recording_delay(*args, **kwargs):
+        seen.append(("delay", _on_event_loop()))
+        return delay(*args, **kwargs)
+
+    monkeypatch.setattr(repo, "create_job", recording_create_job)
+    monkeypatch.setattr(task, "delay", recording_delay)
+
+    assert _upload(client, generate_paper(tmp_path / "paper.pdf", pages=1)).status_code == 200
+    # DB 쓰기와 브로커 전송은 이벤트 루프 스레드가 아닌 스레드풀에서 실행된다.
+    assert seen == [("create_job", False), ("delay", False)]
+
+def test_upload_rejected_with_retry_after(upload_client, tmp_path: Path) -> None:
+    client, repo, task, controller = upload_client
+    controller.max_wait_seconds = 10
+    paper = generate_paper(tmp_path / "paper.pdf", pages=1)
+
+    resp = _upload(client, paper)
+
+    # 앞선 5페이지 + 업로드 1페이지 = 24초, 한도(10초)를 14초 초과
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == "14"
+    assert task.enqueued == []
+
+
+def test_upload_rejected_by_its_own_pages(upload_client, tmp_path: Path) -> None:
+    client, _repo, task, controller = upload_client
+    controller.max_wait_seconds = 25
+    # 앞선 5페이지(20초)만으로는 한도 안이지만 업로드 3페이지(12초)를 더하면 7초 넘는다.
+    paper = generate_paper(tmp_path / "paper.pdf", pages=3)
+
+    resp = _upload(client, paper)
+
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == "7"
+    assert task.enqueued == []
+
+
+def test_upload_rejects_invalid_pdf(upload_client, tmp_path: Path) -> None:
+    client, _repo, task, _controller = upload_client
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+
+    assert _upload(client, broken).status_code == 400
+    assert task.enqueued == []
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.infra.storage import LocalStorage
+from app.services.admission import AdmissionController
+from tests.fakes import InMemoryJobRepository
+from tests.synthetic_pdf import generate_paper
+
+
+@pytest.fixture
+def batch_client(tmp_path: Path, monkeypatch):
+    repo = InMemoryJobRepository()
+    storage = LocalStorage(base_dir=tmp_path / "data", fsync=False)
+    enqueued: list[list[str]] = []
+    monkeypatch.setattr(main, "job_store", repo)
+    monkeypatch.setattr(main, "storage", storage)
+    monkeypatch.setattr(main, "enqueue_translations", enqueued.append)
+    monkeypatch.setattr(main.settings, "admission_enabled", False)
+    return TestClient(main.app), repo, storage, enqueued
+
+
+def test_batch_upload_creates_and_enqueues_jobs_once(batch_client, tmp_path: Path) -> None:
+    client, repo, storage, enqueued = batch_client
+    papers = [generate_paper(tmp_path / f"p{i}.pdf", pages=i + 1, seed=i) for i in range(3)]
+
+    files = [("files", (p.name, p.read_bytes(), "application/pdf")) for p in papers]
+    files.insert(1, ("files", ("notes.txt", b"hello", "text/plain")))
+    resp = client.post("/upload:batch", files=files)
+
+    assert resp.status_code == 200
+    items = resp.json()["items"]
+    assert [item["fileName"] for item in items] == ["p0.pdf", "notes.txt", "p1.pdf", "p2.pdf"]
+    assert "error" in items[1] and "job_id" not in items[1]
+    assert [item["pageCount"] for item in items if "job_id" in item] == [1, 2, 3]
+
+    job_ids = [item["job_id"] for item in items if "job_id" in item]
+    assert enqueued == [job_ids]
+    for job_id in job_ids:
+        assert repo.get_status(job_id) == "PENDING"
+        assert Path(storage.get_original_path(job_id)).exists()
+
+
+def test_batch_upload_limit(batch_client, monkeypatch) -> None:
+    client, _repo, _storage, enqueued = batch_client
+    monkeypatch.setattr(main.settings, "batch_max_items", 1)
+
+    files = [("files", (f"{i}.pdf", b"%PDF", "application/pdf")) for i in range(2)]
+    assert client.post("/upload:batch", files=files).status_code == 400
+    assert enqueued == []
+
+
+def test_batch_upload_admission_counts_batch_pages(batch_client, tmp_path: Path, monkeypatch) -> None:
+    client, repo, _storage, enqueued = batch_client
+    repo.create_job("queued", page_count=5)
+    # 앞선 5페이지(5초)는 한도(10초) 안이지만 배치 2 + 4 페이지를 더하면 1초 넘는다.
+    controller = AdmissionController(lambda: None, seconds_per_page=1.0, concurrency=1, max_wait_seconds=10)
+    monkeypatch.setattr(main, "admission", controller)
+    monkeypatch.setattr(main.settings, "admission_enabled", True)
+    papers = [generate_paper(tmp_path / f"p{i}.pdf", pages=pages, seed=i) for i, pages in enumerate((2, 4))]
+    files = [("files", (p.name, p.read_bytes(), "application/pdf")) for p in papers]
+
+    resp = client.post("/upload:batch", files=files)
+
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == "1"
+    assert enqueued == []
+
+    # 첫 파일만이면 한도 안
+    assert client.post("/upload:batch", files=files[:1]).status_code == 200
+
+
+def test_status_batch(batch_client) -> None:
+    client, repo, _storage, _enqueued = batch_client
+    repo.create_job("job-a", page_count=3)
+    repo.create_job("job-b")
+    repo.set_error("job-b", "TRANSLATION_FAILED")
+
+    resp = client.post("/status:batch", json={"jobIds": ["job-a", "job-b", "job-a", "nope"]})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item["job_id"] for item in body["items"]] == ["job-a", "job-b"]
+    assert body["items"][0]["pageCount"] == 3
+    assert body["items"][1]["errorCode"] == "TRANSLATION_FAILED"
+    assert body["missing"] == ["nope"]
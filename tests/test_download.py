@@ -0,0 +1,92 @@
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.infra.storage import LocalStorage
+
+
+PDF_BYTES = b"%PDF-1.4\n" + b"translated-content " * 2000
+
+
+class DummyJobRepo:
+    def __init__(self, jobs: dict[str, dict]) -> None:
+        self._jobs = jobs
+
+    def get_job(self, job_id: str):
+        return self._jobs.get(job_id)
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch) -> TestClient:
+    storage = LocalStorage(base_dir=tmp_path)
+    storage.save_translated("job-1", PDF_BYTES)
+
+    repo = DummyJobRepo(
+        {"job-1": {"jobId": "job-1", "lastStatus": "COMPLETED", "expiresAt": int(time.time()) + 3600}}
+    )
+    monkeypatch.setattr(main, "storage", storage)
+    monkeypatch.setattr(main, "job_store", repo)
+    return TestClient(main.app)
+
+
+def test_download_full_with_validators(client: TestClient) -> None:
+    resp = client.get("/download/job-1")
+
+    assert resp.status_code == 200
+    assert resp.content == PDF_BYTES
+    assert resp.headers["etag"].startswith('"')
+    assert resp.headers["accept-ranges"] == "bytes"
+    assert "last-modified" in resp.headers
+    assert "immutable" in resp.headers["cache-control"]
+
+
+def test_repeated_download_is_not_modified(client: TestClient) -> None:
+    first = client.get("/download/job-1")
+    etag = first.headers["etag"]
+
+    # 같은 ETag 로 재요청하면 본문 없이 304
+    second = client.get("/download/job-1", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert len(second.content) < len(first.content)
+
+    by_date = client.get("/download/job-1", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert by_date.status_code == 304
+
+    # 다른 ETag 면 전체 응답
+    other = client.get("/download/job-1", headers={"If-None-Match": '"other"'})
+    assert other.status_code == 200
+    assert other.content == PDF_BYTES
+
+
+def test_range_download_resumes_partial_content(client: TestClient) -> None:
+    size = len(PDF_BYTES)
+
+    resp = client.get("/download/job-1", headers={"Range": "bytes=100-199"})
+    assert resp.status_code == 206
+    assert resp.content == PDF_BYTES[100:200]
+    assert resp.headers["content-range"] == f"bytes 100-199/{size}"
+
+    tail = client.get("/download/job-1", headers={"Range": "bytes=-10"})
+    assert tail.status_code == 206
+    assert tail.content == PDF_BYTES[-10:]
+
+    resume = client.get("/download/job-1", headers={"Range": f"bytes={size - 5}-"})
+    assert resume.content == PDF_BYTES[-5:]
+
+    unsatisfiable = client.get("/download/job-1", headers={"Range": f"bytes={size}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{size}"
+
+
+def test_if_range_mismatch_returns_full_content(client: TestClient) -> None:
+    resp = client.get("/download/job-1", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert resp.status_code == 200
+    assert resp.content == PDF_BYTES
+
+
+def test_download_missing_job(client: TestClient) -> None:
+    assert client.get("/download/missing").status_code == 404
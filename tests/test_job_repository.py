@@ -9,6 +9,7 @@ from app.infra.job_repository import JobRepository
 def _clear_jobs() -> None:
     """테스트 격리를 위해 jobs 테이블을 비운다."""
 
+    JobRepository(settings.db_url).migrate()
     conn = psycopg2.connect(settings.db_url)
     try:
         with conn:
@@ -79,3 +80,73 @@ def test_set_page_count_updates_metadata() -> None:
     job = repo.get_job(job_id)
     assert job is not None
     assert job["pageCount"] == 123
+
+
+def test_record_usage_and_summary() -> None:
+    _clear_jobs()
+    repo = JobRepository(settings.db_url)
+
+    repo.create_job("usage-a", owner_id="alice")
+    repo.create_job("usage-b", owner_id="alice")
+    repo.create_job("usage-c", owner_id="bob")
+
+    repo.record_usage("usage-a", prompt_tokens=100, completion_tokens=50, llm_calls=2, cost_usd=0.5)
+    repo.record_usage("usage-b", prompt_tokens=10, completion_tokens=5, llm_calls=1, cost_usd=0.25)
+
+    job = repo.get_job("usage-a")
+    assert job is not None
+    assert job["promptTokens"] == 100
+    assert job["completionTokens"] == 50
+    assert job["llmCalls"] == 2
+    assert job["costUsd"] == 0.5
+
+    now = int(time.time())
+    summary = repo.usage_summary(since=now - 3600, until=now + 3600)
+    by_owner = {item["ownerId"]: item for item in summary}
+
+    assert by_owner["alice"]["jobs"] == 2
+    assert by_owner["alice"]["promptTokens"] == 110
+    assert by_owner["alice"]["costUsd"] == 0.75
+    assert by_owner["bob"]["llmCalls"] == 0
+
+    only_bob = repo.usage_summary(since=now - 3600, until=now + 3600, owner_id="bob")
+    assert [item["ownerId"] for item in only_bob] == ["bob"]
+
+
+def test_backlog_stats_counts_active_jobs() -> None:
+    _clear_jobs()
+    repo = JobRepository(settings.db_url)
+    now = int(time.time())
+
+    repo.create_job("backlog-a", page_count=12)
+    repo.create_job("backlog-b")  # 페이지 수 미상 → 기본값
+    repo.create_job("backlog-c", page_count=30)
+    repo.set_status("backlog-c", "COMPLETED")
+    repo.create_job("backlog-d", page_count=7)
+    repo.set_status("backlog-d", "RUNNING")
+
+    assert repo.backlog_stats(since=now - 60, default_page_count=5) == {"jobs": 3, "pages": 24}
+    assert repo.backlog_stats(since=now + 60) == {"jobs": 0, "pages": 0}
+
+
+def test_create_jobs_and_get_jobs_in_batch() -> None:
+    _clear_jobs()
+    repo = JobRepository(settings.db_url)
+
+    repo.create_jobs(
+        [
+            {"job_id": "batch-a", "file_name": "a.pdf", "page_count": 2},
+            {"job_id": "batch-b", "owner_id": "alice", "source_language": "en", "target_language": "ja"},
+        ]
+    )
+    repo.create_jobs([])
+
+    jobs = repo.get_jobs(["batch-a", "batch-b", "missing"])
+    assert set(jobs) == {"batch-a", "batch-b"}
+    assert jobs["batch-a"]["fileName"] == "a.pdf"
+    assert jobs["batch-a"]["pageCount"] == 2
+    assert jobs["batch-b"]["ownerId"] == "alice"
+    assert jobs["batch-b"]["lastStatus"] == "PENDING"
+    assert jobs["batch-b"]["targetLanguage"] == "ja"
+    assert jobs["batch-a"]["targetLanguage"] is None
+    assert repo.get_jobs([]) == {}
@@ -0,0 +1,91 @@
+from app.infra import lazy
+from app.infra.lazy import ProcessLocal
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.value = 42
+
+
+def test_process_local_is_lazy_and_cached() -> None:
+    created: list[_Counter] = []
+
+    def factory() -> _Counter:
+        obj = _Counter()
+        created.append(obj)
+        return obj
+
+    proxy = ProcessLocal(factory)
+
+    # 생성만으로는 factory 가 호출되지 않아야 함
+    assert created == []
+    assert not proxy.initialized
+
+    # 첫 접근 시 생성, 이후에는 같은 인스턴스 재사용
+    assert proxy.value == 42
+    assert proxy.value == 42
+    assert len(created) == 1
+    assert proxy.get() is created[0]
+
+
+def test_process_local_recreates_after_fork(monkeypatch) -> None:
+    created: list[_Counter] = []
+
+    def factory() -> _Counter:
+        obj = _Counter()
+        created.append(obj)
+        return obj
+
+    proxy = ProcessLocal(factory)
+    parent = proxy.get()
+
+    # fork 된 자식 프로세스를 pid 변경으로 흉내낸다
+    monkeypatch.setattr(lazy.os, "getpid", lambda: -1)
+    child = proxy.get()
+
+    assert child is not parent
+    assert len(created) == 2
+
+
+def test_process_local_reset() -> None:
+    proxy = ProcessLocal(_Counter)
+    first = proxy.get()
+    proxy.reset()
+    assert proxy.get() is not first
+
+
+def test_process_local_concurrent_first_access_creates_once() -> None:
+    import threading
+    import time
+
+    created: list[_Counter] = []
+
+    def factory() -> _Counter:
+        time.sleep(0.05)  # 다른 스레드가 경쟁할 시간을 준다
+        obj = _Counter()
+        created.append(obj)
+        return obj
+
+    proxy = ProcessLocal(factory)
+    barrier = threading.Barrier(8)
+    results: list[_Counter] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(proxy.get())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(created) == 1
+    assert all(r is created[0] for r in results)
+
+
+def test_process_local_fork_resets_lock() -> None:
+    proxy = ProcessLocal(_Counter)
+    old_lock = proxy._lock
+    lazy._reset_locks_after_fork()
+    assert proxy._lock is not old_lock
@@ -0,0 +1,190 @@
+import asyncio
+import time
+
+import openai
+import pytest
+
+from app.infra import jobs
+from app.infra.latency import LatencyHistogram
+from app.infra.llm_client import (
+    AsyncLLMClient,
+    Deadline,
+    LLMClient,
+    LLMDeadlineExceeded,
+    LLMTransportConfig,
+)
+from app.infra.storage import LocalStorage
+from app.services.translation_service import TranslationService
+from tests.fakes import InMemoryJobRepository
+from tests.mock_llm_server import MockLLMServer
+from tests.synthetic_pdf import generate_paper
+
+
+@pytest.fixture
+def mock_server(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    server = MockLLMServer().start()
+    yield server
+    server.stop()
+
+
+def test_llm_client_reuses_connections(mock_server: MockLLMServer) -> None:
+    client = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=0))
+    try:
+        for i in range(5):
+            assert client.translate_chunk(f"hello {i}") == f"hello {i}"
+    finally:
+        client.close()
+
+    # keep-alive 로 하나의 커넥션을 재사용해야 함
+    assert mock_server.connection_count == 1
+    assert client.latency.count == 5
+
+
+def test_async_llm_client(mock_server: MockLLMServer) -> None:
+    async def run() -> list[str]:
+        client = AsyncLLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=0))
+        try:
+            return await asyncio.gather(*(client.translate_chunk(f"c{i}") for i in range(4)))
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == ["c0", "c1", "c2", "c3"]
+
+
+def test_deadline_exhausted_skips_request(mock_server: MockLLMServer) -> None:
+    client = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=0))
+    try:
+        with pytest.raises(LLMDeadlineExceeded):
+            client.translate_chunk("late", deadline=Deadline(0))
+    finally:
+        client.close()
+
+    assert mock_server.connection_count == 0
+
+
+def test_latency_histogram_percentiles() -> None:
+    hist = LatencyHistogram(buckets=(0.1, 1.0, 10.0))
+    assert hist.percentile(0.5) is None
+
+    for value in (0.05, 0.05, 0.5, 0.5, 5.0):
+        hist.observe(value)
+
+    snap = hist.snapshot()
+    assert snap["count"] == 5
+    assert snap["buckets"] == {"le_0.1": 2, "le_1": 2, "le_10": 1, "le_inf": 0}
+    assert hist.percentile(0.5) == 1.0
+    assert hist.percentile(0.99) == 10.0
+
+
+def test_llm_client_http2_enabled(mock_server: MockLLMServer) -> None:
+    # APP_LLM_HTTP2=true 는 h2 패키지(httpx[http2])가 있어야 한다.
+    client = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=0, http2=True))
+    try:
+        assert client.translate_chunk("hello") == "hello"
+    finally:
+        client.close()
+
+
+def test_messages_include_references_as_examples_only() -> None:
+    messages = LLMClient._messages("text", references=[("10 epochs", "10 에폭")])
+    system = messages[0]["content"]
+    assert "Source: 10 epochs\nTranslation: 10 에폭" in system
+    assert "never copy them verbatim" in system
+    assert messages[1] == {"role": "user", "content": "text"}
+
+
+def test_retries_transient_errors(mock_server: MockLLMServer) -> None:
+    mock_server.failures = 2
+    client = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=2))
+    try:
+        assert client.translate_chunk("hello") == "hello"
+    finally:
+        client.close()
+
+    assert mock_server.request_count == 3
+
+
+def test_retries_stop_at_job_deadline(mock_server: MockLLMServer) -> None:
+    # 재시도마다 예산 전체를 새로 쓰지 않고, 남은 Job 예산 안에서만 다시 시도한다.
+    mock_server.failures = 100
+    mock_server.latency_seconds = 0.2
+    client = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=10))
+    started = time.monotonic()
+    try:
+        with pytest.raises(openai.InternalServerError):
+            client.translate_chunk("hello", deadline=Deadline(1.0))
+    finally:
+        client.close()
+
+    assert time.monotonic() - started < 1.5
+    assert 1 < mock_server.request_count < 11
+
+
+def test_slow_response_body_is_cut_at_job_deadline(mock_server: MockLLMServer) -> None:
+    # 소켓 read 마다의 타임아웃에는 걸리지 않게 조금씩 흘러오는 응답도 예산에서 끊는다.
+    mock_server.trickle_seconds = 0.2
+    client = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=0))
+    started = time.monotonic()
+    try:
+        with pytest.raises(LLMDeadlineExceeded):
+            client.translate_chunk("hello", deadline=Deadline(0.5))
+    finally:
+        client.close()
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_async_slow_response_body_is_cut_at_timeout(mock_server: MockLLMServer) -> None:
+    mock_server.trickle_seconds = 0.2
+
+    async def run() -> None:
+        client = AsyncLLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=0))
+        try:
+            await client.translate_chunk("hello", timeout=0.5)
+        finally:
+            await client.aclose()
+
+    started = time.monotonic()
+    with pytest.raises(openai.APITimeoutError):
+        asyncio.run(run())
+    assert time.monotonic() - started < 1.0
+
+
+def test_timeout_at_job_deadline_is_deadline_error(mock_server: MockLLMServer) -> None:
+    # 남은 예산으로 줄인 타임아웃에 걸리면 일반 타임아웃이 아니라 Job 예산 초과(TimeoutError)로 본다.
+    mock_server.latency_seconds = 1.0
+    client = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=2))
+    try:
+        with pytest.raises(LLMDeadlineExceeded) as excinfo:
+            client.translate_chunk("hello", deadline=Deadline(0.3))
+    finally:
+        client.close()
+
+    assert isinstance(excinfo.value, TimeoutError)
+    assert isinstance(excinfo.value.__cause__, openai.APITimeoutError)
+    assert mock_server.request_count == 1
+
+
+def test_job_deadline_timeout_is_recorded_as_timeout(mock_server: MockLLMServer, tmp_path, monkeypatch) -> None:
+    mock_server.latency_seconds = 1.0
+    repo = InMemoryJobRepository()
+    storage = LocalStorage(base_dir=tmp_path / "data", fsync=False)
+    llm = LLMClient(LLMTransportConfig(base_url=mock_server.base_url, max_retries=2))
+    monkeypatch.setattr(jobs, "job_store", repo)
+    monkeypatch.setattr(jobs, "storage", storage)
+    monkeypatch.setattr(jobs, "translation_service", TranslationService(llm=llm))
+    monkeypatch.setattr(jobs.settings, "llm_job_deadline_seconds", 0.3)
+
+    repo.create_job("slow-1")
+    paper = generate_paper(tmp_path / "paper.pdf", pages=1)
+    with paper.open("rb") as f:
+        storage.save_original_stream("slow-1", f)
+
+    try:
+        with pytest.raises(LLMDeadlineExceeded):
+            jobs.translate_paper("slow-1")
+    finally:
+        llm.close()
+
+    assert repo.get_job("slow-1")["errorCode"] == "TRANSLATION_TIMEOUT"
@@ -0,0 +1,195 @@
+from pathlib import Path
+
+import httpx
+import openai
+import pytest
+
+from app.infra.llm_client import Deadline, LLMClient, LLMDeadlineExceeded, LLMTransportConfig
+from app.infra.llm_router import ChunkFeatures, ModelRouter, RoutingPolicy
+from app.infra.prompts import TranslationProfile
+from app.infra.translation_memory import InMemoryTranslationMemory
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient
+from tests.mock_llm_server import MockLLMServer
+from tests.synthetic_pdf import generate_paper
+
+
+PROSE = "We evaluate the proposed method on three public datasets and report the mean accuracy."
+MATH = "Let L(θ) = ∑_i log p(y_i | x_i; θ) + λ‖θ‖², where ∇L ≤ ε and α ∈ {0, 1}."
+
+POLICY = RoutingPolicy(cheap_model="cheap", strong_model="strong", fallback_model="backup", fallback_after_seconds=0.1)
+
+
+def test_chunk_features_and_model_choice() -> None:
+    prose = ChunkFeatures.from_text(PROSE)
+    math = ChunkFeatures.from_text(MATH)
+    mixed = ChunkFeatures.from_text("본 논문에서는 새로운 방법을 제안한다. We propose a method.")
+
+    assert prose.math_density == 0.0 and prose.foreign_ratio == 0.0
+    assert math.math_density > 0.1
+    assert mixed.foreign_ratio > 0.3
+
+    assert POLICY.choose(prose) == "cheap"
+    assert POLICY.choose(math) == "strong"
+    assert POLICY.choose(mixed) == "strong"
+    # strong_model 이 없으면 항상 기본 모델
+    assert RoutingPolicy(cheap_model="cheap").choose(math) == "cheap"
+
+
+@pytest.mark.parametrize(
+    "source_language, text",
+    [
+        ("ko", "본 논문에서는 세 가지 공개 데이터셋으로 제안한 방법을 평가하고 평균 정확도(accuracy)를 보고한다."),
+        ("ja", "本論文では、提案手法を三つの公開データセットで評価し、平均精度（accuracy）を報告する。"),
+        ("zh", "本文在三个公开数据集上评估所提出的方法，并报告平均准确率（accuracy）。"),
+        ("de", "Wir bewerten die vorgeschlagene Methode auf drei öffentlichen Datensätzen."),
+    ],
+)
+def test_source_language_prose_routes_cheap(source_language: str, text: str) -> None:
+    features = ChunkFeatures.from_text(text, source_language=source_language)
+
+    assert features.foreign_ratio == 0.0
+    assert POLICY.choose(features) == "cheap"
+    # 영어 원문으로 보면 거의 모든 문자가 원문 언어 밖이다.
+    if source_language != "de":
+        assert POLICY.choose(ChunkFeatures.from_text(text)) == "strong"
+
+
+def test_foreign_script_relative_to_source_language() -> None:
+    mixed = "本論文では新しい手法を提案する。본 논문에서는 새로운 방법을 제안한다."
+
+    assert ChunkFeatures.from_text(mixed, source_language="ja").foreign_ratio > 0.3
+    assert POLICY.choose(ChunkFeatures.from_text(mixed, source_language="ja")) == "strong"
+
+
+def test_router_falls_back_on_timeout() -> None:
+    llm = FakeLLMClient(model_latency={"strong": 1.0})
+    router = ModelRouter(llm, POLICY)
+
+    assert router.translate_chunk(MATH) == MATH.upper()
+    assert llm.models == ["strong", "backup"]
+
+    # 저렴한 모델 요청은 제 시간에 끝나므로 폴백하지 않는다.
+    assert router.translate_chunk(PROSE) == PROSE.upper()
+    assert llm.models[2:] == ["cheap"]
+
+
+class FlakyLLMClient(FakeLLMClient):
+    """지정한 모델의 요청을 주어진 오류로 실패시키는 가짜 클라이언트."""
+
+    def __init__(self, failing_model: str, error: Exception) -> None:
+        super().__init__()
+        self._failing_model = failing_model
+        self._error = error
+        self.max_retries: list = []
+
+    def translate_chunk(self, text: str, **kwargs) -> str:
+        self.max_retries.append(kwargs.get("max_retries"))
+        if kwargs.get("model") == self._failing_model:
+            self.models.append(kwargs["model"])
+            raise self._error
+        return super().translate_chunk(text, **kwargs)
+
+
+def _status_error(cls, status: int):
+    request = httpx.Request("POST", "http://llm.test/v1/chat/completions")
+    return cls("error", response=httpx.Response(status, request=request), body=None)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _status_error(openai.RateLimitError, 429),
+        _status_error(openai.InternalServerError, 503),
+        openai.APIConnectionError(request=httpx.Request("POST", "http://llm.test")),
+    ],
+    ids=["429", "503", "connection"],
+)
+def test_router_falls_back_on_transient_errors(error) -> None:
+    llm = FlakyLLMClient("strong", error)
+    router = ModelRouter(llm, POLICY)
+
+    assert router.translate_chunk(MATH) == MATH.upper()
+    assert llm.models == ["strong", "backup"]
+    # 1차 요청만 재시도를 끄고, 보조 모델 요청은 SDK 기본 재시도를 쓴다.
+    assert llm.max_retries == [0, None]
+
+
+def test_router_does_not_swallow_client_errors() -> None:
+    llm = FlakyLLMClient("strong", _status_error(openai.BadRequestError, 400))
+    router = ModelRouter(llm, POLICY)
+
+    with pytest.raises(openai.BadRequestError):
+        router.translate_chunk(MATH)
+    assert llm.models == ["strong"]
+
+
+def test_router_fallback_with_real_client(monkeypatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    server = MockLLMServer(model_latency={"strong": 2.0}).start()
+    client = LLMClient(LLMTransportConfig(base_url=server.base_url, max_retries=2))
+    try:
+        router = ModelRouter(client, POLICY)
+        assert router.translate_chunk(MATH) == MATH
+
+        # Job 예산이 이미 소진되었으면 폴백하지 않고 실패한다.
+        with pytest.raises(LLMDeadlineExceeded):
+            router.translate_chunk(MATH, deadline=Deadline(0))
+    finally:
+        client.close()
+        server.stop()
+
+
+def test_service_routes_chunks(tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=1, paragraphs_per_page=2, words_per_paragraph=30)
+    llm = FakeLLMClient()
+    service = TranslationService(llm=llm, router=ModelRouter(llm, POLICY))
+
+    service.translate_pdf(paper, tmp_path / "out.pdf")
+
+    assert llm.models and set(llm.models) <= {"cheap", "strong"}
+
+
+class _TextParser:
+    def __init__(self, pages: list[str]) -> None:
+        self._pages = pages
+
+    def extract_pages(self, _path, **_kwargs) -> list[str]:
+        return self._pages
+
+
+def test_service_routes_by_job_source_language(tmp_path: Path) -> None:
+    llm = FakeLLMClient()
+    parser = _TextParser(["本論文では、提案手法を三つの公開データセットで評価する。"])
+    service = TranslationService(parser=parser, llm=llm, router=ModelRouter(llm, POLICY))
+
+    service.translate_pdf(tmp_path / "in.pdf", tmp_path / "out.pdf", profile=TranslationProfile("ja", "ko"))
+
+    assert llm.models == ["cheap"]
+
+
+class _RecordingRouter(ModelRouter):
+    def __init__(self, client, policy) -> None:
+        super().__init__(client, policy)
+        self.cache_misses: list[bool] = []
+
+    def translate_chunk(self, text: str, *, cache_miss: bool = False, **kwargs) -> str:
+        self.cache_misses.append(cache_miss)
+        return super().translate_chunk(text, cache_miss=cache_miss, **kwargs)
+
+
+def test_service_cache_miss_is_per_chunk(tmp_path: Path) -> None:
+    stored = "We train the model for 10 epochs with a batch size of 64 on the full training corpus."
+    memory = InMemoryTranslationMemory(fuzzy_threshold=0.5, min_chars=20)
+    memory.add_many([(stored, "전체 학습 말뭉치에서 배치 크기 64로 10 에폭 동안 학습한다.")])
+
+    llm = FakeLLMClient()
+    router = _RecordingRouter(llm, POLICY)
+    # 문단마다 청크가 나뉘도록 청크 크기를 작게 둔다.
+    parser = _TextParser([stored.replace("10", "50") + "\n\n" + PROSE])
+    service = TranslationService(10, parser=parser, llm=llm, memory=memory, router=router)
+
+    service.translate_pdf(tmp_path / "in.pdf", tmp_path / "out.pdf")
+
+    # 참고 번역이 있는 청크는 미스가 아니고, 아무것도 찾지 못한 청크만 미스다.
+    assert router.cache_misses == [False, True]
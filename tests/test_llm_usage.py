@@ -0,0 +1,20 @@
+from app.infra.llm_usage import JobUsage
+
+
+def test_job_usage_totals_and_cost() -> None:
+    usage = JobUsage()
+    usage.add("cheap", 1_000_000, 500_000)
+    usage.add("cheap", 0, 500_000)
+    usage.add("strong", 100_000, 0)
+
+    assert usage.prompt_tokens == 1_100_000
+    assert usage.completion_tokens == 1_000_000
+    assert usage.calls == 3
+    assert usage.by_model()["cheap"] == (1_000_000, 1_000_000, 2)
+
+    prices = {"cheap": (0.5, 2.0), "strong": (10.0, 30.0)}
+    # cheap: 1M*0.5 + 1M*2.0 = 2.5, strong: 0.1M*10 = 1.0
+    assert usage.cost_usd(prices) == 3.5
+
+    # 가격 정보가 없는 모델이 있으면 비용을 추정하지 않음
+    assert usage.cost_usd({"cheap": (0.5, 2.0)}) is None
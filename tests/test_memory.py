@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from app.infra import jobs
+from app.infra.memory import MemoryBudget, MemoryBudgetExceeded, current_rss_bytes, release_memory
+from app.infra.pdf_generator import PDFGenerator
+from app.infra.pdf_parser import PDFParser
+from app.infra.storage import LocalStorage
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient, InMemoryJobRepository
+from tests.synthetic_pdf import generate_paper
+
+
+class FakeRSS:
+    def __init__(self, value: int = 100) -> None:
+        self.value = value
+
+    def __call__(self) -> int:
+        return self.value
+
+
+def test_budget_records_stage_peaks_and_raises_over_limit() -> None:
+    rss = FakeRSS()
+    budget = MemoryBudget(50, rss=rss)
+
+    rss.value = 130
+    budget.checkpoint("parse")
+    rss.value = 120
+    budget.checkpoint("parse")
+    assert budget.peak_rss == {"parse": 30}
+
+    rss.value = 151
+    with pytest.raises(MemoryBudgetExceeded, match="render"):
+        budget.checkpoint("render")
+
+
+def test_current_rss_and_release_memory() -> None:
+    assert current_rss_bytes() > 0
+    release_memory()
+
+
+def test_parser_and_generator_checkpoint_per_page_window(tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=5, paragraphs_per_page=2, words_per_paragraph=20)
+
+    calls: list[str] = []
+    pages = PDFParser(page_window=2).extract_pages(paper, checkpoint=lambda: calls.append("parse"))
+    assert len(pages) == 5
+    assert calls == ["parse", "parse"]
+
+    PDFGenerator(page_window=2).generate(
+        ["line"] * 200, tmp_path / "out.pdf", checkpoint=lambda: calls.append("render")
+    )
+    assert calls.count("render") >= 2
+
+
+def test_job_over_memory_budget_fails(tmp_path: Path, monkeypatch) -> None:
+    repo = InMemoryJobRepository()
+    storage = LocalStorage(base_dir=tmp_path / "data", fsync=False)
+    monkeypatch.setattr(jobs, "job_store", repo)
+    monkeypatch.setattr(jobs, "storage", storage)
+    monkeypatch.setattr(jobs, "translation_service", TranslationService(llm=FakeLLMClient()))
+
+    rss = FakeRSS()
+
+    def grow() -> int:
+        rss.value += 1024 * 1024
+        return rss.value
+
+    monkeypatch.setattr(jobs.MemoryBudget, "from_settings", classmethod(lambda cls: cls(1, rss=grow)))
+
+    paper = generate_paper(tmp_path / "paper.pdf", pages=2)
+    repo.create_job("job-mem")
+    with paper.open("rb") as f:
+        storage.save_original_stream("job-mem", f)
+
+    with pytest.raises(MemoryBudgetExceeded):
+        jobs.translate_paper("job-mem")
+
+    job = repo.get_job("job-mem")
+    assert job["lastStatus"] == "FAILED"
+    assert job["errorCode"] == "MEMORY_BUDGET_EXCEEDED"
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import psycopg2
+import pytest
+
+from app.infra import migrate
+from app.infra.storage import LocalStorage, S3Storage
+
+
+class _Conn:
+    def close(self) -> None:
+        pass
+
+
+def test_wait_for_db_retries_until_ready(monkeypatch) -> None:
+    attempts: list[int] = []
+
+    def connect(_url, **_kwargs):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise psycopg2.OperationalError("not ready")
+        return _Conn()
+
+    monkeypatch.setattr(migrate.psycopg2, "connect", connect)
+    migrate.wait_for_db("postgresql://x", timeout=5, interval=0)
+    assert len(attempts) == 3
+
+
+def test_wait_for_db_gives_up(monkeypatch) -> None:
+    def connect(_url, **_kwargs):
+        raise psycopg2.OperationalError("down")
+
+    monkeypatch.setattr(migrate.psycopg2, "connect", connect)
+    with pytest.raises(psycopg2.OperationalError):
+        migrate.wait_for_db("postgresql://x", timeout=0, interval=0)
+
+
+def test_copy_local_files_to_object_storage(tmp_path: Path, monkeypatch) -> None:
+    moto = pytest.importorskip("moto")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+
+    local = LocalStorage(base_dir=tmp_path / "data", compression="deflate", fsync=False)
+    local.save_original("job-a", b"%PDF original a")
+    local.save_translated("job-a", b"%PDF translated a")
+    local.save_artifact("job-a", "paragraphs.jsonl.gz", b"stream")
+    local.archive_original("job-a")  # 압축 보관된 원본
+    # 샤딩 도입 이전의 평면 구조 파일
+    (tmp_path / "data" / "original").mkdir(parents=True, exist_ok=True)
+    (tmp_path / "data" / "original" / "job-b.pdf").write_bytes(b"%PDF original b")
+
+    with moto.mock_aws():
+        target = S3Storage(bucket="paper-test", region="us-east-1")
+        target.ensure_bucket()
+
+        assert migrate.copy_local_to_object_storage(local, target) == 4
+        assert migrate.copy_local_to_object_storage(local, target) == 0
+
+        assert target.fetch_original("job-a", tmp_path).read_bytes() == b"%PDF original a"
+        assert target.fetch_original("job-b", tmp_path).read_bytes() == b"%PDF original b"
+        assert b"".join(target.iter_translated("job-a")) == b"%PDF translated a"
+        assert target.stat_translated("job-a").etag == local.stat_translated("job-a").etag
+        assert target.load_artifact("job-a", "paragraphs.jsonl.gz") == b"stream"
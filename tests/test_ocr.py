@@ -0,0 +1,125 @@
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+
+from app.infra import jobs, ocr
+from app.infra.ocr import PageOCR
+from app.infra.pdf_parser import NoTextExtracted, PDFParser
+from app.infra.storage import LocalStorage
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient, InMemoryJobRepository
+from tests.synthetic_pdf import generate_paper, rasterize
+
+
+@pytest.fixture
+def scanned(tmp_path: Path) -> Path:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=3, paragraphs_per_page=2, words_per_paragraph=20)
+    return rasterize(paper, tmp_path / "scanned.pdf")
+
+
+def test_page_count_includes_image_only_pages(scanned: Path) -> None:
+    assert PDFParser().extract_pages(scanned) == []
+    assert TranslationService(llm=FakeLLMClient()).get_page_count(scanned) == 3
+
+
+def test_ocr_fills_scanned_pages_and_caches(scanned: Path, tmp_path: Path, monkeypatch) -> None:
+    calls: list[int] = []
+
+    def fake_tesseract(pdf_path: str, page_index: int, language: str, dpi: int) -> str:
+        calls.append(page_index)
+        return f"ocr page {page_index}"
+
+    monkeypatch.setattr(ocr, "_run_tesseract", fake_tesseract)
+    monkeypatch.setattr(ocr, "tesseract_available", lambda: True)
+
+    parser = PDFParser(ocr=PageOCR(workers=0, cache_dir=tmp_path / "cache"))
+    assert parser.extract_pages(scanned) == ["ocr page 0", "ocr page 1", "ocr page 2"]
+    assert calls == [0, 1, 2]
+
+    # 같은 스캔 이미지는 캐시에서 읽는다 (다른 파일 경로여도 동일).
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(scanned.read_bytes())
+    assert parser.extract_pages(copy) == ["ocr page 0", "ocr page 1", "ocr page 2"]
+    assert calls == [0, 1, 2]
+
+
+def test_ocr_language_follows_source_language(scanned: Path, tmp_path: Path, monkeypatch) -> None:
+    calls: list[tuple[int, str]] = []
+
+    def fake_tesseract(pdf_path: str, page_index: int, language: str, dpi: int) -> str:
+        calls.append((page_index, language))
+        return f"{language} page {page_index}"
+
+    monkeypatch.setattr(ocr, "_run_tesseract", fake_tesseract)
+    monkeypatch.setattr(ocr, "tesseract_available", lambda: True)
+
+    parser = PDFParser(ocr=PageOCR(workers=0, cache_dir=tmp_path / "cache"))
+    assert parser.extract_pages(scanned, source_language="ja")[0] == "jpn+eng page 0"
+    assert parser.extract_pages(scanned)[0] == "eng page 0"
+    # 캐시는 OCR 언어별로 나뉜다.
+    assert parser.extract_pages(scanned, source_language="ja")[0] == "jpn+eng page 0"
+    assert [language for _index, language in calls] == ["jpn+eng"] * 3 + ["eng"] * 3
+
+    # 언어를 지정하면 원문 언어와 상관없이 그 언어를 쓴다.
+    fixed = PDFParser(ocr=PageOCR(language="kor", workers=0))
+    assert fixed.extract_pages(scanned, source_language="ja")[0] == "kor page 0"
+
+
+def test_scanned_pdf_without_text_fails_job(scanned: Path, tmp_path: Path, monkeypatch) -> None:
+    repo = InMemoryJobRepository()
+    storage = LocalStorage(base_dir=tmp_path / "data", fsync=False)
+    monkeypatch.setattr(jobs, "job_store", repo)
+    monkeypatch.setattr(jobs, "storage", storage)
+    monkeypatch.setattr(jobs, "translation_service", TranslationService(llm=FakeLLMClient()))
+
+    repo.create_job("scan-1")
+    with scanned.open("rb") as f:
+        storage.save_original_stream("scan-1", f)
+
+    with pytest.raises(NoTextExtracted):
+        jobs.translate_paper("scan-1")
+
+    job = repo.get_job("scan-1")
+    assert job["lastStatus"] == "FAILED"
+    assert job["errorCode"] == "NO_TEXT_EXTRACTED"
+
+
+@pytest.mark.skipif(not ocr.tesseract_available(), reason="tesseract not installed")
+def test_tesseract_recognizes_rasterized_text(tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=2, paragraphs_per_page=1, words_per_paragraph=10)
+    scanned = rasterize(paper, tmp_path / "scanned.pdf", dpi=200)
+
+    pages = PDFParser(ocr=PageOCR(workers=2)).extract_pages(scanned)
+
+    assert len(pages) == 2
+    assert "Synthetic" in pages[0]
+
+
+def _worker_pid(_arg: int) -> int:
+    return os.getpid()
+
+
+def _map_in_daemon(queue) -> None:
+    ocr_ = PageOCR(workers=2)
+    try:
+        queue.put((os.getpid(), ocr_._pool_map(_worker_pid, range(4))))
+    finally:
+        ocr_.close()
+
+
+def test_ocr_pool_runs_under_daemonic_parent() -> None:
+    # Celery prefork 자식처럼 데몬 프로세스 안에서도 프로세스 풀로 OCR 한다.
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    parent = ctx.Process(target=_map_in_daemon, args=(queue,), daemon=True)
+    parent.start()
+    try:
+        parent_pid, worker_pids = queue.get(timeout=60)
+    finally:
+        parent.join(timeout=30)
+
+    assert parent.exitcode == 0
+    assert len(worker_pids) == 4
+    assert parent_pid not in worker_pids
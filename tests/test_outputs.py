@@ -0,0 +1,140 @@
+import gzip
+from pathlib import Path
+
+import fitz
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.infra import jobs
+from app.infra.paragraph_stream import PARAGRAPHS_ARTIFACT, decode_paragraphs, encode_paragraphs
+from app.infra.storage import LocalStorage
+from app.services.output_service import OutputService
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient, InMemoryJobRepository
+from tests.synthetic_pdf import generate_paper
+
+
+def test_paragraph_stream_roundtrip() -> None:
+    pairs = [("Hello", "안녕하세요"), ("Second\nline", ""), ('quote " and \\', "x")]
+    assert decode_paragraphs(encode_paragraphs(pairs)) == pairs
+
+    with pytest.raises(ValueError):
+        decode_paragraphs(gzip.compress(b'{"format": "other"}\n'))
+
+
+@pytest.fixture
+def translated_job(tmp_path: Path, monkeypatch):
+    repo = InMemoryJobRepository()
+    storage = LocalStorage(base_dir=tmp_path / "data", fsync=False)
+    llm = FakeLLMClient()
+    for module in (jobs, main):
+        monkeypatch.setattr(module, "job_store", repo)
+        monkeypatch.setattr(module, "storage", storage)
+    monkeypatch.setattr(jobs, "translation_service", TranslationService(llm=llm))
+
+    paper = generate_paper(tmp_path / "paper.pdf", pages=2, paragraphs_per_page=3, words_per_paragraph=30)
+    repo.create_job("job-out")
+    with paper.open("rb") as f:
+        storage.save_original_stream("job-out", f)
+    jobs.translate_paper("job-out")
+    return TestClient(main.app), storage, llm
+
+
+def test_translation_persists_paragraph_stream(translated_job) -> None:
+    _client, storage, _llm = translated_job
+
+    pairs = decode_paragraphs(storage.load_artifact("job-out", PARAGRAPHS_ARTIFACT))
+    assert pairs[0][0].startswith("Synthetic Paper 0")
+    assert all(tgt == src.upper() for src, tgt in pairs)
+
+
+def test_output_formats_render_lazily_without_retranslation(translated_job) -> None:
+    client, storage, llm = translated_job
+    calls = len(llm.calls)
+
+    md = client.get("/download/job-out/markdown")
+    assert md.status_code == 200
+    assert md.headers["content-type"].startswith("text/markdown")
+    assert 'filename="translated_job-out.md"' in md.headers["content-disposition"]
+
+    html = client.get("/download/job-out/html")
+    assert html.status_code == 200
+    assert html.text.startswith("<!DOCTYPE html>")
+
+    pdf = client.get("/download/job-out/bilingual")
+    assert pdf.status_code == 200
+    doc = fitz.open(stream=pdf.content, filetype="pdf")
+    try:
+        text = "".join(page.get_text() for page in doc)
+    finally:
+        doc.close()
+    # 원문과 번역이 나란히 렌더링된다.
+    assert "Synthetic Paper 0" in text
+    assert "SYNTHETIC PAPER 0" in text
+
+    assert len(llm.calls) == calls
+    assert storage.load_artifact("job-out", OutputService.cache_name("html")) == html.content
+
+    # 렌더러가 바뀌면 같은 URL 의 내용이 바뀌므로 immutable 이 아니라 ETag 로 재검증한다.
+    assert html.headers["cache-control"] == "private, no-cache"
+    cached = client.get("/download/job-out/html", headers={"If-None-Match": html.headers["etag"]})
+    assert cached.status_code == 304
+
+
+def test_translated_pdf_rerenders_without_retranslation(translated_job) -> None:
+    client, _storage, llm = translated_job
+    calls = len(llm.calls)
+
+    pdf = client.get("/download/job-out/pdf")
+
+    assert pdf.status_code == 200
+    assert 'filename="translated_job-out.pdf"' in pdf.headers["content-disposition"]
+    doc = fitz.open(stream=pdf.content, filetype="pdf")
+    try:
+        text = "".join(page.get_text() for page in doc)
+    finally:
+        doc.close()
+    # 번역 문단만 렌더링한다 (원문은 없음).
+    assert "SYNTHETIC PAPER 0" in text
+    assert "Synthetic Paper 0" not in text
+    assert len(llm.calls) == calls
+
+
+def test_output_errors(translated_job) -> None:
+    client, _storage, _llm = translated_job
+
+    assert client.get("/download/job-out/docx").status_code == 400
+    missing = client.get("/download/missing/markdown")
+    assert missing.status_code == 404
+    assert missing.json()["detail"] == "아직 번역이 완료되지 않았거나 없는 job입니다."
+
+
+class _FailingArtifactStorage(LocalStorage):
+    def save_artifact(self, job_id: str, name: str, data: bytes) -> str:
+        raise OSError("disk full")
+
+    def archive_original(self, job_id: str) -> None:
+        raise OSError("disk full")
+
+
+def test_optional_storage_failures_are_logged(tmp_path: Path, monkeypatch, caplog) -> None:
+    repo = InMemoryJobRepository()
+    storage = _FailingArtifactStorage(base_dir=tmp_path / "data", fsync=False)
+    monkeypatch.setattr(jobs, "job_store", repo)
+    monkeypatch.setattr(jobs, "storage", storage)
+    monkeypatch.setattr(jobs, "translation_service", TranslationService(llm=FakeLLMClient()))
+
+    paper = generate_paper(tmp_path / "paper.pdf", pages=1)
+    repo.create_job("job-flaky")
+    with paper.open("rb") as f:
+        storage.save_original_stream("job-flaky", f)
+
+    with caplog.at_level("WARNING", logger=jobs.__name__):
+        jobs.translate_paper("job-flaky")
+
+    # 부가 저장 실패는 Job 결과에 영향을 주지 않지만 job_id 와 함께 기록된다.
+    assert repo.get_status("job-flaky") == "COMPLETED"
+    messages = [record.getMessage() for record in caplog.records]
+    assert "failed to save paragraph stream for job_id=job-flaky" in messages
+    assert "failed to archive original for job_id=job-flaky" in messages
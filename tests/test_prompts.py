@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.infra import jobs
+from app.infra.llm_client import SYSTEM_PROMPT
+from app.infra.prompts import DEFAULT_PROFILE, TranslationProfile
+from app.infra.storage import LocalStorage
+from app.infra.translation_memory import Glossary, InMemoryTranslationMemory
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient, InMemoryJobRepository
+from tests.synthetic_pdf import generate_paper
+
+
+def test_profile_namespaces_and_prompts() -> None:
+    # 프로필 도입 전 기본 설정은 기존 번역 메모리 키(en-ko)를 그대로 쓴다.
+    assert DEFAULT_PROFILE.cache_namespace == "en-ko"
+    assert DEFAULT_PROFILE.system_prompt == SYSTEM_PROMPT
+    assert "Translate English into Korean." in SYSTEM_PROMPT
+
+    ja = TranslationProfile("en", "ja")
+    fluent = TranslationProfile("en", "ko", "fluent")
+    assert ja.cache_namespace == "en-ja.academic-v1"
+    assert fluent.cache_namespace == "en-ko.fluent-v1"
+    assert "Translate English into Japanese." in ja.system_prompt
+    # 시스템 프롬프트는 (프로필, 언어쌍)당 한 번만 만든다.
+    assert ja.system_prompt is TranslationProfile("en", "ja").system_prompt
+
+    assert TranslationProfile.from_job({"targetLanguage": "ja"}) == ja
+    assert TranslationProfile.from_job(None) == DEFAULT_PROFILE
+    for args in (("en", "xx"), ("ko", "ko"), ("en", "ko", "missing")):
+        with pytest.raises(ValueError):
+            TranslationProfile(*args)
+
+
+def test_language_pairs_use_separate_memory_and_glossary(tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=1, paragraphs_per_page=3, words_per_paragraph=40)
+    memory = InMemoryTranslationMemory()
+    llm = FakeLLMClient()
+    service = TranslationService(
+        llm=llm,
+        memory=memory,
+        glossaries={"en-ko": Glossary({"synthetic": "합성"}), "en-ja": Glossary({"synthetic": "合成"})},
+    )
+
+    service.translate_pdf(paper, tmp_path / "ko.pdf")
+    ko_calls = len(llm.calls)
+
+    # 다른 언어쌍은 en-ko 번역을 재사용하지 않고, 자기 프롬프트/용어집으로 번역한다.
+    ja = TranslationProfile("en", "ja")
+    service.translate_pdf(paper, tmp_path / "ja.pdf", profile=ja)
+    assert len(llm.calls) == 2 * ko_calls
+    assert llm.system_prompts[-1] == ja.system_prompt
+    assert {"synthetic": "合成"} in llm.glossaries[ko_calls:]
+
+    # 언어쌍을 추가해도 기존 en-ko 번역은 그대로 재사용된다.
+    service.translate_pdf(paper, tmp_path / "ko-again.pdf")
+    resent = [p for chunk in llm.calls[2 * ko_calls :] for p in chunk.split("\n\n")]
+    assert all(not memory.eligible(p) for p in resent)
+
+
+class EagerTask:
+    """브로커 없이 업로드 요청 안에서 바로 번역 Task 를 실행한다."""
+
+    def delay(self, job_id: str, **_kwargs) -> None:
+        jobs.translate_paper(job_id)
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch):
+    repo = InMemoryJobRepository()
+    storage = LocalStorage(base_dir=tmp_path / "data", fsync=False)
+    llm = FakeLLMClient()
+    for module in (jobs, main):
+        monkeypatch.setattr(module, "job_store", repo)
+        monkeypatch.setattr(module, "storage", storage)
+    monkeypatch.setattr(jobs, "translation_service", TranslationService(llm=llm))
+    monkeypatch.setattr(main, "translate_paper", EagerTask())
+    monkeypatch.setattr(main.settings, "admission_enabled", False)
+    return TestClient(main.app), repo, llm
+
+
+def test_upload_stores_profile_and_worker_uses_it(client, tmp_path: Path) -> None:
+    api, repo, llm = client
+    paper = generate_paper(tmp_path / "paper.pdf", pages=1)
+
+    with paper.open("rb") as f:
+        resp = api.post(
+            "/upload",
+            files={"file": ("paper.pdf", f, "application/pdf")},
+            data={"targetLanguage": "ja", "promptProfile": "fluent"},
+        )
+    assert resp.status_code == 200
+    job_id = resp.json()["job_id"]
+
+    status = api.get(f"/status/{job_id}").json()
+    assert status["status"] == "COMPLETED"
+    assert (status["sourceLanguage"], status["targetLanguage"], status["promptProfile"]) == ("en", "ja", "fluent")
+    assert llm.system_prompts[-1] == TranslationProfile("en", "ja", "fluent").system_prompt
+
+    html = api.get(f"/download/{job_id}/html")
+    assert '<html lang="ja">' in html.text
+
+
+def test_upload_rejects_unknown_profile(client, tmp_path: Path) -> None:
+    api, _repo, _llm = client
+    paper = generate_paper(tmp_path / "paper.pdf", pages=1)
+
+    with paper.open("rb") as f:
+        resp = api.post(
+            "/upload",
+            files={"file": ("paper.pdf", f, "application/pdf")},
+            data={"targetLanguage": "xx"},
+        )
+    assert resp.status_code == 400
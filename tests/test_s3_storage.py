@@ -0,0 +1,69 @@
+import io
+from pathlib import Path
+
+import pytest
+
+moto = pytest.importorskip("moto")
+
+from app.infra.storage import S3Storage  # noqa: E402
+
+
+@pytest.fixture
+def s3_storage(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        storage = S3Storage(
+            bucket="paper-test",
+            region="us-east-1",
+            multipart_chunk_size=5 * 1024 * 1024,
+        )
+        storage.ensure_bucket()
+        yield storage
+
+
+def test_s3_storage_roundtrip(s3_storage: S3Storage, tmp_path: Path) -> None:
+    job_id = "job-s3"
+
+    # multipart 임계값(5MB)을 넘는 원본을 스트리밍 업로드
+    original = b"%PDF" + b"x" * (6 * 1024 * 1024)
+    s3_storage.save_original_stream(job_id, io.BytesIO(original))
+
+    fetched = s3_storage.fetch_original(job_id, tmp_path)
+    assert fetched is not None
+    assert fetched.read_bytes() == original
+    assert s3_storage.fetch_original("missing", tmp_path) is None
+
+    src = tmp_path / "translated.pdf"
+    src.write_bytes(b"0123456789")
+    s3_storage.save_translated_file(job_id, src)
+
+    stored = s3_storage.stat_translated(job_id)
+    assert stored is not None
+    assert stored.size == 10
+    assert s3_storage.stat_translated("missing") is None
+
+    assert b"".join(s3_storage.iter_translated(job_id)) == b"0123456789"
+    assert b"".join(s3_storage.iter_translated(job_id, start=2, end=5)) == b"2345"
+
+    url = s3_storage.get_translated_url(job_id, filename="translated_job-s3.pdf")
+    assert url is not None
+    assert "translated/job-s3.pdf" in url
+    assert "Signature" in url or "X-Amz-Signature" in url
+
+    s3_storage.delete_original(job_id)
+    s3_storage.delete_translated(job_id)
+    assert s3_storage.fetch_original(job_id, tmp_path) is None
+    assert s3_storage.stat_translated(job_id) is None
+
+
+def test_s3_storage_artifacts(s3_storage: S3Storage) -> None:
+    assert s3_storage.load_artifact("job-s3", "paragraphs.jsonl.gz") is None
+
+    s3_storage.save_artifact("job-s3", "paragraphs.jsonl.gz", b"stream")
+    s3_storage.save_artifact("job-s3", "render-html-v1.html", b"<p>")
+    assert s3_storage.load_artifact("job-s3", "paragraphs.jsonl.gz") == b"stream"
+
+    s3_storage.delete_artifacts("job-s3")
+    assert s3_storage.load_artifact("job-s3", "paragraphs.jsonl.gz") is None
+    assert s3_storage.load_artifact("job-s3", "render-html-v1.html") is None
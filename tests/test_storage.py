@@ -1,5 +1,10 @@
+import hashlib
+import io
+import os
 from pathlib import Path
 
+import pytest
+
 from app.infra.storage import LocalStorage
 
 
@@ -33,3 +38,136 @@ def test_local_storage_save_get_delete(tmp_path: Path) -> None:
     storage.delete_translated(job_id)
     assert not original_path.exists()
     assert not translated_path.exists()
+
+
+def test_local_storage_stream_fetch_and_range(tmp_path: Path) -> None:
+    storage = LocalStorage(base_dir=tmp_path / "data")
+
+    job_id = "job-456"
+    storage.save_original_stream(job_id, io.BytesIO(b"%PDF-original"))
+
+    # 로컬 원본은 복사 없이 원래 경로를 반환
+    fetched = storage.fetch_original(job_id, tmp_path / "work")
+    assert fetched is not None
+    assert fetched.read_bytes() == b"%PDF-original"
+    assert storage.fetch_original("missing", tmp_path / "work") is None
+
+    src = tmp_path / "out.pdf"
+    src.write_bytes(b"0123456789")
+    storage.save_translated_file(job_id, src)
+
+    stored = storage.stat_translated(job_id)
+    assert stored is not None
+    assert stored.size == 10
+    assert storage.stat_translated("missing") is None
+
+    assert b"".join(storage.iter_translated(job_id)) == b"0123456789"
+    assert b"".join(storage.iter_translated(job_id, start=2, end=5, chunk_size=3)) == b"2345"
+    assert b"".join(storage.iter_translated(job_id, start=7)) == b"789"
+
+    # 로컬 스토리지는 presigned URL을 제공하지 않는다
+    assert storage.get_translated_url(job_id, filename="x.pdf") is None
+
+
+def test_local_storage_sharded_layout_and_legacy_migration(tmp_path: Path) -> None:
+    storage = LocalStorage(base_dir=tmp_path, fsync=False)
+
+    saved = Path(storage.save_original("job-new", b"new"))
+    # {base}/original/{aa}/{bb}/{job_id}.pdf
+    assert saved.relative_to(tmp_path).parts[0] == "original"
+    assert len(saved.relative_to(tmp_path).parts) == 4
+    # 임시 파일이 남지 않아야 함
+    assert [p.name for p in saved.parent.iterdir()] == ["job-new.pdf"]
+
+    # 이전 버전의 평면 구조 파일
+    (tmp_path / "original").mkdir(exist_ok=True)
+    (tmp_path / "translated").mkdir(exist_ok=True)
+    (tmp_path / "original" / "job-old.pdf").write_bytes(b"old-original")
+    (tmp_path / "translated" / "job-old.pdf").write_bytes(b"old-translated")
+    (tmp_path / "original" / "job-bulk.pdf").write_bytes(b"bulk")
+
+    # 조회 시 투명하게 샤딩 경로로 이동
+    fetched = storage.fetch_original("job-old", tmp_path)
+    assert fetched is not None
+    assert fetched.read_bytes() == b"old-original"
+    assert not (tmp_path / "original" / "job-old.pdf").exists()
+
+    stored = storage.stat_translated("job-old")
+    assert stored is not None and stored.size == len(b"old-translated")
+    assert stored.etag == hashlib.sha256(b"old-translated").hexdigest()
+    assert not (tmp_path / "translated" / "job-old.pdf").exists()
+    # 조회 경로에서는 해시 파일을 쓰지 않는다
+    sharded = Path(storage.get_translated_path("job-old"))
+    digest_file = sharded.with_name(sharded.name + ".sha256")
+    assert not digest_file.exists()
+
+    # 일괄 마이그레이션: 실제로 옮긴 파일만 세고, 빠진 해시 파일을 만든다
+    assert storage.migrate_layout() == 1
+    assert not (tmp_path / "original" / "job-bulk.pdf").exists()
+    bulk = storage.fetch_original("job-bulk", tmp_path)
+    assert bulk is not None and bulk.read_bytes() == b"bulk"
+    assert digest_file.read_text() == stored.etag
+    assert storage.migrate_layout() == 0
+
+
+def test_local_storage_migration_skips_files_moved_concurrently(tmp_path: Path, monkeypatch) -> None:
+    storage = LocalStorage(base_dir=tmp_path, fsync=False)
+    (tmp_path / "original").mkdir()
+    (tmp_path / "original" / "job-race.pdf").write_bytes(b"race")
+
+    real_replace = os.replace
+
+    def replace_after_other_process(src, dst):
+        # 다른 프로세스가 먼저 옮긴 상황을 흉내 낸다
+        if Path(src).name == "job-race.pdf":
+            real_replace(src, dst)
+            raise FileNotFoundError(src)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace_after_other_process)
+    assert storage.migrate_layout() == 0
+    assert Path(storage.get_original_path("job-race")).read_bytes() == b"race"
+
+
+@pytest.mark.parametrize("compression", ["deflate", "zstd"])
+def test_local_storage_archive_original_compression(tmp_path: Path, compression: str) -> None:
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    storage = LocalStorage(base_dir=tmp_path / "data", compression=compression, fsync=False)
+    data = b"%PDF-1.4 " + b"repetitive content " * 1000
+    plain = Path(storage.save_original("job-z", data))
+
+    storage.archive_original("job-z")
+    assert not plain.exists()
+    archived = list(plain.parent.iterdir())
+    assert len(archived) == 1
+    assert archived[0].stat().st_size < len(data)
+
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    fetched = storage.fetch_original("job-z", workdir)
+    assert fetched is not None
+    assert fetched.read_bytes() == data
+
+    storage.delete_original("job-z")
+    assert storage.fetch_original("job-z", workdir) is None
+    assert list(plain.parent.iterdir()) == []
+
+
+def test_local_storage_artifacts(tmp_path: Path) -> None:
+    storage = LocalStorage(base_dir=tmp_path, fsync=False)
+
+    assert storage.load_artifact("job-1", "paragraphs.jsonl.gz") is None
+
+    storage.save_artifact("job-1", "paragraphs.jsonl.gz", b"stream")
+    storage.save_artifact("job-1", "render-html-v1.html", b"<p>")
+    assert storage.load_artifact("job-1", "paragraphs.jsonl.gz") == b"stream"
+
+    with pytest.raises(ValueError):
+        storage.save_artifact("job-1", "../escape", b"x")
+
+    storage.delete_artifacts("job-1")
+    assert storage.load_artifact("job-1", "paragraphs.jsonl.gz") is None
+    assert storage.load_artifact("job-1", "render-html-v1.html") is None
+    storage.delete_artifacts("job-1")  # 없어도 예외 없음
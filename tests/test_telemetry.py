@@ -0,0 +1,169 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.infra import telemetry
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient
+from tests.synthetic_pdf import generate_paper
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+
+@pytest.fixture
+def registry():
+    registry = prometheus_client.CollectorRegistry()
+    telemetry.configure(metrics=True, tracing=False, registry=registry)
+    yield registry
+    telemetry.configure(metrics=False, tracing=False)
+
+
+def test_disabled_telemetry_is_noop() -> None:
+    telemetry.configure(metrics=False, tracing=False)
+
+    # 비활성화 시에는 매번 같은 no-op 컨텍스트를 반환
+    assert telemetry.timed("x", stage="parse") is telemetry.timed("y")
+    telemetry.observe_llm_request("m", "ok", 1.0)
+    telemetry.count_job("COMPLETED")
+
+
+def test_pipeline_stage_and_llm_metrics(registry, tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=2)
+    service = TranslationService(llm=FakeLLMClient())
+    service.translate_pdf(paper, tmp_path / "out.pdf")
+
+    for stage in ("parse", "chunk", "translate", "render"):
+        assert registry.get_sample_value("paper_pipeline_stage_seconds_count", {"stage": stage}) == 1
+
+    class Usage:
+        prompt_tokens = 100
+        completion_tokens = 40
+
+    telemetry.observe_llm_request("gpt-test", "ok", 0.5, Usage())
+    assert registry.get_sample_value(
+        "paper_llm_request_seconds_count", {"model": "gpt-test", "outcome": "ok"}
+    ) == 1
+    assert registry.get_sample_value("paper_llm_tokens_total", {"model": "gpt-test", "kind": "prompt"}) == 100
+
+
+def test_traced_query_records_db_time(registry) -> None:
+    class Repo:
+        @telemetry.traced_query("get_job")
+        def get_job(self, job_id: str) -> dict:
+            return {"jobId": job_id}
+
+    assert Repo().get_job("a") == {"jobId": "a"}
+    assert registry.get_sample_value("paper_db_query_seconds_count", {"operation": "get_job"}) == 1
+
+    body, content_type = telemetry.render_latest()
+    assert b"paper_db_query_seconds" in body
+    assert content_type.startswith("text/plain")
+
+
+def test_spans_carry_job_id(monkeypatch) -> None:
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    telemetry.configure(metrics=False, tracing=True)
+    monkeypatch.setattr(telemetry, "_tracer", provider.get_tracer("test"))
+    try:
+        with telemetry.job_context("job-42"):
+            with telemetry.timed("pdf.extract_pages", stage="parse"):
+                pass
+    finally:
+        telemetry.configure(metrics=False, tracing=False)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "pdf.extract_pages"
+    assert span.attributes["job_id"] == "job-42"
+    assert span.attributes["stage"] == "parse"
+
+
+def test_configure_twice_on_default_registry() -> None:
+    # Celery prefork: 부모(worker_init)와 자식 모두 configure 를 호출해도 메트릭이 유지되어야 한다.
+    try:
+        telemetry.configure(metrics=True, tracing=False)
+        first = telemetry._metrics["queue_wait"]
+        telemetry.configure(metrics=True, tracing=False)
+        assert telemetry._metrics["queue_wait"] is first
+
+        telemetry.observe_queue_wait(1.0)
+        telemetry.count_job("COMPLETED")
+        assert prometheus_client.REGISTRY.get_sample_value(
+            "paper_jobs_total", {"status": "COMPLETED"}
+        ) >= 1
+    finally:
+        telemetry.configure(metrics=False, tracing=False)
+
+
+def test_worker_process_init_keeps_inherited_metrics(registry) -> None:
+    from app.infra import jobs
+
+    jobs._configure_worker_telemetry()
+    assert telemetry.metrics_enabled()
+    telemetry.observe_queue_wait(1.0)
+    telemetry.count_job("FAILED")
+
+
+_FORKED_CHILD_SCRIPT = """
+import os
+
+from app.infra import jobs, telemetry
+
+telemetry.prepare_multiprocess_dir(clear=True)
+telemetry.configure(metrics=True, tracing=False)
+
+pid = os.fork()
+if pid == 0:
+    jobs._configure_worker_telemetry()
+    telemetry.count_job("COMPLETED")
+    telemetry.observe_llm_request("cheap", "ok", 0.5)
+    os._exit(0)
+os.waitpid(pid, 0)
+
+body, _content_type = telemetry.render_latest()
+print(body.decode())
+"""
+
+
+def test_worker_metrics_include_forked_children(tmp_path: Path) -> None:
+    # Celery prefork: 자식 프로세스가 기록한 값이 부모의 /metrics 에 합산되어야 한다.
+    # prometheus_client 는 임포트 시점에 멀티 프로세스 모드를 정하므로 새 인터프리터에서 확인한다.
+    multiproc_dir = tmp_path / "prometheus"
+    multiproc_dir.mkdir()
+    # 이전 기동에서 남은(깨진) 값 파일은 워커 시작 시 지워진다.
+    (multiproc_dir / "counter_0.db").write_bytes(b"stale")
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir)}
+
+    result = subprocess.run(
+        [sys.executable, "-c", _FORKED_CHILD_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert 'paper_jobs_total{status="COMPLETED"} 1.0' in result.stdout
+    assert 'paper_llm_request_seconds_count{model="cheap",outcome="ok"} 1.0' in result.stdout
+
+
+def test_missing_otlp_exporter_is_logged(monkeypatch, caplog) -> None:
+    # 설치되지 않은 exporter 는 조용히 넘어가지 않고 경고를 남긴다.
+    monkeypatch.setitem(sys.modules, "opentelemetry.exporter.otlp.proto.http.trace_exporter", None)
+    monkeypatch.setattr(telemetry, "_tracer_provider_configured", False)
+
+    with caplog.at_level("WARNING", logger=telemetry.__name__):
+        telemetry._configure_tracer_provider()
+
+    assert "OTLP exporter is unavailable" in caplog.text
+    assert not telemetry._tracer_provider_configured
@@ -0,0 +1,153 @@
+from pathlib import Path
+
+import psycopg2
+
+from app.config import settings
+from app.infra.translation_memory import (
+    Glossary,
+    InMemoryTranslationMemory,
+    MinHasher,
+    PostgresTranslationMemory,
+)
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient
+from tests.synthetic_pdf import generate_paper
+
+
+ABSTRACT = (
+    "In this paper we propose a novel method for neural machine translation "
+    "that improves accuracy on standard benchmarks."
+)
+
+
+def test_exact_and_fuzzy_lookup() -> None:
+    memory = InMemoryTranslationMemory(fuzzy_threshold=0.8, min_chars=20)
+    assert memory.add_many([(ABSTRACT, "번역된 초록"), ("short", "짧음")]) == 1
+
+    near = ABSTRACT.replace("standard benchmarks.", "standard  benchmarks!")
+    unrelated = "Completely different sentence about graph databases and query planning."
+
+    exact, fuzzy, miss, short = memory.lookup_many(["  " + ABSTRACT + "\n", near, unrelated, "short"])
+
+    assert exact is not None and exact.score == 1.0 and exact.target == "번역된 초록"
+    assert fuzzy is not None and 0.8 <= fuzzy.score < 1.0
+    assert miss is None
+    assert short is None
+
+
+def test_glossary_prefers_longest_term() -> None:
+    glossary = Glossary({"network": "네트워크", "neural network": "신경망", "GPU": "GPU"})
+
+    found = glossary.find("A Neural Network runs on a gpu; the network is deep. GPUs are fast.")
+
+    assert found == {"neural network": "신경망", "GPU": "GPU", "network": "네트워크"}
+    assert Glossary({}).find("anything") == {}
+
+
+def test_service_reuses_memory_and_passes_glossary(tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=2, paragraphs_per_page=3, words_per_paragraph=40)
+    memory = InMemoryTranslationMemory()
+    llm = FakeLLMClient()
+    service = TranslationService(
+        llm=llm,
+        memory=memory,
+        glossary=Glossary({"synthetic paper": "합성 논문"}),
+    )
+
+    service.translate_pdf(paper, tmp_path / "first.pdf")
+    first_calls = len(llm.calls)
+    assert first_calls > 0
+    assert len(memory) > 0
+    assert {"synthetic paper": "합성 논문"} in llm.glossaries
+
+    # 같은 논문을 다시 번역하면 짧은(메모리 대상이 아닌) 문단만 LLM 에 보낸다.
+    service.translate_pdf(paper, tmp_path / "second.pdf")
+    resent = [p for chunk in llm.calls[first_calls:] for p in chunk.split("\n\n")]
+    assert all(not memory.eligible(p) for p in resent)
+
+
+def test_postgres_memory_roundtrip() -> None:
+    memory = PostgresTranslationMemory(settings.db_url, ttl_days=1, fuzzy_threshold=0.6, min_chars=20)
+    memory.migrate()
+    conn = psycopg2.connect(settings.db_url)
+    try:
+        with conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM translation_memory")
+                cur.execute("DELETE FROM glossary")
+    finally:
+        conn.close()
+
+    assert memory.add_many([(ABSTRACT, "번역된 초록")]) == 1
+    # 같은 원문을 다시 저장해도 충돌 없이 무시한다.
+    memory.add_many([(ABSTRACT, "다른 번역")])
+
+    exact, fuzzy = memory.lookup_many([ABSTRACT, ABSTRACT.replace("novel", "new")])
+    assert exact is not None and exact.target == "번역된 초록"
+    assert fuzzy is not None and fuzzy.target == "번역된 초록"
+
+    memory.upsert_glossary({"transformer": "트랜스포머"})
+    assert memory.load_glossary().find("The Transformer model") == {"transformer": "트랜스포머"}
+    memory.upsert_glossary({"transformer": "トランスフォーマー"}, lang_pair="en-ja")
+    glossaries = memory.load_glossaries()
+    assert set(glossaries) == {"en-ko", "en-ja"}
+    assert glossaries["en-ja"].find("transformer") == {"transformer": "トランスフォーマー"}
+
+    assert memory.delete_expired(now=2**40) == 1
+    assert memory.lookup_many([ABSTRACT]) == [None]
+
+
+def test_postgres_candidates_prefer_more_shared_bands() -> None:
+    memory = PostgresTranslationMemory(settings.db_url, fuzzy_threshold=0.8, min_chars=20)
+    memory.migrate()
+    conn = psycopg2.connect(settings.db_url)
+    try:
+        with conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM translation_memory")
+    finally:
+        conn.close()
+
+    hasher = MinHasher()
+    near = ABSTRACT.replace("standard benchmarks.", "standard benchmarks!")
+    near_bands = hasher.band_keys(hasher.shingles(near))
+    # 밴드 키 하나만 공유하는 흔한 문구가 후보 상한(밴드 키당 8개)보다 먼저 저장되어 있어도
+    memory._insert(
+        "en-ko",
+        [
+            (f"noise-{i}", f"Noise paragraph number {i} about something else.", "잡음", [near_bands[0], i, -i - 1])
+            for i in range(1, 8 * len(near_bands) + 1)
+        ],
+    )
+    memory.add_many([(ABSTRACT, "번역된 초록")])
+
+    # 밴드 키를 더 많이 공유하는 진짜 유사 문단이 잘리지 않는다.
+    (fuzzy,) = memory.lookup_many([near])
+    assert fuzzy is not None and fuzzy.target == "번역된 초록"
+
+
+class _TextParser:
+    def __init__(self, pages: list[str]) -> None:
+        self._pages = pages
+
+    def extract_pages(self, _path, **_kwargs) -> list[str]:
+        return self._pages
+
+
+def test_fuzzy_match_is_reference_not_substitute(tmp_path: Path) -> None:
+    stored = "We train the model for 10 epochs with a batch size of 64 on the full training corpus."
+    query = stored.replace("10 epochs", "50 epochs")
+
+    memory = InMemoryTranslationMemory(fuzzy_threshold=0.5, min_chars=20)
+    memory.add_many([(stored, "전체 학습 말뭉치에서 배치 크기 64로 10 에폭 동안 학습한다.")])
+    (match,) = memory.lookup_many([query])
+    assert match is not None and not match.exact
+
+    llm = FakeLLMClient()
+    service = TranslationService(parser=_TextParser([query]), llm=llm, memory=memory)
+    pairs = service.translate_pdf(tmp_path / "in.pdf", tmp_path / "out.pdf")
+
+    # 유사 일치의 번역("10 에폭")을 그대로 쓰지 않고 LLM 으로 번역하되, 참고 번역으로 넘긴다.
+    assert llm.calls == [query]
+    assert llm.references == [[(stored, match.target)]]
+    assert pairs == [(query, query.upper())]
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import fitz
+
+from app.services.translation_service import TranslationService
+from tests.fakes import FakeLLMClient
+from tests.synthetic_pdf import generate_paper
+
+
+def test_translate_pdf_with_fake_llm_records_stage_timings(tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=3, paragraphs_per_page=4, words_per_paragraph=60)
+    output = tmp_path / "out.pdf"
+
+    llm = FakeLLMClient()
+    service = TranslationService(max_chars_per_chunk=1000, llm=llm)
+
+    timings: dict[str, float] = {}
+    pairs = service.translate_pdf(paper, output, timings=timings)
+
+    assert set(timings) == {"parse", "chunk", "translate", "render"}
+    assert len(llm.calls) > 1
+    assert all(len(chunk) <= 1000 or "\n\n" not in chunk for chunk in llm.calls)
+
+    doc = fitz.open(output)
+    try:
+        text = "".join(page.get_text() for page in doc)
+    finally:
+        doc.close()
+    assert "SYNTHETIC PAPER 0" in text
+
+    # 원문 문단마다 (원문, 번역) 쌍이 하나씩 남는다.
+    assert pairs
+    assert all(src and tgt for src, tgt in pairs)
+
+
+def test_get_page_count(tmp_path: Path) -> None:
+    paper = generate_paper(tmp_path / "paper.pdf", pages=4)
+    service = TranslationService(llm=FakeLLMClient())
+    assert service.get_page_count(paper) == 4
@@ -11,6 +11,9 @@ class DummyStorage:
     def delete_translated(self, job_id: str) -> None:
         self.deleted.append(("translated", job_id))
 
+    def delete_artifacts(self, job_id: str) -> None:
+        self.deleted.append(("artifacts", job_id))
+
 
 class DummyJobRepo:
     def __init__(self, items: list[dict]) -> None:
@@ -44,3 +47,4 @@ def test_cleanup_expired_jobs_impl(monkeypatch) -> None:
 
     deleted_ids = {job_id for (_kind, job_id) in dummy_storage.deleted}
     assert deleted_ids == {"job-a", "job-b"}
+    assert ("artifacts", "job-a") in dummy_storage.deleted